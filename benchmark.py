@@ -0,0 +1,198 @@
+"""
+Benchmark isoline: waktu solve, pembuatan grafik (backend Agg), dan batch besar
+
+Jalankan:
+    python benchmark.py                    # ukuran default
+    python benchmark.py --n 2000 --seed 7  # jumlah masalah acak per kasus
+    python benchmark.py --json hasil.json  # simpan hasil untuk dibandingkan antar rilis
+
+Setiap baris laporan berisi throughput (masalah/detik), persentil latensi per panggilan
+(p50/p95/p99), dan puncak memori (tracemalloc, diukur pada putaran terpisah agar tidak
+memengaruhi waktu).
+"""
+
+import argparse
+import json
+import platform
+import time
+import tracemalloc
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy as np
+
+import isoline
+
+CASES = ('feasible', 'infeasible', 'unbounded', 'degenerate')
+
+
+def random_shape(rng, kind, case='feasible'):
+    """
+    Masalah acak berbentuk tetap untuk maximize/minimize/optimize (kind 'max', 'min', 'mixed')
+
+    case 'feasible' selalu memiliki solusi, 'infeasible' tidak memiliki titik feasible di
+    dalam kotak plot, dan 'degenerate' berisi dua batasan yang berimpit. Mengembalikan dict
+    argumen.
+    """
+    a1, b1, a2, b2 = rng.uniform(1, 10, 4).round(1).tolist()
+    c1, c2 = rng.uniform(50, 500, 2).round().tolist()
+    g, h = rng.uniform(1, 100, 2).round().tolist()
+    if kind == 'mixed' and case != 'degenerate':
+        # ≥ di dalam ≤ (feasible) atau jauh di luarnya (tidak ada titik yang memenuhi keduanya)
+        c2 = round(c1*(0.5*min(a2/a1, b2/b1) if case == 'feasible' else 10*max(a2/a1, b2/b1)))
+    if case == 'degenerate':
+        k = round(rng.uniform(0.5, 2.0), 1)
+        a2, b2, c2 = k*a1, k*b1, k*c1
+    elif case == 'infeasible' and kind == 'max':
+        c1 = -c1
+    x_max = float(np.ceil(1.2*max(abs(c1)/a1, abs(c2)/a2)))
+    y_max = float(np.ceil(1.2*max(abs(c1)/b1, abs(c2)/b2)))
+    if case == 'infeasible' and kind == 'min':
+        # Kotak plot terlalu kecil untuk mencapai batasan ≥
+        x_max = y_max = float(np.floor(0.5*min(c1/a1, c1/b1, c2/a2, c2/b2)))
+    if kind == 'max':
+        return dict(a1=a1, b1=b1, c1=c1, a2=a2, b2=b2, c2=c2, g=g, h=h, x_max=x_max, y_max=y_max)
+    return dict(a=a1, b=b1, c=c1, d=a2, e=b2, f=c2, g=g, h=h, x_max=x_max, y_max=y_max)
+
+
+def random_constraints(rng, case='feasible', m=6):
+    """
+    Masalah acak untuk solve_2d(): mengembalikan (constraints, g, h, sense)
+
+    'feasible' : m batasan ≤ (daerah terbatas) ditambah beberapa ≥ yang longgar
+    'infeasible': batasan ≥ di luar jangkauan batasan ≤
+    'unbounded' : hanya batasan ≥ dengan tujuan maksimum
+    'degenerate': beberapa batasan melewati satu titik sudut yang sama
+    """
+    A = rng.uniform(0.5, 10, (m, 2)).round(1)
+    if case == 'unbounded':
+        c = rng.uniform(10, 100, m).round()
+        return [(a, b, '>=', ci) for (a, b), ci in zip(A.tolist(), c.tolist())], 3.0, 2.0, 'max'
+    c = rng.uniform(100, 500, m).round()
+    constraints = [(a, b, '<=', ci) for (a, b), ci in zip(A.tolist(), c.tolist())]
+    if case == 'infeasible':
+        a, b = A[0]
+        constraints.append((a, b, '>=', 2*c.max()*max(a, b)))
+    elif case == 'degenerate':
+        # Semua garis melewati (p, q)
+        p, q = rng.uniform(5, 20, 2).round().tolist()
+        constraints = [(a, b, '<=', a*p + b*q) for a, b in A.tolist()]
+    else:
+        constraints += [(1.0, 1.0, '>=', 1.0), (1.0, 0.0, '>=', 0.5)]
+    g, h = rng.uniform(1, 100, 2).round().tolist()
+    return constraints, g, h, str(rng.choice(['max', 'min']))
+
+
+def _report(name, times, count, peak):
+    # times: detik per pengulangan; count: jumlah masalah per pengulangan
+    times = np.asarray(times)
+    p50, p95, p99 = np.percentile(times, [50, 95, 99])
+    return {'name': name, 'calls': int(len(times)), 'problems_per_call': int(count),
+            'throughput': float(count*len(times)/times.sum()),
+            'p50_ms': float(p50*1e3), 'p95_ms': float(p95*1e3), 'p99_ms': float(p99*1e3),
+            'peak_kib': float(peak/1024)}
+
+
+def _measure(name, calls, count=1):
+    # Jalankan semua panggilan untuk waktu, lalu ulangi sebagian dengan tracemalloc untuk memori
+    times = []
+    for call in calls:
+        start = time.perf_counter()
+        call()
+        times.append(time.perf_counter() - start)
+    tracemalloc.start()
+    for call in calls[:max(1, len(calls)//10)]:
+        call()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return _report(name, times, count, peak)
+
+
+def bench_solve(rng, n):
+    solvers = {'max': isoline.solve_max, 'min': isoline.solve_min, 'mixed': isoline.solve_mixed}
+    results = []
+    for kind, solver in solvers.items():
+        for case in ('feasible', 'infeasible', 'degenerate'):
+            params = [random_shape(rng, kind, case) for _ in range(n)]
+            calls = [lambda p=p: solver(**p) for p in params]
+            results.append(_measure(f'solve_{kind}[{case}]', calls))
+    for case in CASES:
+        problems = [random_constraints(rng, case) for _ in range(n)]
+        calls = [lambda p=p: isoline.solve_2d(*p) for p in problems]
+        results.append(_measure(f'solve_2d[{case}]', calls))
+    return results
+
+
+def bench_render(rng, n):
+    plotters = {'max': isoline.maximize, 'min': isoline.minimize, 'mixed': isoline.optimize}
+    results = []
+
+    def render(plotter, params):
+        plotter(**params, show=False, verbose=False)
+        fig = plt.gcf()
+        fig.canvas.draw()
+        plt.close(fig)
+
+    for kind, plotter in plotters.items():
+        params = [random_shape(rng, kind) for _ in range(n)]
+        calls = [lambda p=p: render(plotter, p) for p in params]
+        results.append(_measure(f'render_{kind}', calls))
+    return results
+
+
+def bench_batch(rng, sizes, repeat):
+    results = []
+    for size in sizes:
+        for kind in ('max', 'min', 'mixed'):
+            cols = {k: np.array([random_shape(rng, kind)[k] for _ in range(1000)])
+                    for k in random_shape(rng, kind)}
+            # Perbanyak 1000 masalah acak sampai ukuran batch
+            cols = {k: np.resize(v, size) for k, v in cols.items()}
+            if kind == 'max':
+                args = [cols[k] for k in ('a1', 'b1', 'c1', 'a2', 'b2', 'c2', 'g', 'h', 'x_max', 'y_max')]
+            else:
+                args = [cols[k] for k in ('a', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'x_max', 'y_max')]
+            out = np.empty(size, dtype=isoline.RESULT_DTYPE)
+            calls = [lambda: isoline.solve_batch(*args, kind=kind, out=out)]*repeat
+            results.append(_measure(f'solve_batch_{kind}[{size}]', calls, size))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--n', type=int, default=500, help='jumlah masalah acak per kasus solve')
+    parser.add_argument('--render', type=int, default=20, help='jumlah grafik per fungsi plot')
+    parser.add_argument('--batch', type=int, nargs='*', default=[100_000, 1_000_000],
+                        help='ukuran batch untuk solve_batch')
+    parser.add_argument('--repeat', type=int, default=5, help='pengulangan per ukuran batch')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--only', choices=['solve', 'render', 'batch'], nargs='*')
+    parser.add_argument('--json', help='simpan hasil ke berkas JSON')
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(args.seed)
+    only = set(args.only or ['solve', 'render', 'batch'])
+    results = []
+    if 'solve' in only:
+        results += bench_solve(rng, args.n)
+    if 'render' in only:
+        results += bench_render(rng, args.render)
+    if 'batch' in only:
+        results += bench_batch(rng, args.batch, args.repeat)
+
+    print(f"{'Benchmark':<32} {'masalah/dtk':>14} {'p50 ms':>10} {'p95 ms':>10} {'p99 ms':>10} {'puncak KiB':>11}")
+    print("-"*91)
+    for r in results:
+        print(f"{r['name']:<32} {r['throughput']:>14,.0f} {r['p50_ms']:>10.3f} {r['p95_ms']:>10.3f} "
+              f"{r['p99_ms']:>10.3f} {r['peak_kib']:>11,.1f}")
+
+    if args.json:
+        meta = {'seed': args.seed, 'python': platform.python_version(), 'numpy': np.__version__,
+                'matplotlib': matplotlib.__version__, 'machine': platform.machine()}
+        with open(args.json, 'w') as fh:
+            json.dump({'meta': meta, 'results': results}, fh, indent=2)
+
+
+if __name__ == '__main__':
+    main()
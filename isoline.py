@@ -1,8 +1,2891 @@
+import json
+import os
+import re
+import sys
+import time
+import tracemalloc
+from array import array
+from collections import OrderedDict
+from contextlib import contextmanager
+
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.colors import LinearSegmentedColormap
 
-def maximize(a1, b1, c1, a2, b2, c2, g, h, x_max, y_max):
+__all__ = [
+    'LPResult', 'solve_max', 'solve_min', 'solve_mixed', 'SolveCache',
+    'STATUS_OPTIMAL', 'STATUS_INFEASIBLE', 'STATUS_UNBOUNDED', 'STATUS_NAMES', 'RESULT_DTYPE',
+    'solve_batch', 'solve_columns', 'BatchPool', 'scenario_analysis', 'presolve', 'solve_2d',
+    'solve_integer', 'ranging', 'sweep_objective', 'FeasibleRegion', 'LPSolution', 'solve_lp',
+    'LPModel', 'read_mps', 'read_lp', 'read_model', 'PhaseStats',
+    'FigurePool', 'maximize', 'minimize', 'optimize', 'Problem', 'Explorer', 'cpu_count',
+    'init_render_worker', 'render_figure', 'export_figures', 'solve_records',
+]
+
+# matplotlib baru diimpor saat pertama kali menggambar, lihat _load_matplotlib()
+plt = LineCollection = LinearSegmentedColormap = Polygon = Bbox = Slider = None
+
+
+class LPResult:
+    """
+    Hasil penyelesaian program linear 2 variabel tanpa visualisasi
+
+    Atribut:
+        status   : 'optimal' jika ada titik sudut feasible, 'infeasible' jika tidak
+        sense    : 'max' atau 'min', arah optimasi untuk titik optimal
+        vertices : Daftar titik sudut feasible [(x, y), ...]
+        z_values : Nilai Z di setiap titik sudut
+        labels   : Keterangan asal setiap titik sudut
+        index    : Indeks titik optimal di dalam vertices (None jika infeasible)
+        min_index: Indeks titik minimum (hanya diisi oleh solve_mixed)
+    """
+    __slots__ = ('status', 'sense', 'vertices', 'z_values', 'labels', 'index', 'min_index')
+
+    def __init__(self, status, sense, vertices=(), z_values=(), labels=(), index=None, min_index=None):
+        self.status = status
+        self.sense = sense
+        self.vertices = list(vertices)
+        self.z_values = list(z_values)
+        self.labels = list(labels)
+        self.index = index
+        self.min_index = min_index
+
+    @property
+    def x(self):
+        return self.vertices[self.index][0] if self.index is not None else None
+
+    @property
+    def y(self):
+        return self.vertices[self.index][1] if self.index is not None else None
+
+    @property
+    def z(self):
+        return self.z_values[self.index] if self.index is not None else None
+
+    def __repr__(self):
+        return f"LPResult(status={self.status!r}, sense={self.sense!r}, x={self.x!r}, y={self.y!r}, z={self.z!r})"
+
+
+def _intersect(a1, b1, c1, a2, b2, c2):
+    # Perpotongan dua garis dengan aturan Cramer (None jika sejajar)
+    det = a1*b2 - a2*b1
+    if det == 0:
+        return None
+    return (c1*b2 - c2*b1)/det, (a1*c2 - a2*c1)/det
+
+
+def _axis_ratio(c, a):
+    # Titik potong c/a pada sumbu; tak hingga bertanda c jika a = 0 (garis sejajar sumbu)
+    if a == 0:
+        return np.inf if c >= 0 else -np.inf
+    return c/a
+
+
+def _finish(sense, corner_points, labels, g, h, with_min=False):
+    # Hitung Z di semua titik sudut dan pilih titik optimal
+    if len(corner_points) == 0:
+        return LPResult('infeasible', sense)
+    Z_values = [g*x + h*y for (x, y) in corner_points]
+    index = Z_values.index(max(Z_values) if sense == 'max' else min(Z_values))
+    min_index = Z_values.index(min(Z_values)) if with_min else None
+    return LPResult('optimal', sense, corner_points, Z_values, labels, index, min_index)
+
+
+def solve_max(a1, b1, c1, a2, b2, c2, g, h, x_max, y_max, cache=None):
+    """
+    Selesaikan program linear dengan 2 batasan (semua ≤) tanpa plot dan tanpa output
+
+    Parameter sama dengan maximize(); cache (SolveCache, opsional) dipakai untuk
+    mengambil hasil masalah yang bentuknya sudah pernah diselesaikan. Mengembalikan LPResult.
+    """
+    if cache is not None:
+        return cache.solve('max', a1, b1, c1, a2, b2, c2, g, h, x_max, y_max)
+    corner_points = []
+    labels = []
+
+    # 1. Perpotongan dengan sumbu x (y=0)
+    x_val = min(_axis_ratio(c1, a1), _axis_ratio(c2, a2), x_max)
+    if x_val >= 0 and x_val <= x_max:
+        corner_points.append((x_val, 0.0))
+        labels.append("Perpotongan sumbu-X")
+
+    # 2. Perpotongan dengan sumbu y (x=0)
+    y_val = min(_axis_ratio(c1, b1), _axis_ratio(c2, b2), y_max)
+    if y_val >= 0 and y_val <= y_max:
+        corner_points.append((0.0, y_val))
+        labels.append("Perpotongan sumbu-Y")
+
+    # 3. Perpotongan antara dua batasan
+    intersection = _intersect(a1, b1, c1, a2, b2, c2)
+    if intersection is not None:
+        x_intersect, y_intersect = intersection
+        if (0 <= x_intersect <= x_max and
+            0 <= y_intersect <= y_max):
+            corner_points.append((x_intersect, y_intersect))
+            labels.append("Perpotongan batasan")
+
+    return _finish('max', corner_points, labels, g, h)
+
+
+def solve_min(a, b, c, d, e, f, g, h, x_max, y_max, cache=None):
+    """
+    Selesaikan program linear dengan 2 batasan (semua ≥) tanpa plot dan tanpa output
+
+    Parameter sama dengan minimize(); cache (SolveCache, opsional) dipakai untuk
+    mengambil hasil masalah yang bentuknya sudah pernah diselesaikan. Mengembalikan LPResult.
+    """
+    if cache is not None:
+        return cache.solve('min', a, b, c, d, e, f, g, h, x_max, y_max)
+    corner_points = []
+    labels = []
+
+    # 1. Perpotongan batasan 1 dengan sumbu x (y=0)
+    if a != 0:
+        x_val = c / a
+        if x_val >= 0 and x_val <= x_max and (d*x_val) >= f:
+            corner_points.append((x_val, 0.0))
+            labels.append("Titik potong Batasan 1 dengan sumbu-X")
+
+    # 2. Perpotongan batasan 1 dengan sumbu y (x=0)
+    if b != 0:
+        y_val = c / b
+        if y_val >= 0 and y_val <= y_max and (e*y_val) >= f:
+            corner_points.append((0.0, y_val))
+            labels.append("Titik potong Batasan 1 dengan sumbu-Y")
+
+    # 3. Perpotongan batasan 2 dengan sumbu x (y=0)
+    if d != 0:
+        x_val = f / d
+        if x_val >= 0 and x_val <= x_max and (a*x_val) >= c:
+            corner_points.append((x_val, 0.0))
+            labels.append("Perpotongan Batasan 2 dengan sumbu-X")
+
+    # 4. Perpotongan batasan 2 dengan sumbu y (x=0)
+    if e != 0:
+        y_val = f / e
+        if y_val >= 0 and y_val <= y_max and (b*y_val) >= c:
+            corner_points.append((0.0, y_val))
+            labels.append("Perpotongan Batasan 2 dengan sumbu-Y")
+
+    # 5. Perpotongan antara dua batasan
+    intersection = _intersect(a, b, c, d, e, f)
+    if intersection is not None:
+        x_intersect, y_intersect = intersection
+        if (0 <= x_intersect <= x_max and
+            0 <= y_intersect <= y_max and
+            (a*x_intersect + b*y_intersect) >= c - 1e-6 and
+            (d*x_intersect + e*y_intersect) >= f - 1e-6):
+            corner_points.append((x_intersect, y_intersect))
+            labels.append("Perpotongan Kedua Batasan")
+
+    # Hapus titik duplikat
+    unique_points = []
+    unique_labels = []
+    seen = set()
+    for point, label in zip(corner_points, labels):
+        rounded_point = (round(point[0], 2), round(point[1], 2))
+        if rounded_point not in seen:
+            seen.add(rounded_point)
+            unique_points.append(point)
+            unique_labels.append(label)
+
+    return _finish('min', unique_points, unique_labels, g, h)
+
+
+def solve_mixed(a, b, c, d, e, f, g, h, x_max, y_max, cache=None):
+    """
+    Selesaikan program linear dengan batasan campuran (≤ dan ≥) tanpa plot dan tanpa output
+
+    Parameter sama dengan optimize(); cache (SolveCache, opsional) dipakai untuk
+    mengambil hasil masalah yang bentuknya sudah pernah diselesaikan. Mengembalikan LPResult
+    dengan titik maksimum pada index dan titik minimum pada min_index.
+    """
+    if cache is not None:
+        return cache.solve('mixed', a, b, c, d, e, f, g, h, x_max, y_max)
+    corner_points = []
+
+    # 1. Intersection with x-axis (y=0)
+    if a != 0:
+        x_val = c / a
+        if x_val >= 0 and x_val <= x_max and (d*x_val) >= f:  # Satisfies constraint 2
+            corner_points.append((x_val, 0.0))
+
+    # 2. Intersection with y-axis (x=0)
+    if b != 0:
+        y_val = c / b
+        if y_val >= 0 and y_val <= y_max and (e*y_val) >= f:  # Satisfies constraint 2
+            corner_points.append((0.0, y_val))
+
+    # 3. Intersection of constraint 2 with x-axis (y=0)
+    if d != 0:
+        x_val = f / d
+        if x_val >= 0 and x_val <= x_max and (a*x_val) <= c:  # Satisfies constraint 1
+            corner_points.append((x_val, 0.0))
+
+    # 4. Intersection of constraint 2 with y-axis (x=0)
+    if e != 0:
+        y_val = f / e
+        if y_val >= 0 and y_val <= y_max and (b*y_val) <= c:  # Satisfies constraint 1
+            corner_points.append((0.0, y_val))
+
+    # 5. Intersection between two constraints
+    intersection = _intersect(a, b, c, d, e, f)
+    if intersection is not None:
+        x_intersect, y_intersect = intersection
+        if (0 <= x_intersect <= x_max and
+            0 <= y_intersect <= y_max and
+            (a*x_intersect + b*y_intersect) <= c + 1e-6 and  # Tolerance for floating point
+            (d*x_intersect + e*y_intersect) >= f - 1e-6):
+            corner_points.append((x_intersect, y_intersect))
+
+    # Remove duplicate points and sort
+    corner_points = list(set([(round(x, 2), round(y, 2)) for (x, y) in corner_points]))
+    corner_points.sort()
+
+    return _finish('max', corner_points, [], g, h, with_min=True)
+
+
+# Solver skalar untuk setiap bentuk masalah tetap
+_SHAPE_SOLVERS = {'max': solve_max, 'min': solve_min, 'mixed': solve_mixed}
+
+
+class SolveCache:
+    """
+    Cache LRU untuk solve_max, solve_min, dan solve_mixed dengan kunci bentuk ternormalisasi
+
+    Setiap batasan dibagi dengan koefisien absolut terbesarnya (skala positif tidak mengubah
+    bidang-setengah) dan fungsi tujuan dibagi dengan max(|g|, |h|), sehingga 2x + y ≤ 300 dan
+    4x + 2y ≤ 600 memakai entri yang sama. Koefisien ternormalisasi dibulatkan ke `digits`
+    desimal sebelum di-hash agar derau floating point tidak memecah kunci. Nilai Z disimpan
+    per satuan skala tujuan dan dikalikan kembali saat diambil.
+
+    Parameter:
+        maxsize : Jumlah entri maksimum sebelum entri paling lama tidak dipakai dibuang
+        digits  : Jumlah desimal untuk pembulatan kunci
+
+    Atribut hits dan misses mencatat jumlah hit dan miss.
+    """
+
+    def __init__(self, maxsize=1024, digits=9):
+        self.maxsize = maxsize
+        self.digits = digits
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def info(self):
+        total = self.hits + self.misses
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self._entries),
+                'maxsize': self.maxsize, 'hit_rate': self.hits/total if total else 0.0}
+
+    def clear(self):
+        self._entries.clear()
+        self.hits = self.misses = 0
+
+    def solve(self, kind, a1, b1, c1, a2, b2, c2, g, h, x_max, y_max):
+        return self._lookup(kind, (a1, b1, c1, a2, b2, c2, g, h, x_max, y_max), False)[0]
+
+    def solve_presolved(self, kind, a1, b1, c1, a2, b2, c2, g, h, x_max, y_max):
+        """
+        Seperti solve(), tetapi presolve() ikut dijalankan dan disimpan; hit tidak membayar presolve
+
+        Mengembalikan (LPResult, status presolve).
+        """
+        return self._lookup(kind, (a1, b1, c1, a2, b2, c2, g, h, x_max, y_max), True)
+
+    def _lookup(self, kind, args, presolved):
+        # Bentuk kanonik: baris batasan dan fungsi tujuan diskalakan positif
+        # Koefisien ternormalisasi dikuantisasi menjadi bilangan bulat (lebih cepat dari round(v, n))
+        a1, b1, c1, a2, b2, c2, g, h, x_max, y_max = args
+        q = 10**self.digits
+        s1 = q/(max(abs(a1), abs(b1), abs(c1)) or 1.0)
+        s2 = q/(max(abs(a2), abs(b2), abs(c2)) or 1.0)
+        scale = max(abs(g), abs(h)) or 1.0
+        key = (kind, presolved, round(a1*s1), round(b1*s1), round(c1*s1), round(a2*s2), round(b2*s2),
+               round(c2*s2), round(g*q/scale), round(h*q/scale), round(x_max*q), round(y_max*q))
+
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            if presolved:
+                res, status = _presolve_solve(kind, *args)
+            else:
+                res, status = _SHAPE_SOLVERS[kind](*args), None
+            res.z_values = [z/scale for z in res.z_values]
+            entry = self._entries[key] = (res, status)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        else:
+            self.hits += 1
+            self._entries.move_to_end(key)
+        res, status = entry
+        return LPResult(res.status, res.sense, res.vertices, [z*scale for z in res.z_values],
+                        res.labels, res.index, res.min_index), status
+
+
+# Kode status untuk hasil batch. solve_batch hanya menghasilkan STATUS_OPTIMAL dan
+# STATUS_INFEASIBLE; STATUS_UNBOUNDED melengkapi STATUS_NAMES agar sejajar dengan status
+# LPResult dan hitungan per shard BatchPool
+STATUS_OPTIMAL = 0
+STATUS_INFEASIBLE = 1
+STATUS_UNBOUNDED = 2
+STATUS_NAMES = ('optimal', 'infeasible', 'unbounded')
+
+# Tipe data hasil batch: titik optimal, nilai Z, status, dan indeks kandidat titik sudut
+RESULT_DTYPE = np.dtype([('x', 'f8'), ('y', 'f8'), ('z', 'f8'), ('status', 'i1'), ('vertex', 'i1')])
+
+
+def solve_batch(a1, b1, c1, a2, b2, c2, g, h, x_max, y_max, kind='max', out=None):
+    """
+    Selesaikan banyak program linear 2 batasan sekaligus dengan operasi array NumPy
+
+    Parameter:
+        a1 .. y_max : Array berbentuk (N,) (atau skalar) dengan urutan koefisien yang
+                      sama seperti solve_max(); untuk kind 'min' dan 'mixed' nilainya
+                      dibaca sebagai a, b, c, d, e, f
+        kind        : 'max' (semua ≤, maksimum), 'min' (semua ≥, minimum), atau
+                      'mixed' (≤ dan ≥, maksimum) sesuai solve_max/solve_min/solve_mixed
+        out         : Array RESULT_DTYPE berbentuk (N,) untuk menampung hasil (opsional;
+                      jika semua koefisien skalar, hasilnya diisikan ke seluruh out)
+
+    Mengembalikan array terstruktur RESULT_DTYPE dengan kolom x, y, z, status
+    (STATUS_OPTIMAL / STATUS_INFEASIBLE) dan vertex (indeks kandidat titik sudut
+    sesuai urutan di fungsi solve skalar, -1 jika infeasible).
+
+    Seperti solve_max/solve_min/solve_mixed, hanya titik sudut kandidat di dalam kotak
+    [0, x_max] x [0, y_max] yang dibandingkan, jadi STATUS_UNBOUNDED tidak pernah muncul:
+    masalah yang tak terbatas mendapat kandidat terbaik di dalam kotak. Gunakan presolve()
+    atau solve_2d() untuk mendeteksi ketakterbatasan.
+    """
+    cols = np.broadcast_arrays(*[np.asarray(v, dtype=np.float64) for v in
+                                 (a1, b1, c1, a2, b2, c2, g, h, x_max, y_max)])
+    a1, b1, c1, a2, b2, c2, g, h, x_max, y_max = [np.ravel(v) for v in cols]
+    n = a1.shape[0]
+
+    if kind not in ('max', 'min', 'mixed'):
+        raise ValueError(f"kind harus 'max', 'min', atau 'mixed', bukan {kind!r}")
+    if out is None:
+        out = np.empty(n, dtype=RESULT_DTYPE)
+    elif (not isinstance(out, np.ndarray) or out.dtype != RESULT_DTYPE or out.ndim != 1
+          or (n != 1 and out.shape[0] != n)):
+        raise ValueError(f"out harus array RESULT_DTYPE berbentuk ({n},)")
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # Perpotongan kedua batasan (aturan Cramer), NaN jika sejajar
+        det = a1*b2 - a2*b1
+        parallel = det == 0
+        det = np.where(parallel, np.nan, det)
+        x_int = (c1*b2 - c2*b1)/det
+        y_int = (a1*c2 - a2*c1)/det
+        in_box = (x_int >= 0) & (x_int <= x_max) & (y_int >= 0) & (y_int <= y_max)
+
+        if kind == 'max':
+            # Kandidat: perpotongan sumbu-X, sumbu-Y, dan perpotongan batasan
+            x_axis = np.fmin(np.fmin(c1/a1, c2/a2), x_max)
+            y_axis = np.fmin(np.fmin(c1/b1, c2/b2), y_max)
+            cand_x = np.stack([x_axis, np.zeros(n), x_int])
+            cand_y = np.stack([np.zeros(n), y_axis, y_int])
+            valid = np.stack([(x_axis >= 0) & (x_axis <= x_max),
+                              (y_axis >= 0) & (y_axis <= y_max),
+                              in_box])
+        else:
+            # Kandidat: titik potong batasan 1 dan 2 dengan sumbu-X dan sumbu-Y,
+            # lalu perpotongan kedua batasan
+            x1, y1, x2, y2 = c1/a1, c1/b1, c2/a2, c2/b2
+            zeros = np.zeros(n)
+            cand_x = np.stack([x1, zeros, x2, zeros, x_int])
+            cand_y = np.stack([zeros, y1, zeros, y2, y_int])
+            if kind == 'min':
+                checks = (a2*x1 >= c2, b2*y1 >= c2, a1*x2 >= c1, b1*y2 >= c1,
+                          (a1*x_int + b1*y_int >= c1 - 1e-6) & (a2*x_int + b2*y_int >= c2 - 1e-6))
+            else:
+                checks = (a2*x1 >= c2, b2*y1 >= c2, a1*x2 <= c1, b1*y2 <= c1,
+                          (a1*x_int + b1*y_int <= c1 + 1e-6) & (a2*x_int + b2*y_int >= c2 - 1e-6))
+            valid = np.stack([
+                (a1 != 0) & (x1 >= 0) & (x1 <= x_max) & checks[0],
+                (b1 != 0) & (y1 >= 0) & (y1 <= y_max) & checks[1],
+                (a2 != 0) & (x2 >= 0) & (x2 <= x_max) & checks[2],
+                (b2 != 0) & (y2 >= 0) & (y2 <= y_max) & checks[3],
+                ~parallel & in_box & checks[4],
+            ])
+
+    if kind == 'min':
+        # Sama seperti solve_min: titik duplikat (dibulatkan 2 desimal) hanya disimpan sekali
+        rx, ry = np.round(cand_x, 2), np.round(cand_y, 2)
+        for k in range(1, 5):
+            for j in range(k):
+                valid[k] &= ~(valid[j] & (rx[j] == rx[k]) & (ry[j] == ry[k]))
+    elif kind == 'mixed':
+        # Sama seperti solve_mixed: titik dibulatkan 2 desimal
+        cand_x = np.round(cand_x, 2)
+        cand_y = np.round(cand_y, 2)
+
+    # Nilai Z di setiap kandidat; kandidat tidak feasible tidak pernah terpilih
+    with np.errstate(invalid='ignore'):
+        Z = g*cand_x + h*cand_y
+    if kind == 'min':
+        best = np.argmin(np.where(valid, Z, np.inf), axis=0)
+    elif kind == 'max':
+        best = np.argmax(np.where(valid, Z, -np.inf), axis=0)
+    else:
+        # solve_mixed mengurutkan titik, jadi Z sama dimenangkan oleh (x, y) terkecil
+        Z_valid = np.where(valid, Z, -np.inf)
+        tie = Z_valid == Z_valid.max(axis=0)
+        tie &= cand_x == np.where(tie, cand_x, np.inf).min(axis=0)
+        tie &= cand_y == np.where(tie, cand_y, np.inf).min(axis=0)
+        best = np.argmax(tie, axis=0)
+
+    idx = np.arange(n)
+    feasible = valid.any(axis=0)
+    out['x'] = np.where(feasible, cand_x[best, idx], np.nan)
+    out['y'] = np.where(feasible, cand_y[best, idx], np.nan)
+    out['z'] = np.where(feasible, Z[best, idx], np.nan)
+    out['status'] = np.where(feasible, STATUS_OPTIMAL, STATUS_INFEASIBLE)
+    out['vertex'] = np.where(feasible, best, -1)
+    return out
+
+
+# Nama kolom koefisien untuk setiap kind (urutan argumen solve_max / solve_min / solve_mixed)
+_SHAPE_FIELDS = {
+    'max': ('a1', 'b1', 'c1', 'a2', 'b2', 'c2', 'g', 'h', 'x_max', 'y_max'),
+    'min': ('a', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'x_max', 'y_max'),
+}
+_SHAPE_FIELDS['mixed'] = _SHAPE_FIELDS['min']
+
+
+def _npz_member(path, info):
+    # Memmap satu anggota .npz yang tidak dikompresi langsung dari posisinya di dalam berkas zip
+    import struct
+    import zipfile
+
+    if info.compress_type != zipfile.ZIP_STORED:
+        raise ValueError(f"{info.filename} di {path} dikompresi dan tidak bisa di-memmap; "
+                         "simpan dengan np.savez, bukan np.savez_compressed")
+    with open(path, 'rb') as fh:
+        fh.seek(info.header_offset)
+        name_len, extra_len = struct.unpack('<HH', fh.read(30)[26:30])
+        fh.seek(info.header_offset + 30 + name_len + extra_len)
+        version = np.lib.format.read_magic(fh)
+        if version == (1, 0):
+            shape, fortran, dtype = np.lib.format.read_array_header_1_0(fh)
+        else:
+            shape, fortran, dtype = np.lib.format.read_array_header_2_0(fh)
+        offset = fh.tell()
+    return np.memmap(path, dtype=dtype, mode='r', offset=offset, shape=shape,
+                     order='F' if fortran else 'C')
+
+
+def _column_blocks(source, names, block_size):
+    """
+    Buka kolom koefisien tanpa memuat semuanya ke memori
+
+    Mengembalikan (n, kolom_tersedia, blocks): blocks adalah generator yang menghasilkan
+    dict nama -> array untuk setiap blok baris berturut-turut.
+    """
+    if isinstance(source, (str, os.PathLike)) and os.fspath(source).endswith('.parquet'):
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("Membaca Parquet membutuhkan pyarrow (pip install pyarrow)") from None
+        parquet = pq.ParquetFile(source)
+        present = [name for name in names if name in parquet.schema_arrow.names]
+
+        def blocks():
+            for batch in parquet.iter_batches(batch_size=block_size, columns=present):
+                # Kolom numerik tanpa nilai kosong dibaca tanpa salinan dari buffer Arrow
+                yield {name: batch.column(name).to_numpy(zero_copy_only=False) for name in present}
+
+        return parquet.metadata.num_rows, present, blocks()
+
+    if isinstance(source, (str, os.PathLike)):
+        path = os.fspath(source)
+        if os.path.isdir(path):
+            columns = {name: np.load(os.path.join(path, name + '.npy'), mmap_mode='r')
+                       for name in names if os.path.exists(os.path.join(path, name + '.npy'))}
+        elif path.endswith('.npz'):
+            import zipfile
+
+            with zipfile.ZipFile(path) as zf:
+                members = {info.filename[:-4]: info for info in zf.infolist()
+                           if info.filename.endswith('.npy')}
+            columns = {name: _npz_member(path, members[name]) for name in names if name in members}
+        else:
+            raise ValueError(f"Sumber kolom tidak dikenal: {path!r} (direktori .npy, .npz, atau .parquet)")
+    else:
+        columns = {name: source[name] for name in names if name in source}
+
+    lengths = {len(col) for col in columns.values()}
+    if len(lengths) > 1:
+        raise ValueError("Semua kolom harus sama panjang")
+    n = lengths.pop() if lengths else 0
+
+    def blocks():
+        for start in range(0, n, block_size):
+            yield {name: col[start:start + block_size] for name, col in columns.items()}
+
+    return n, list(columns), blocks()
+
+
+def solve_columns(source, output=None, kind='max', x_max=None, y_max=None, block_size=65536):
+    """
+    Selesaikan tabel koefisien yang sangat besar per blok, langsung dari berkas
+
+    Parameter:
+        source     : Direktori berisi a1.npy, b1.npy, ... (dibuka dengan mmap), berkas .npz
+                     yang tidak dikompresi (anggotanya di-memmap), berkas .parquet (dibaca
+                     per batch dengan pyarrow), atau dict nama -> array
+        output     : Path .npy untuk hasil (dibuat sebagai memmap RESULT_DTYPE), array
+                     RESULT_DTYPE yang sudah ada, atau None (array baru di memori)
+        kind       : 'max', 'min', atau 'mixed' seperti solve_batch()
+        x_max      : Batas sumbu x jika tidak ada kolom x_max
+        y_max      : Batas sumbu y jika tidak ada kolom y_max
+        block_size : Jumlah baris per blok solve_batch
+
+    Nama kolom mengikuti solve_max (a1, b1, c1, a2, b2, c2, g, h) atau solve_min/solve_mixed
+    (a, b, c, d, e, f, g, h). Hanya satu blok yang berada di memori pada satu waktu,
+    sehingga data yang lebih besar dari RAM tetap bisa diproses. Mengembalikan array hasil.
+    """
+    if kind not in _SHAPE_FIELDS:
+        raise ValueError(f"kind harus 'max', 'min', atau 'mixed', bukan {kind!r}")
+    names = sorted(set(_SHAPE_FIELDS['max'] + _SHAPE_FIELDS['min']))
+    n, present, blocks = _column_blocks(source, names, block_size)
+    fields = _SHAPE_FIELDS['max'] if 'a1' in present else _SHAPE_FIELDS['min']
+    scalars = {'x_max': x_max, 'y_max': y_max}
+    missing = [name for name in fields if name not in present and scalars.get(name) is None]
+    if missing:
+        raise ValueError(f"Kolom tidak ditemukan: {', '.join(missing)}")
+
+    if output is None:
+        out = np.empty(n, dtype=RESULT_DTYPE)
+    elif isinstance(output, np.ndarray):
+        if output.dtype != RESULT_DTYPE or output.shape != (n,):
+            raise ValueError(f"output harus array RESULT_DTYPE berbentuk ({n},)")
+        out = output
+    else:
+        out = np.lib.format.open_memmap(output, mode='w+', dtype=RESULT_DTYPE, shape=(n,))
+
+    start = 0
+    for block in blocks:
+        size = len(next(iter(block.values())))
+        args = [block[name] if name in block else scalars[name] for name in fields]
+        solve_batch(*args, kind=kind, out=out[start:start + size])
+        start += size
+    if isinstance(out, np.memmap):
+        out.flush()
+    return out
+
+
+# CPU tempat pekerja BatchPool dipasang (None jika tidak dipasang)
+_SHARD_CPU = None
+
+
+def _shard_init(counter, cpus):
+    # Inisialisasi pekerja BatchPool: pasang ke satu CPU berdasarkan urutan start pekerja
+    global _SHARD_CPU
+    if cpus:
+        with counter.get_lock():
+            k = counter.value
+            counter.value += 1
+        _SHARD_CPU = cpus[k % len(cpus)]
+        os.sched_setaffinity(0, {_SHARD_CPU})
+
+
+def _solve_shard(task):
+    # Selesaikan baris [start, stop) langsung di shared memory; hanya nama dan indeks yang dikirim
+    from multiprocessing import shared_memory
+
+    coef_name, out_name, n, start, stop, kind = task
+    began = time.perf_counter()
+    coef_shm = shared_memory.SharedMemory(name=coef_name)
+    out_shm = shared_memory.SharedMemory(name=out_name)
+    try:
+        coef = np.ndarray((10, n), dtype=np.float64, buffer=coef_shm.buf)
+        out = np.ndarray((n,), dtype=RESULT_DTYPE, buffer=out_shm.buf)
+        part = out[start:stop]
+        solve_batch(*coef[:, start:stop], kind=kind, out=part)
+        counts = np.bincount(part['status'], minlength=len(STATUS_NAMES))
+        del coef, out, part
+    finally:
+        coef_shm.close()
+        out_shm.close()
+    stats = {'start': start, 'stop': stop, 'pid': os.getpid(), 'cpu': _SHARD_CPU,
+             'seconds': time.perf_counter() - began}
+    stats.update({name: int(count) for name, count in zip(STATUS_NAMES, counts)})
+    return stats
+
+
+class BatchPool:
+    """
+    Kumpulan proses tetap untuk solve_batch paralel lewat multiprocessing.shared_memory
+
+    Parameter:
+        workers    : Jumlah proses pekerja (default: jumlah core)
+        chunk_size : Jumlah baris per shard (default: sekitar 4 shard per pekerja)
+        pin        : True untuk memasang setiap pekerja ke satu CPU yang boleh dipakai, atau
+                     daftar nomor CPU; False (default) membiarkan penjadwal OS
+
+    Koefisien disalin sekali ke satu blok shared memory dan hasil ditulis langsung ke blok
+    lain; pekerja hanya menerima nama blok dan rentang baris, jadi datanya tidak pernah
+    di-pickle. Setelah solve(), last_shards berisi status dan waktu setiap shard.
+    """
+
+    def __init__(self, workers=None, chunk_size=None, pin=False):
+        from concurrent.futures import ProcessPoolExecutor
+        import multiprocessing
+
+        self.workers = workers or cpu_count()
+        self.chunk_size = chunk_size
+        if pin is True:
+            cpus = sorted(os.sched_getaffinity(0))
+        else:
+            cpus = list(pin) if pin else []
+        counter = multiprocessing.Value('i', 0)
+        self._pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_shard_init,
+                                         initargs=(counter, cpus))
+        self.last_shards = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._pool.shutdown()
+
+    def solve(self, a1, b1, c1, a2, b2, c2, g, h, x_max, y_max, kind='max', out=None, chunk_size=None):
+        """
+        Sama seperti solve_batch(), dibagi ke semua pekerja
+
+        chunk_size menimpa nilai dari konstruktor untuk panggilan ini. Mengembalikan array
+        RESULT_DTYPE (out jika diberikan).
+        """
+        from multiprocessing import shared_memory
+
+        if kind not in _SHAPE_FIELDS:
+            raise ValueError(f"kind harus 'max', 'min', atau 'mixed', bukan {kind!r}")
+        cols = np.broadcast_arrays(*[np.asarray(v, dtype=np.float64) for v in
+                                     (a1, b1, c1, a2, b2, c2, g, h, x_max, y_max)])
+        n = cols[0].size
+        if out is None:
+            out = np.empty(n, dtype=RESULT_DTYPE)
+        elif not isinstance(out, np.ndarray) or out.dtype != RESULT_DTYPE or out.shape != (n,):
+            raise ValueError(f"out harus array RESULT_DTYPE berbentuk ({n},)")
+        self.last_shards = []
+        if n == 0:
+            return out
+        chunk_size = chunk_size or self.chunk_size or max(8192, -(-n//(4*self.workers)))
+
+        coef_shm = shared_memory.SharedMemory(create=True, size=10*n*8)
+        out_shm = shared_memory.SharedMemory(create=True, size=n*RESULT_DTYPE.itemsize)
+        try:
+            coef = np.ndarray((10, n), dtype=np.float64, buffer=coef_shm.buf)
+            for row, col in zip(coef, cols):
+                row[:] = col.ravel()
+            tasks = [(coef_shm.name, out_shm.name, n, start, min(start + chunk_size, n), kind)
+                     for start in range(0, n, chunk_size)]
+            self.last_shards = list(self._pool.map(_solve_shard, tasks))
+            out[:] = np.ndarray((n,), dtype=RESULT_DTYPE, buffer=out_shm.buf)
+            del coef
+        finally:
+            coef_shm.close()
+            coef_shm.unlink()
+            out_shm.close()
+            out_shm.unlink()
+        return out
+
+
+# Keterangan titik sudut sesuai indeks kolom vertex dari solve_batch (urutan kandidat)
+_VERTEX_NAMES = {
+    'max': ("Perpotongan sumbu-X", "Perpotongan sumbu-Y", "Perpotongan batasan"),
+    'min': ("Titik potong Batasan 1 dengan sumbu-X", "Titik potong Batasan 1 dengan sumbu-Y",
+            "Perpotongan Batasan 2 dengan sumbu-X", "Perpotongan Batasan 2 dengan sumbu-Y",
+            "Perpotongan Kedua Batasan"),
+}
+_VERTEX_NAMES['mixed'] = ("Constraint 1 x-intercept", "Constraint 1 y-intercept", "Constraint 2 x-intercept",
+                          "Constraint 2 y-intercept", "Constraint intersection")
+_SCENARIO_CHUNK = 1 << 18
+
+
+def _draw_samples(spec, rng, size):
+    # Sampel satu koefisien: distribusi scipy.stats (punya rvs), fungsi (rng, size), array, atau skalar
+    if callable(getattr(spec, 'rvs', None)):
+        return np.asarray(spec.rvs(size=size, random_state=rng), dtype=np.float64)
+    if callable(spec):
+        return np.asarray(spec(rng, size), dtype=np.float64)
+    return np.asarray(spec, dtype=np.float64)
+
+
+def scenario_analysis(kind='max', samples=100_000, level=0.9, seed=None, plot=False, **coefficients):
+    """
+    Analisis skenario Monte Carlo untuk koefisien yang tidak pasti, diselesaikan dengan solve_batch()
+
+    Parameter:
+        kind         : 'max', 'min', atau 'mixed' seperti pada solve_batch()
+        samples      : Jumlah skenario jika tidak ada koefisien berupa array sampel
+        level        : Tingkat kepercayaan untuk pita dan interval (default 0.9)
+        seed         : Seed atau numpy.random.Generator untuk pengambilan sampel
+        plot         : Gambar grafik dengan koefisien median ditambah lapisan skenario
+        coefficients : Semua argumen maximize() (kind 'max') atau minimize()/optimize()
+                       (a .. y_max). Setiap nilai boleh berupa skalar, array sampel sepanjang
+                       jumlah skenario, distribusi scipy.stats (misalnya norm(300, 15)), atau
+                       fungsi (rng, size) yang mengembalikan array sampel
+
+    Semua skenario diselesaikan sebagai array per potongan, tanpa loop Python per skenario.
+    Mengembalikan dict berisi results (array RESULT_DTYPE per skenario), samples (array
+    koefisien yang berubah-ubah), nominal (median setiap koefisien), feasible (proporsi
+    skenario yang feasible), z_mean, z_std, z_mean_ci (interval kepercayaan rata-rata Z),
+    z_quantiles, z_band, x_band, y_band (interval tengah sebesar level dari Z dan titik
+    optimal), dan vertex_share (proporsi skenario feasible per titik sudut optimal).
+    """
+    from statistics import NormalDist
+
+    if kind not in _VERTEX_NAMES:
+        raise ValueError(f"kind harus 'max', 'min', atau 'mixed', bukan {kind!r}")
+    if not 0 < level < 1:
+        raise ValueError("level harus di antara 0 dan 1")
+    fields = _SHAPE_FIELDS['max' if kind == 'max' else 'min']
+    unknown = set(coefficients) - set(fields)
+    missing = [name for name in fields if name not in coefficients]
+    if unknown or missing:
+        raise TypeError(f"Koefisien untuk kind {kind!r} adalah {', '.join(fields)}"
+                        + (f"; tidak dikenal: {', '.join(sorted(unknown))}" if unknown else "")
+                        + (f"; tidak ada: {', '.join(missing)}" if missing else ""))
+
+    rng = np.random.default_rng(seed)
+    sizes = {np.shape(spec)[0] for spec in coefficients.values()
+             if not callable(spec) and not callable(getattr(spec, 'rvs', None)) and np.ndim(spec) == 1}
+    if len(sizes) > 1:
+        raise ValueError(f"Array sampel harus sama panjang, ditemukan {sorted(sizes)}")
+    n = sizes.pop() if sizes else int(samples)
+    columns = {name: _draw_samples(coefficients[name], rng, n) for name in fields}
+    for name, col in columns.items():
+        if col.ndim > 1 or (col.ndim == 1 and len(col) != n):
+            raise ValueError(f"Sampel {name} harus skalar atau array berbentuk ({n},)")
+
+    out = np.empty(n, dtype=RESULT_DTYPE)
+    for start in range(0, n, _SCENARIO_CHUNK):
+        part = slice(start, min(start + _SCENARIO_CHUNK, n))
+        solve_batch(*[col if col.ndim == 0 else col[part] for col in columns.values()],
+                    kind=kind, out=out[part])
+
+    feasible = out['status'] == STATUS_OPTIMAL
+    z = out['z'][feasible]
+    tail = (1 - level)/2
+    result = {
+        'kind': kind, 'n': n, 'level': level, 'results': out,
+        'samples': {name: col for name, col in columns.items() if col.ndim == 1},
+        'nominal': {name: float(np.median(col)) for name, col in columns.items()},
+        'feasible': float(feasible.mean()) if n else 0.0,
+    }
+    if len(z):
+        quantiles = np.quantile(z, [tail, 0.25, 0.5, 0.75, 1 - tail])
+        spread = NormalDist().inv_cdf(1 - tail)*float(z.std())/len(z)**0.5
+        counts = np.bincount(out['vertex'][feasible], minlength=len(_VERTEX_NAMES[kind]))
+        result.update(
+            z_mean=float(z.mean()), z_std=float(z.std()),
+            z_mean_ci=(float(z.mean()) - spread, float(z.mean()) + spread),
+            z_quantiles=dict(zip((tail, 0.25, 0.5, 0.75, 1 - tail), quantiles.tolist())),
+            z_band=(float(quantiles[0]), float(quantiles[-1])),
+            x_band=tuple(np.quantile(out['x'][feasible], [tail, 1 - tail]).tolist()),
+            y_band=tuple(np.quantile(out['y'][feasible], [tail, 1 - tail]).tolist()),
+            vertex_share={label: float(count)/len(z) for label, count in zip(_VERTEX_NAMES[kind], counts)
+                          if count})
+    else:
+        nan = (np.nan, np.nan)
+        result.update(z_mean=np.nan, z_std=np.nan, z_mean_ci=nan, z_quantiles={}, z_band=nan,
+                      x_band=nan, y_band=nan, vertex_share={})
+    if plot:
+        _PLOTTERS[kind](**result['nominal'], scenarios=result)
+    return result
+
+
+# Tanda batasan yang dikenali oleh mesin umum (m batasan)
+_SENSES = {'<=': 1, '≤': 1, '>=': -1, '≥': -1, '=': 0, '==': 0}
+
+# Sumber bidang-setengah selain batasan pengguna
+_SRC_X_NONNEG = -1   # x ≥ 0 (garis sumbu-Y)
+_SRC_Y_NONNEG = -2   # y ≥ 0 (garis sumbu-X)
+_SRC_BOX = -3        # kotak bantu untuk daerah tak terbatas
+
+
+def _halfplanes(constraints, nonneg=True):
+    # Ubah daftar batasan (a, b, tanda, c) menjadi bidang-setengah a*x + b*y ≤ c.
+    # Batasan '=' menjadi dua bidang-setengah yang berlawanan; indeks bidang-setengah
+    # pertama dari batasan '=' yang pertama ikut dikembalikan (None jika tidak ada).
+    rows, rhs, src = [], [], []
+    line = None
+    for i, (a, b, sense, c) in enumerate(constraints):
+        try:
+            s = _SENSES[sense]
+        except KeyError:
+            raise ValueError(f"Tanda batasan tidak dikenal: {sense!r}") from None
+        if s == 0 and line is None and (a != 0 or b != 0):
+            line = len(rows)
+        if s >= 0:
+            rows.append((a, b)); rhs.append(c); src.append(i)
+        if s <= 0:
+            rows.append((-a, -b)); rhs.append(-c); src.append(i)
+    if nonneg:
+        rows += [(-1.0, 0.0), (0.0, -1.0)]
+        rhs += [0.0, 0.0]
+        src += [_SRC_X_NONNEG, _SRC_Y_NONNEG]
+    A = np.array(rows, dtype=np.float64).reshape(-1, 2)
+    return A, np.array(rhs, dtype=np.float64), np.array(src, dtype=np.intp), line
+
+
+def _segment_on_line(k, A, c, eps):
+    # Daerah feasible yang terletak pada garis bidang-setengah k (kasus degenerasi):
+    # parametrisasi p = p0 + t*d lalu potong semua batasan sebagai interval t
+    p0 = A[k]*c[k]
+    d = np.array([-A[k, 1], A[k, 0]])
+    slope = A @ d
+    room = c - A @ p0
+    flat = np.abs(slope) <= 1e-12
+    if np.any(room[flat] < -eps):
+        return None
+    with np.errstate(divide='ignore'):
+        bound = room/np.where(flat, 1.0, slope)
+    upper = np.where(~flat & (slope > 0), bound, np.inf)
+    lower = np.where(~flat & (slope < 0), bound, -np.inf)
+    i_hi, i_lo = int(np.argmin(upper)), int(np.argmax(lower))
+    t_hi, t_lo = upper[i_hi], lower[i_lo]
+    if t_lo > t_hi + eps:
+        return None
+    if t_lo >= t_hi - eps:
+        t = 0.5*(t_lo + t_hi)
+        return np.array([p0 + t*d]), np.array([k])
+    return np.array([p0 + t_lo*d, p0 + t_hi*d]), np.array([k, k])
+
+
+def _feasible_polygon(A, c, src, line=None, bound=None):
+    """
+    Potong bidang-setengah A @ p ≤ c dengan algoritma pengurutan sudut + deque, O(m log m)
+
+    Daerah tak terbatas dipotong dengan kotak bantu |x|, |y| ≤ bound. Jika line diisi
+    (indeks bidang-setengah dari batasan '='), daerah dicari langsung pada garis itu, O(m).
+    Mengembalikan (vertices, edge_src): titik sudut berlawanan arah jarum jam dan sumber
+    bidang-setengah untuk sisi dari titik k ke titik k+1, atau None jika tidak feasible.
+    """
+    norm = np.hypot(A[:, 0], A[:, 1])
+    zero = norm == 0
+    scale = max(1.0, float(np.max(np.abs(c[~zero])/norm[~zero], initial=0.0)))
+    eps = 1e-9*scale
+    # Batasan 0*x + 0*y ≤ c hanya memeriksa tanda c
+    if np.any(c[zero] < -eps):
+        return None
+    if line is not None:
+        line -= int(np.count_nonzero(zero[:line]))
+    A_raw, c_raw = A[~zero], c[~zero]
+    A = A_raw/norm[~zero, None]
+    c = c_raw/norm[~zero]
+    src = src[~zero]
+
+    if bound is None:
+        bound = 1e7*scale
+    A = np.vstack([A, [[1.0, 0.0], [0.0, 1.0], [-1.0, 0.0], [0.0, -1.0]]])
+    c = np.concatenate([c, np.full(4, float(bound))])
+    src = np.concatenate([src, np.full(4, _SRC_BOX)])
+    A_raw = np.vstack([A_raw, A[-4:]])
+    c_raw = np.concatenate([c_raw, c[-4:]])
+
+    if line is not None:
+        result = _segment_on_line(line, A, c, eps)
+        return None if result is None else (result[0], src[result[1]])
+
+    # Urutkan menurut sudut arah garis; untuk arah yang sama, yang paling ketat di depan
+    angle = np.arctan2(A[:, 0], -A[:, 1])
+    order = np.lexsort((c, angle))
+    keep = np.ones(len(order), dtype=bool)
+    keep[1:] = np.diff(angle[order]) > 1e-12
+    order = order[keep]
+
+    def point(i, j, A=A, c=c):
+        det = A[i, 0]*A[j, 1] - A[j, 0]*A[i, 1]
+        return ((c[i]*A[j, 1] - c[j]*A[i, 1])/det, (A[i, 0]*c[j] - A[j, 0]*c[i])/det)
+
+    def out(i, p):
+        return A[i, 0]*p[0] + A[i, 1]*p[1] - c[i] > eps
+
+    dq = []
+    head = 0
+    for i in order:
+        while len(dq) - head >= 2 and out(i, point(dq[-1], dq[-2])):
+            dq.pop()
+        while len(dq) - head >= 2 and out(i, point(dq[head], dq[head + 1])):
+            head += 1
+        if len(dq) > head:
+            j = dq[-1]
+            cross = A[i, 0]*A[j, 1] - A[i, 1]*A[j, 0]
+            if abs(cross) <= 1e-12 and A[i] @ A[j] < 0:
+                # Garis sejajar berlawanan arah: kosong, atau daerah menempel pada garis
+                if c[i] + c[j] < -eps:
+                    return None
+                result = _segment_on_line(i, A, c, eps)
+                return None if result is None else (result[0], src[result[1]])
+        dq.append(i)
+    dq = dq[head:]
+    while len(dq) >= 3 and out(dq[0], point(dq[-1], dq[-2])):
+        dq.pop()
+    while len(dq) >= 3 and out(dq[-1], point(dq[0], dq[1])):
+        dq.pop(0)
+    if len(dq) < 3:
+        return None
+
+    vertices, edge_src = [], []
+    for k in range(len(dq)):
+        i, j = dq[k], dq[(k + 1) % len(dq)]
+        if abs(A[i, 0]*A[j, 1] - A[j, 0]*A[i, 1]) <= 1e-12:
+            continue
+        # Titik sudut dihitung dari koefisien asli agar hasilnya tepat
+        p = point(i, j, A_raw, c_raw)
+        if vertices and abs(p[0] - vertices[-1][0]) <= eps and abs(p[1] - vertices[-1][1]) <= eps:
+            edge_src[-1] = src[j]
+            continue
+        vertices.append(p)
+        edge_src.append(src[j])
+    if len(vertices) > 1 and abs(vertices[0][0] - vertices[-1][0]) <= eps \
+            and abs(vertices[0][1] - vertices[-1][1]) <= eps:
+        vertices.pop()
+        edge_src.pop()
+    vertices = np.array(vertices)
+    # Titik berat poligon yang benar selalu memenuhi semua bidang-setengah; jika tidak,
+    # perpotongan sebenarnya kosong dan deque hanya menyisakan poligon semu
+    if not vertices.size or np.any(A @ vertices.mean(axis=0) - c > 1e2*eps):
+        return None
+    return vertices, np.array(edge_src, dtype=np.intp)
+
+
+def _clip_polygon(polygon, a, b, c, k, constraints=()):
+    """
+    Potong poligon konveks (vertices, edge_src) dengan satu bidang-setengah a*x + b*y ≤ c, O(n)
+
+    Titik sudut di sisi yang dilanggar diganti dua titik potong, sisi barunya bersumber k.
+    constraints (daftar batasan asal edge_src) dipakai agar titik potong dihitung tepat.
+    Mengembalikan poligon baru, None jika kosong, atau False jika hasilnya merosot (ruas
+    garis atau titik) sehingga perlu dibangun ulang dengan _feasible_polygon().
+    """
+    vertices, edge_src = polygon
+    norm = np.hypot(a, b)
+    if norm == 0:
+        return polygon if c >= 0 else None
+    side = vertices @ (a, b) - c
+    eps = 1e-9*max(1.0, float(np.max(np.abs(vertices))), abs(c)/norm)*norm
+    inside = side <= eps
+    if inside.all():
+        return polygon
+    if not inside.any():
+        return None
+    new_vertices, new_src = [], []
+    n = len(vertices)
+    for i in range(n):
+        j = (i + 1) % n
+        if inside[i]:
+            new_vertices.append(vertices[i])
+            new_src.append(edge_src[i])
+        if inside[i] != inside[j]:
+            # Titik potong sisi i dengan garis baru; dari koefisien asli jika garis sisinya diketahui
+            s = edge_src[i]
+            p = None
+            if 0 <= s < len(constraints):
+                p = _intersect(a, b, c, constraints[s][0], constraints[s][1], constraints[s][3])
+            elif s in (_SRC_X_NONNEG, _SRC_Y_NONNEG):
+                p = _intersect(a, b, c, float(s == _SRC_X_NONNEG), float(s == _SRC_Y_NONNEG), 0.0)
+            if p is None:
+                t = side[i]/(side[i] - side[j])
+                p = vertices[i] + t*(vertices[j] - vertices[i])
+            new_vertices.append(np.asarray(p, dtype=np.float64))
+            new_src.append(k if inside[i] else edge_src[i])
+    # Buang titik kembar (batasan baru tepat melewati titik sudut lama); sisinya ikut sisi berikutnya
+    vertices, edge_src = [new_vertices[0]], [new_src[0]]
+    for p, s in zip(new_vertices[1:], new_src[1:]):
+        if np.all(np.abs(p - vertices[-1]) <= eps/norm):
+            edge_src[-1] = s
+        else:
+            vertices.append(p)
+            edge_src.append(s)
+    if len(vertices) > 1 and np.all(np.abs(vertices[0] - vertices[-1]) <= eps/norm):
+        vertices.pop()
+        edge_src.pop()
+    if len(vertices) < 3:
+        return False
+    return np.array(vertices), np.array(edge_src, dtype=np.intp)
+
+
+def _vertex_label(s1, s2):
+    # Keterangan titik sudut dari dua sumber bidang-setengah yang melaluinya
+    names = []
+    for s in sorted({int(s1), int(s2)}, key=lambda s: (s < 0, s)):
+        if s >= 0:
+            names.append(f"batasan {s + 1}")
+        elif s == _SRC_X_NONNEG:
+            names.append("sumbu-Y")
+        elif s == _SRC_Y_NONNEG:
+            names.append("sumbu-X")
+        else:
+            names.append("batas bantu")
+    if len(names) == 1:
+        return f"Titik pada {names[0]}"
+    return f"Perpotongan {names[0]} dengan {names[1]}"
+
+
+# solve_2d menjalankan presolve mulai dari jumlah batasan ini
+_PRESOLVE_MIN_ROWS = 8
+
+
+def _box_extremes(A, lo, hi):
+    # Nilai minimum dan maksimum A @ p di atas kotak lo ≤ p ≤ hi (boleh tak hingga), per baris
+    pos, neg = np.maximum(A, 0.0), np.minimum(A, 0.0)
+    lo_f, hi_f = np.where(np.isfinite(lo), lo, 0.0), np.where(np.isfinite(hi), hi, 0.0)
+    top = pos @ hi_f + neg @ lo_f
+    bottom = pos @ lo_f + neg @ hi_f
+    top[((pos > 0) & np.isinf(hi)).any(axis=1) | ((neg < 0) & np.isinf(lo)).any(axis=1)] = np.inf
+    bottom[((pos > 0) & np.isinf(lo)).any(axis=1) | ((neg < 0) & np.isinf(hi)).any(axis=1)] = -np.inf
+    return bottom, top
+
+
+def presolve(constraints, g=None, h=None, sense='max', nonneg=True):
+    """
+    Sederhanakan batasan program linear 2 variabel sebelum mencari titik sudut
+
+    Parameter:
+        constraints : Daftar batasan seperti pada solve_2d()
+        g, h        : Koefisien fungsi tujuan (opsional, untuk memeriksa ketakterbatasan)
+        sense       : 'max' atau 'min'
+        nonneg      : Tambahkan x ≥ 0 dan y ≥ 0 (default True)
+
+    Setiap baris pertidaksamaan dinormalkan (‖(a, b)‖ = 1) agar bisa dibandingkan. Baris
+    0*x + 0*y, batasan satu variabel yang bukan batas terketat, batasan sejajar yang kalah
+    ketat, dan batasan yang tidak mungkin aktif di dalam kotak batas x dan y dibuang.
+    Semua langkah O(m log m) tanpa membangun poligon.
+
+    Mengembalikan dict berisi:
+        status      : 'infeasible', 'unbounded', atau 'reduced' (perlu diselesaikan)
+        constraints : Batasan yang tersisa (koefisien asli, urutan asli)
+        index       : Indeks asal setiap batasan yang tersisa
+        removed     : dict indeks -> alasan ('empty', 'bound', 'duplicate', 'dominated',
+                      'redundant')
+        bounds      : ((x_lo, x_hi), (y_lo, y_hi)) dari batasan satu variabel
+        certificate : Untuk 'infeasible', dict rows (indeks batasan; -1/-2 untuk x ≥ 0 /
+                      y ≥ 0) dan multipliers λ ≥ 0 sehingga Σ λ*(a, b) = 0 dan Σ λ*c < 0
+                      pada bentuk a*x + b*y ≤ c. Untuk 'unbounded', dict point (titik
+                      feasible) dan ray (arah resesi yang memperbaiki Z). None jika 'reduced'.
+    """
+    return _presolve(constraints, g, h, sense, nonneg)[0]
+
+
+# Tanda batasan dan arah optimasi untuk setiap bentuk masalah tetap
+_SHAPE_SENSES = {'max': ('<=', '<=', 'max'), 'min': ('>=', '>=', 'min'), 'mixed': ('<=', '>=', 'max')}
+
+
+def _presolve_solve(kind, a1, b1, c1, a2, b2, c2, g, h, x_max, y_max):
+    # Presolve lalu solve satu masalah berbentuk tetap untuk fungsi plot; masalah yang terbukti
+    # tidak feasible berhenti sebelum titik sudut. Mengembalikan (LPResult, status presolve)
+    sign1, sign2, sense = _SHAPE_SENSES[kind]
+    pre = presolve([(a1, b1, sign1, c1), (a2, b2, sign2, c2)], g, h, sense)
+    if pre['status'] == 'infeasible':
+        return LPResult('infeasible', sense), pre['status']
+    return _SHAPE_SOLVERS[kind](a1, b1, c1, a2, b2, c2, g, h, x_max, y_max), pre['status']
+
+
+def _presolve(constraints, g, h, sense, nonneg):
+    # presolve() beserta kerucut resesi yang sudah dihitung (None jika Z pasti terbatas
+    # atau tidak diperiksa), agar solve_2d tidak menghitungnya dua kali
+    constraints = list(constraints)
+    rows, rhs, src, equal = [], [], [], []
+    for i, (a, b, s, c) in enumerate(constraints):
+        try:
+            k = _SENSES[s]
+        except KeyError:
+            raise ValueError(f"Tanda batasan tidak dikenal: {s!r}") from None
+        if k == 0:
+            equal.append(i)
+        else:
+            rows.append((k*a, k*b)); rhs.append(k*c); src.append(i)
+    if nonneg:
+        rows += [(-1.0, 0.0), (0.0, -1.0)]
+        rhs += [0.0, 0.0]
+        src += [_SRC_X_NONNEG, _SRC_Y_NONNEG]
+    A = np.array(rows, dtype=np.float64).reshape(-1, 2)
+    c = np.array(rhs, dtype=np.float64)
+    src = np.array(src, dtype=np.intp)
+    removed = {}
+    result = {'status': 'reduced', 'constraints': constraints, 'index': np.arange(len(constraints)),
+              'removed': removed, 'bounds': ((-np.inf, np.inf), (-np.inf, np.inf)), 'certificate': None}
+
+    def infeasible(rows, multipliers):
+        result.update(status='infeasible', constraints=[], index=np.empty(0, dtype=np.intp),
+                      certificate={'rows': [int(r) for r in rows],
+                                   'multipliers': [float(m) for m in multipliers]})
+        return result, None
+
+    # Normalkan setiap baris; baris nol hanya memeriksa tanda c
+    norm = np.hypot(A[:, 0], A[:, 1])
+    live = norm > 0
+    safe = np.where(live, norm, 1.0)
+    An, cn = A/safe[:, None], c/safe
+    scale = max(1.0, float(np.max(np.abs(cn[live]), initial=0.0)))
+    eps = 1e-9*scale
+    if not live.all():
+        for k in np.flatnonzero(~live):
+            if c[k] < -eps:
+                return infeasible([src[k]], [1.0])
+            removed[int(src[k])] = 'empty'
+
+    # Batasan satu variabel menjadi batas x dan y; hanya yang terketat yang disimpan
+    lo, hi = np.array([-np.inf, -np.inf]), np.array([np.inf, np.inf])
+    lo_row, hi_row = [None, None], [None, None]
+    single = live & ((An[:, 0] == 0) | (An[:, 1] == 0))
+    for axis in (0, 1):
+        upper = np.flatnonzero(single & (An[:, axis] > 0))
+        lower = np.flatnonzero(single & (An[:, axis] < 0))
+        if len(upper):
+            hi_row[axis] = int(upper[np.argmin(cn[upper])])
+            hi[axis] = cn[hi_row[axis]]
+        if len(lower):
+            lo_row[axis] = int(lower[np.argmin(cn[lower])])
+            lo[axis] = -cn[lo_row[axis]]
+        if lo[axis] > hi[axis] + eps:
+            k, l = lo_row[axis], hi_row[axis]
+            return infeasible([src[k], src[l]], [1/norm[k], 1/norm[l]])
+        if len(upper) + len(lower) > 2:
+            for k in np.concatenate([upper, lower]):
+                if k not in (lo_row[axis], hi_row[axis]) and src[k] >= 0:
+                    removed[int(src[k])] = 'bound'
+    result['bounds'] = tuple((float(lo[axis]) + 0.0, float(hi[axis]) + 0.0) for axis in (0, 1))
+
+    general = np.flatnonzero(live & ~single)
+    if len(general) > 1:
+        # Baris umum dengan arah sama: yang paling ketat menang
+        angle = np.arctan2(An[general, 1], An[general, 0])
+        order = np.lexsort((cn[general], angle))
+        general, angle = general[order], angle[order]
+        first = np.ones(len(general), dtype=bool)
+        first[1:] = angle[1:] - angle[:-1] > 1e-12
+        if not first.all():
+            head = np.maximum.accumulate(np.where(first, np.arange(len(general)), 0))
+            for k, j in zip(general[~first], general[head[~first]]):
+                if src[k] >= 0:
+                    removed[int(src[k])] = 'duplicate' if cn[k] <= cn[j] + eps else 'dominated'
+            general, angle = general[first], angle[first]
+
+        # Baris sejajar berlawanan arah yang saling meniadakan
+        opposite = np.where(angle > 0, angle - np.pi, angle + np.pi)
+        j = np.minimum(np.searchsorted(angle, opposite), len(general) - 1)
+        for jj in (j, np.maximum(j - 1, 0)):
+            clash = (np.abs(angle[jj] - opposite) <= 1e-12) & (cn[general] + cn[general[jj]] < -eps)
+            if clash.any():
+                k = int(np.argmax(clash))
+                k, l = general[k], general[jj[k]]
+                return infeasible([src[k], src[l]], [1/norm[k], 1/norm[l]])
+
+    # Di dalam kotak batas: baris yang selalu terpenuhi dibuang, yang tidak pernah terpenuhi
+    # membuktikan masalah tidak feasible
+    bottom, top = _box_extremes(An[general], lo, hi)
+    never = bottom > cn[general] + eps
+    if never.any():
+        k = general[int(np.argmax(never))]
+        rows, multipliers = [src[k]], [1/norm[k]]
+        for axis in (0, 1):
+            weight = An[k, axis]
+            if weight != 0:
+                bound = lo_row[axis] if weight > 0 else hi_row[axis]
+                rows.append(src[bound])
+                multipliers.append(abs(weight)/norm[bound])
+        return infeasible(rows, multipliers)
+    redundant = top < cn[general] - eps
+    for k in general[redundant]:
+        if src[k] >= 0:
+            removed[int(src[k])] = 'redundant'
+
+    if removed:
+        keep = [i for i in range(len(constraints)) if i not in removed]
+        result['constraints'] = [constraints[i] for i in keep]
+        result['index'] = np.array(keep, dtype=np.intp)
+
+    # Tak terbatas: titik feasible yang murah dicari ditambah arah resesi yang memperbaiki Z
+    if g is None or h is None or not (g or h):
+        return result, None
+    sign = 1.0 if sense == 'max' else -1.0
+    # Z terbatas di dalam kotak batas: tidak perlu kerucut resesi
+    if all(w == 0 or (hi[axis] < np.inf if w > 0 else lo[axis] > -np.inf)
+           for axis, w in enumerate((sign*g, sign*h))):
+        return result, None
+    kept = np.concatenate([general[~redundant], [k for k in lo_row + hi_row if k is not None]]).astype(np.intp)
+    A_eq = np.array([constraints[i][:2] for i in equal], dtype=np.float64).reshape(-1, 2)
+    c_eq = np.array([constraints[i][3] for i in equal], dtype=np.float64)
+    A_cone = np.vstack([An[kept], A_eq, -A_eq])
+    src_cone = np.concatenate([src[kept], equal, equal]).astype(np.intp)
+    line = next((len(kept) + k for k, row in enumerate(A_eq) if row.any()), None)
+    cone = _feasible_polygon(A_cone, np.zeros(len(A_cone)), src_cone, line, bound=1.0)
+    if cone is None:
+        return result, None
+    along = sign*(cone[0] @ (g, h))
+    if along.max() <= 1e-9*max(abs(g), abs(h)):
+        return result, cone
+    ray = cone[0][int(np.argmax(along))]
+    xs = [v for v in (lo[0], hi[0], 0.0) if np.isfinite(v)]
+    ys = [v for v in (lo[1], hi[1], 0.0) if np.isfinite(v)]
+    points = np.array([(x, y) for x in xs for y in ys])
+    # Juga titik yang cukup jauh di sepanjang arah di dalam kerucut (titik beratnya)
+    inner = cone[0].mean(axis=0)
+    slope = An[kept] @ inner
+    if len(A_eq) == 0 and np.all(slope < 0):
+        t = np.max((An[kept] @ points[0] - cn[kept])/-slope, initial=0.0)
+        points = np.vstack([points, points[0] + (t + 1.0)*inner])
+    ok = np.all(An[kept] @ points.T <= cn[kept, None] + eps, axis=0)
+    if len(A_eq):
+        ok &= np.all(np.abs(A_eq @ points.T - c_eq[:, None]) <= eps, axis=0)
+    if ok.any():
+        point = points[int(np.argmax(ok))]
+        result.update(status='unbounded', certificate={'point': tuple(point.tolist()),
+                                                       'ray': tuple(ray.tolist())})
+    return result, cone
+
+
+def solve_2d(constraints, g, h, sense='max', nonneg=True):
+    """
+    Selesaikan program linear 2 variabel dengan sembarang jumlah batasan ≤, ≥, atau =
+
+    Parameter:
+        constraints : Daftar batasan (a, b, tanda, c) untuk a*x + b*y [tanda] c,
+                      dengan tanda '<=', '>=', atau '=' (juga '≤', '≥')
+        g, h        : Koefisien untuk fungsi tujuan (Z = g*x + h*y)
+        sense       : 'max' atau 'min'
+        nonneg      : Tambahkan x ≥ 0 dan y ≥ 0 (default True)
+
+    Mulai dari 8 batasan, batasan lebih dulu disederhanakan oleh presolve(); masalah yang
+    sudah terbukti tidak feasible atau tak terbatas langsung dikembalikan tanpa titik sudut.
+    Daerah feasible dibangun dengan perpotongan bidang-setengah O(m log m).
+    Mengembalikan LPResult dengan status 'optimal', 'unbounded', atau 'infeasible';
+    vertices berisi titik sudut daerah feasible (berlawanan arah jarum jam, daerah
+    tak terbatas dipotong kotak bantu yang sangat besar).
+    """
+    if sense not in ('max', 'min'):
+        raise ValueError(f"sense harus 'max' atau 'min', bukan {sense!r}")
+    constraints = list(constraints)
+    if len(constraints) < _PRESOLVE_MIN_ROWS:
+        # Masalah kecil: presolve lebih mahal daripada langsung membangun poligon
+        A, c, src, line = _halfplanes(constraints, nonneg)
+        polygon = _feasible_polygon(A, c, src, line)
+        cone = None if polygon is None else _feasible_polygon(A, np.zeros_like(c), src, line, bound=1.0)
+        return _optimum(polygon, cone, g, h, sense)
+    reduced, cone = _presolve(constraints, g, h, sense, nonneg)
+    if reduced['status'] != 'reduced':
+        return LPResult(reduced['status'], sense)
+    A, c, src, line = _halfplanes(reduced['constraints'], nonneg)
+    if reduced['removed'] and len(reduced['index']):
+        # Sumber bidang-setengah kembali ke indeks batasan asli (untuk keterangan titik)
+        src = np.where(src >= 0, reduced['index'][np.maximum(src, 0)], src)
+    polygon = _feasible_polygon(A, c, src, line)
+    return _optimum(polygon, cone, g, h, sense)
+
+
+def _optimum(polygon, cone, g, h, sense):
+    # Pilih titik optimal dari poligon feasible dan poligon kerucut resesinya (A @ d ≤ 0)
+    if polygon is None:
+        return LPResult('infeasible', sense)
+    vertices, edge_src = polygon
+    vertices = vertices + 0.0
+    labels = [_vertex_label(edge_src[k - 1], edge_src[k]) for k in range(len(vertices))]
+    sign = 1.0 if sense == 'max' else -1.0
+
+    # Tak terbatas jika ada arah resesi yang memperbaiki Z
+    tol = 1e-9*max(abs(g), abs(h), 1e-300)
+    if cone is not None and np.max(sign*(cone[0] @ (g, h))) > tol:
+        return LPResult('unbounded', sense, [tuple(v) for v in vertices.tolist()],
+                        (vertices @ (g, h)).tolist(), labels)
+
+    Z_values = vertices @ (g, h)
+    best = sign*Z_values
+    # Utamakan titik sudut asli daripada titik pada kotak bantu jika nilainya sama
+    on_box = (edge_src == _SRC_BOX) | (np.roll(edge_src, 1) == _SRC_BOX)
+    top = best >= best.max() - 1e-9*max(1.0, abs(best.max()))
+    index = int(np.flatnonzero(top & ~on_box)[0]) if np.any(top & ~on_box) else int(np.argmax(best))
+    return LPResult('optimal', sense, [tuple(v) for v in vertices.tolist()], Z_values.tolist(),
+                    labels, index)
+
+
+def _bound_interval(alpha, beta, value):
+    # Interval nilai t yang memenuhi semua alpha*t ≥ beta (nilai sekarang selalu memenuhi)
+    lo, hi = -np.inf, np.inf
+    for a, b in zip(alpha, beta):
+        if a > 1e-12:
+            lo = max(lo, b/a)
+        elif a < -1e-12:
+            hi = min(hi, b/a)
+    return float(min(lo, value)), float(max(hi, value))
+
+
+def ranging(constraints, g, h, sense='max', nonneg=True):
+    """
+    Analisis sensitivitas (ranging) untuk titik optimal program linear 2 variabel
+
+    Parameter sama dengan solve_2d(). Mengembalikan dict berisi:
+        x, y, z       : Titik optimal dan nilai Z
+        g, h          : Interval (bawah, atas) koefisien tujuan agar titik ini tetap optimal
+                        (koefisien lainnya tetap)
+        rhs           : Interval ruas kanan c setiap batasan agar basis optimal tetap sama
+                        (titik optimal bergeser linear di sepanjang interval ini)
+        shadow_prices : Perubahan Z per satu satuan kenaikan c setiap batasan
+        basis         : Indeks dua bidang-setengah pembentuk titik optimal (negatif untuk
+                        x ≥ 0 dan y ≥ 0, sama seperti keterangan titik)
+
+    Menimbulkan ValueError jika masalahnya tidak memiliki solusi optimal.
+    """
+    res = solve_2d(constraints, g, h, sense, nonneg)
+    if res.status != 'optimal':
+        raise ValueError(f"Ranging membutuhkan solusi optimal, status masalah: {res.status}")
+    A, c, src, _ = _halfplanes(constraints, nonneg)
+    v = np.array([res.x, res.y])
+    sign = 1.0 if sense == 'max' else -1.0
+    p = sign*np.array([g, h], dtype=np.float64)
+
+    # Batasan aktif di titik optimal dan kerucut normalnya (rentang sudut normal)
+    norm = np.hypot(A[:, 0], A[:, 1])
+    scale = max(1.0, float(np.max(np.abs(v))))
+    active = np.flatnonzero((norm > 0) & (np.abs(A @ v - c) <= 1e-9*scale*np.maximum(norm, 1.0)))
+    angle = np.arctan2(A[active, 1], A[active, 0])
+    order = np.argsort(angle)
+    active, angle = active[order], angle[order]
+    gaps = np.diff(np.concatenate([angle, angle[:1] + 2*np.pi]))
+    start = (int(np.argmax(gaps)) + 1) % len(active)
+    ring = np.roll(active, -start)
+    n1, n2 = A[ring[0]], A[ring[-1]]
+
+    def cross(u, w):
+        return u[0]*w[1] - u[1]*w[0]
+
+    # Titik tetap optimal selama sign*(g, h) berada di kerucut antara n1 dan n2
+    if gaps.max() < np.pi - 1e-12:
+        g_range = h_range = (-np.inf, np.inf)
+    else:
+        # cross(n1, p) ≥ 0 dan cross(p, n2) ≥ 0, ditulis linear dalam g lalu dalam h
+        g_range = _bound_interval([-sign*n1[1], sign*n2[1]],
+                                  [-sign*n1[0]*h, sign*n2[0]*h], g)
+        h_range = _bound_interval([sign*n1[0], -sign*n2[0]],
+                                  [sign*n1[1]*g, -sign*n2[1]*g], h)
+
+    # Basis: dua normal aktif berurutan yang mengapit arah tujuan
+    basis = (ring[0], ring[-1])
+    for i, j in zip(ring[:-1], ring[1:]):
+        if cross(A[i], p) >= -1e-12 and cross(p, A[j]) >= -1e-12 and abs(cross(A[i], A[j])) > 1e-12:
+            basis = (i, j)
+            break
+    B = A[list(basis)]
+    independent = abs(cross(B[0], B[1])) > 1e-12
+
+    rhs, shadow = [], []
+    for k, (a, b, s, ck) in enumerate(constraints):
+        rows = np.flatnonzero(src == k)
+        in_basis = [r for r in rows if r in basis]
+        level = a*v[0] + b*v[1]
+        if not in_basis or not independent:
+            # Batasan tidak membentuk titik optimal: titik tetap selama batasan tidak dilanggar
+            shadow.append(0.0)
+            if _SENSES[s] > 0:
+                rhs.append((float(min(level, ck)), np.inf))
+            elif _SENSES[s] < 0:
+                rhs.append((-np.inf, float(max(level, ck))))
+            else:
+                rhs.append((float(ck), float(ck)))
+            continue
+        # Titik bergeser v + t*w saat ruas kanan naik t; cari t agar batasan lain tetap terpenuhi
+        r = in_basis[0]
+        e = np.zeros(2)
+        e[basis.index(r)] = 1.0 if _SENSES[s] >= 0 and r == rows[0] else -1.0
+        w = np.linalg.solve(B, e)
+        shadow.append(float(g*w[0] + h*w[1]))
+        others = np.array([i for i in range(len(A)) if src[i] != k])
+        t_lo, t_hi = (_bound_interval(-(A[others] @ w), A[others] @ v - c[others], 0.0)
+                      if len(others) else (-np.inf, np.inf))
+        rhs.append((ck + t_lo, ck + t_hi))
+
+    return {'x': res.x, 'y': res.y, 'z': res.z, 'g': g_range, 'h': h_range,
+            'rhs': rhs, 'shadow_prices': shadow, 'basis': tuple(int(src[i]) for i in basis)}
+
+
+def sweep_objective(constraints, g, h, sense='max', nonneg=True):
+    """
+    Kurva Z optimal untuk banyak nilai g (atau h) tanpa menyelesaikan ulang setiap titik
+
+    Parameter:
+        constraints : Daftar batasan seperti pada solve_2d()
+        g, h        : Tepat satu di antaranya berupa array nilai yang disapu, yang lain skalar
+        sense       : 'max' atau 'min'
+        nonneg      : Tambahkan x ≥ 0 dan y ≥ 0 (default True)
+
+    Poligon feasible dibangun sekali. Z optimal sebagai fungsi parameter adalah amplop atas
+    (max) atau bawah (min) dari garis-garis titik sudut, sehingga hanya titik patahnya yang
+    dihitung; setiap nilai parameter lalu dicari dengan pencarian biner.
+
+    Mengembalikan dict berisi breakpoints (nilai parameter tempat titik optimal berganti),
+    vertices (titik optimal untuk setiap potongan, sebelum breakpoint pertama, di antara
+    breakpoint, dan setelah yang terakhir), serta array x, y, z untuk setiap nilai yang
+    disapu (z = ±inf jika tak terbatas, NaN jika tidak feasible).
+    """
+    g_arr, h_arr = np.ndim(g) > 0, np.ndim(h) > 0
+    if g_arr == h_arr:
+        raise ValueError("Tepat satu dari g atau h harus berupa array")
+    t = np.asarray(g if g_arr else h, dtype=np.float64)
+    fixed = float(h if g_arr else g)
+    sign = 1.0 if sense == 'max' else -1.0
+
+    A, c, src, line = _halfplanes(constraints, nonneg)
+    polygon = _feasible_polygon(A, c, src, line)
+    if polygon is None:
+        nan = np.full(t.shape, np.nan)
+        return {'breakpoints': np.empty(0), 'vertices': np.empty((0, 2)), 'x': nan, 'y': nan, 'z': nan}
+    vertices, edge_src = polygon
+    on_box = (edge_src == _SRC_BOX) | (np.roll(edge_src, 1) == _SRC_BOX)
+    if np.any(~on_box):
+        vertices = vertices[~on_box]
+
+    # Z = t*slope + intercept untuk setiap titik sudut; amplop atas dari sign*Z
+    slope = vertices[:, 0] if g_arr else vertices[:, 1]
+    intercept = fixed*(vertices[:, 1] if g_arr else vertices[:, 0])
+    m, b = sign*slope, sign*intercept
+    order = np.lexsort((b, m))
+    hull = []
+    for i in order:
+        while hull and m[hull[-1]] == m[i]:
+            hull.pop()
+        while len(hull) >= 2:
+            j, k = hull[-2], hull[-1]
+            # Garis k tidak pernah tertinggi jika perpotongan i-j berada di kiri perpotongan j-k
+            if (b[j] - b[i])*(m[k] - m[j]) <= (b[j] - b[k])*(m[i] - m[j]):
+                hull.pop()
+            else:
+                break
+        hull.append(i)
+    hull = np.array(hull)
+    breakpoints = (b[hull[:-1]] - b[hull[1:]])/(m[hull[1:]] - m[hull[:-1]])
+
+    piece = hull[np.searchsorted(breakpoints, t)]
+    z = slope[piece]*t + intercept[piece]
+    x = vertices[piece, 0].copy()
+    y = vertices[piece, 1].copy()
+
+    # Parameter yang membuat Z tak terbatas: ada arah resesi d dengan Z(d) > 0
+    cone = _feasible_polygon(A, np.zeros_like(c), src, line, bound=1.0)
+    if cone is not None:
+        d = cone[0]
+        along = sign*(np.outer(t, d[:, 0 if g_arr else 1]) + fixed*d[:, 1 if g_arr else 0])
+        unbounded = (along > 1e-9*np.maximum(np.abs(t), abs(fixed))[:, None]).any(axis=1)
+        z[unbounded] = sign*np.inf
+        x[unbounded] = y[unbounded] = np.nan
+    return {'breakpoints': breakpoints, 'vertices': vertices[hull], 'x': x, 'y': y, 'z': z}
+
+
+def _column_bounds(A, c, u, axis, eps):
+    # Interval kontinu variabel lain pada kolom u (array) dari semua bidang-setengah
+    a, b = (A[:, 0], A[:, 1]) if axis == 0 else (A[:, 1], A[:, 0])
+    room = c[None, :] - np.outer(u, a)
+    flat = np.abs(b) <= 1e-12
+    with np.errstate(divide='ignore', invalid='ignore'):
+        bound = room/np.where(flat, 1.0, b)
+    hi = np.where(~flat & (b > 0), bound, np.inf).min(axis=1)
+    lo = np.where(~flat & (b < 0), bound, -np.inf).max(axis=1)
+    # Bidang-setengah sejajar kolom yang dilanggar membuat kolom kosong
+    empty = (flat[None, :] & (room < -eps)).any(axis=1)
+    return np.where(empty, np.inf, lo), np.where(empty, -np.inf, hi)
+
+
+def solve_integer(constraints, g, h, sense='max', nonneg=True):
+    """
+    Selesaikan program linear 2 variabel dengan syarat x dan y bilangan bulat
+
+    Parameter sama dengan solve_2d().
+
+    Poligon feasible yang tepat dibangun sekali. Titik bulat dicari per kolom x bulat (atau
+    per baris y, mana yang lebih sempit): interval y pada kolom itu dihitung dari sisi-sisi
+    poligon, sehingga y terbaik langsung diketahui tanpa mencoba semua nilai. Kolom diperiksa
+    mulai dari optimum kontinu ke kiri dan ke kanan; batas atas Z per kolom berbentuk konkaf,
+    jadi pencarian berhenti begitu batas itu tidak lebih baik dari titik bulat terbaik, dan
+    hanya pita tipis di sekitar isoline optimal yang diperiksa.
+
+    Mengembalikan LPResult dengan satu titik (titik bulat optimal) dan status 'optimal',
+    'infeasible' (tidak ada titik bulat feasible), atau 'unbounded' (relaksasi kontinu tak
+    terbatas).
+    """
+    relaxed = solve_2d(constraints, g, h, sense, nonneg)
+    if relaxed.status != 'optimal':
+        return LPResult(relaxed.status, sense)
+    A, c, src, line = _halfplanes(constraints, nonneg)
+    vertices = _feasible_polygon(A, c, src, line)[0]
+    sign = 1.0 if sense == 'max' else -1.0
+    eps = 1e-9*max(1.0, abs(relaxed.x), abs(relaxed.y))
+
+    # Telusuri sumbu dengan rentang bulat terpendek; w adalah koefisien tujuan variabel lain
+    span = np.ptp(vertices, axis=0)
+    axis = 0 if span[0] <= span[1] else 1
+    coef = (g, h) if axis == 0 else (h, g)
+    u_min = int(np.ceil(vertices[:, axis].min() - eps))
+    u_max = int(np.floor(vertices[:, axis].max() + eps))
+    start = relaxed.vertices[relaxed.index][axis]
+
+    best_z, best_point = -np.inf, None
+    tol = 1e-9*max(1.0, abs(relaxed.z))
+
+    # Dua arah dari optimum kontinu; ukuran blok kolom berlipat dua setiap langkah (dibatasi)
+    for step, u0 in ((-1, int(np.floor(start))), (1, int(np.floor(start)) + 1)):
+        size = 8
+        while u_min <= u0 <= u_max:
+            end = max(u0 - size + 1, u_min) if step < 0 else min(u0 + size - 1, u_max)
+            u = np.arange(u0, end + step, step, dtype=np.float64)
+            lo, hi = _column_bounds(A, c, u, axis, eps)
+            # Nilai terbaik variabel lain: ujung interval yang searah koefisien tujuannya
+            up = sign*coef[1] > 0
+            v_cont = np.where(up, hi, lo)
+            v_cont = np.where(np.isfinite(v_cont), v_cont, np.where(up, lo, hi))
+            v_cont = np.where(np.isfinite(v_cont), v_cont, 0.0)
+            v = np.floor(v_cont + eps) if up else np.ceil(v_cont - eps)
+            if sign*coef[1] == 0:
+                v = np.clip(0.0, np.ceil(lo - eps), np.floor(hi + eps))
+            valid = (v >= lo - eps) & (v <= hi + eps)
+            z = sign*(coef[0]*u + coef[1]*v)
+            if np.any(valid):
+                k = int(np.argmax(np.where(valid, z, -np.inf)))
+                if z[k] > best_z + tol:
+                    best_z, best_point = z[k], (u[k], v[k])
+            # Batas atas kolom terakhir: kolom lebih jauh tidak mungkin lebih baik
+            bound = sign*(coef[0]*u[-1] + coef[1]*v_cont[-1])
+            if lo[-1] <= hi[-1] + eps and bound <= best_z + tol:
+                break
+            u0 = end + step
+            size = min(2*size, 65536)
+
+    if best_point is None:
+        return LPResult('infeasible', sense)
+    x, y = best_point if axis == 0 else best_point[::-1]
+    return LPResult('optimal', sense, [(float(x), float(y))], [float(g*x + h*y)],
+                    ["Titik bulat optimal"], 0)
+
+
+class FeasibleRegion:
+    """
+    Daerah feasible tetap untuk menjawab banyak fungsi tujuan (g, h) tanpa membangun ulang
+
+    Parameter:
+        constraints : Daftar batasan seperti pada solve_2d()
+        nonneg      : Tambahkan x ≥ 0 dan y ≥ 0 (default True)
+
+    Poligon dan kerucut resesinya dibangun sekali, O(m log m). Sudut normal luar sisi-sisi
+    poligon naik berurutan berlawanan arah jarum jam, sehingga titik optimal untuk satu arah
+    (g, h) dicari dengan pencarian biner atas sudut itu, O(log m) per query.
+    """
+
+    def __init__(self, constraints, nonneg=True):
+        self.constraints = list(constraints)
+        A, c, src, line = _halfplanes(self.constraints, nonneg)
+        self._polygon = _feasible_polygon(A, c, src, line)
+        self._cone = None if self._polygon is None else \
+            _feasible_polygon(A, np.zeros_like(c), src, line, bound=1.0)
+        if self._polygon is None:
+            return
+        vertices, edge_src = self._polygon
+        self._vertices = vertices + 0.0
+        self._on_box = (edge_src == _SRC_BOX) | (np.roll(edge_src, 1) == _SRC_BOX)
+        self._labels = [_vertex_label(edge_src[k - 1], edge_src[k]) for k in range(len(vertices))]
+        # Sudut normal luar sisi k (dari titik k ke k+1), diurutkan mulai dari yang terkecil
+        edge = np.roll(vertices, -1, axis=0) - vertices
+        angle = np.arctan2(-edge[:, 0], edge[:, 1])
+        self._start = int(np.argmin(angle)) if len(vertices) >= 3 else 0
+        self._angles = np.roll(angle, -self._start)
+
+    @property
+    def feasible(self):
+        return self._polygon is not None
+
+    @property
+    def vertices(self):
+        # Titik sudut asli (tanpa titik pada kotak bantu untuk daerah tak terbatas)
+        return self._vertices[~self._on_box] if self.feasible else np.empty((0, 2))
+
+    def _index(self, g, h, sign):
+        # Indeks titik sudut optimal untuk arah sign*(g, h); g dan h berupa array
+        vertices = self._vertices
+        n = len(vertices)
+        if n < 3:
+            # Daerah merosot (titik atau ruas garis): cukup bandingkan semua titik
+            return np.argmax(sign*(np.outer(g, vertices[:, 0]) + np.outer(h, vertices[:, 1])), axis=1)
+        theta = np.arctan2(sign*h, sign*g)
+        theta = np.where(theta < self._angles[0], theta + 2*np.pi, theta)
+        index = (np.searchsorted(self._angles, theta) % n + self._start) % n
+        # Di sisi sejajar tujuan kedua ujungnya sama baik; utamakan titik yang bukan kotak bantu
+        z = sign*(g*vertices[index, 0] + h*vertices[index, 1])
+        for shift in (-1, 1):
+            other = (index + shift) % n
+            z_other = sign*(g*vertices[other, 0] + h*vertices[other, 1])
+            tie = z_other >= z - 1e-9*np.maximum(1.0, np.abs(z))
+            index = np.where(self._on_box[index] & ~self._on_box[other] & tie, other, index)
+        # Tanpa arah tujuan semua titik sama baik; ambil titik asli pertama
+        zero = (g == 0) & (h == 0)
+        if np.any(zero):
+            index = np.where(zero, int(np.argmin(self._on_box)), index)
+        return index
+
+    def _unbounded(self, g, h, sign):
+        if self._cone is None:
+            return np.zeros(np.shape(g), dtype=bool)
+        d = self._cone[0]
+        along = sign*(np.outer(g, d[:, 0]) + np.outer(h, d[:, 1]))
+        return (along > 1e-9*np.maximum(np.maximum(np.abs(g), np.abs(h)), 1e-300)[:, None]).any(axis=1)
+
+    def solve(self, g, h, sense='max'):
+        """Titik optimal untuk Z = g*x + h*y; LPResult yang sama seperti solve_2d()."""
+        if sense not in ('max', 'min'):
+            raise ValueError(f"sense harus 'max' atau 'min', bukan {sense!r}")
+        if not self.feasible:
+            return LPResult('infeasible', sense)
+        sign = 1.0 if sense == 'max' else -1.0
+        g_arr, h_arr = np.array([g], dtype=np.float64), np.array([h], dtype=np.float64)
+        vertices = [tuple(v) for v in self._vertices.tolist()]
+        z_values = (self._vertices @ (g, h)).tolist()
+        if self._unbounded(g_arr, h_arr, sign)[0]:
+            return LPResult('unbounded', sense, vertices, z_values, self._labels)
+        index = int(self._index(g_arr, h_arr, sign)[0])
+        return LPResult('optimal', sense, vertices, z_values, self._labels, index)
+
+    def solve_many(self, g, h, sense='max'):
+        """
+        Versi vektor dari solve() untuk array g dan h (di-broadcast satu sama lain)
+
+        Mengembalikan dict berisi array x, y, z, dan vertex (indeks di dalam vertices,
+        -1 jika tidak ada titik optimal). z = ±inf jika tak terbatas, NaN jika tidak feasible.
+        """
+        if sense not in ('max', 'min'):
+            raise ValueError(f"sense harus 'max' atau 'min', bukan {sense!r}")
+        g, h = np.broadcast_arrays(np.asarray(g, dtype=np.float64), np.asarray(h, dtype=np.float64))
+        shape = g.shape
+        g, h = g.ravel(), h.ravel()
+        if not self.feasible:
+            nan = np.full(shape, np.nan)
+            return {'x': nan, 'y': nan.copy(), 'z': nan.copy(), 'vertex': np.full(shape, -1, dtype=np.intp)}
+        sign = 1.0 if sense == 'max' else -1.0
+        index = self._index(g, h, sign)
+        x, y = self._vertices[index, 0], self._vertices[index, 1]
+        z = g*x + h*y
+        unbounded = self._unbounded(g, h, sign)
+        x[unbounded] = y[unbounded] = np.nan
+        z[unbounded] = sign*np.inf
+        # Indeks terhadap vertices (tanpa titik kotak bantu)
+        real = np.cumsum(~self._on_box) - 1
+        vertex = np.where(unbounded | self._on_box[index], -1, real[index])
+        return {'x': x.reshape(shape), 'y': y.reshape(shape), 'z': z.reshape(shape),
+                'vertex': vertex.reshape(shape)}
+
+    def supported_vertices(self, first, second, sense='max'):
+        """
+        Titik sudut yang optimal untuk suatu bobot dari dua fungsi tujuan
+
+        Parameter:
+            first, second : Dua fungsi tujuan (g, h)
+            sense         : 'max' atau 'min' untuk keduanya
+
+        Tujuan gabungan (1 - w)*first + w*second untuk 0 ≤ w ≤ 1 menyapu sudut di antara
+        keduanya; titik yang dilewati adalah titik Pareto yang didukung (supported).
+        Mengembalikan dict berisi vertices (berurutan dari optimum first ke optimum second),
+        labels, dan weights (nilai w tempat titik optimal berganti, satu lebih sedikit dari
+        jumlah titik). Arah yang membuat Z tak terbatas dilewati.
+        """
+        if sense not in ('max', 'min'):
+            raise ValueError(f"sense harus 'max' atau 'min', bukan {sense!r}")
+        if not self.feasible:
+            return {'vertices': np.empty((0, 2)), 'labels': [], 'weights': np.empty(0)}
+        sign = 1.0 if sense == 'max' else -1.0
+        p, q = np.asarray(first, dtype=np.float64), np.asarray(second, dtype=np.float64)
+        turn = p[0]*q[1] - p[1]*q[0]
+        if abs(turn) <= 1e-12*np.hypot(*p)*np.hypot(*q) and p @ q < 0:
+            raise ValueError("Kedua fungsi tujuan berlawanan arah; bobot gabungan melewati nol")
+        n = len(self._vertices)
+        i = int(self._index(sign*p[:1], sign*p[1:], 1.0)[0])
+        j = int(self._index(sign*q[:1], sign*q[1:], 1.0)[0])
+        step = 1 if turn >= 0 else -1
+        path = [i]
+        while path[-1] != j and len(path) <= n:
+            path.append((path[-1] + step) % n)
+        # Bobot w tempat normal sisi di antara dua titik berurutan sejajar tujuan gabungan
+        weights = []
+        for k, l in zip(path[:-1], path[1:]):
+            e = self._vertices[l] - self._vertices[k]
+            a, b = e @ p, e @ q
+            weights.append(a/(a - b) if a != b else 0.0)
+        keep = [k for k in range(len(path)) if not self._on_box[path[k]]]
+        vertices = self._vertices[[path[k] for k in keep]]
+        weights = np.array([weights[k - 1] for k in keep[1:]], dtype=np.float64)
+        return {'vertices': vertices, 'labels': [self._labels[path[k]] for k in keep], 'weights': weights}
+
+
+class LPSolution:
+    """
+    Hasil solve_lp untuk program linear dengan n variabel
+
+    Atribut:
+        status     : 'optimal', 'unbounded', 'infeasible', atau 'iteration_limit'
+        sense      : 'max' atau 'min'
+        x          : Nilai optimal variabel keputusan (array berbentuk (n,), None jika tidak optimal)
+        z          : Nilai optimal fungsi tujuan (None jika tidak optimal)
+        iterations : Jumlah iterasi simplex (fase 1 + fase 2)
+        basis      : Indeks kolom basis akhir (variabel, lalu slack, lalu artifisial)
+    """
+    __slots__ = ('status', 'sense', 'x', 'z', 'iterations', 'basis')
+
+    def __init__(self, status, sense, x=None, z=None, iterations=0, basis=None):
+        self.status = status
+        self.sense = sense
+        self.x = x
+        self.z = z
+        self.iterations = iterations
+        self.basis = basis
+
+    def __repr__(self):
+        return f"LPSolution(status={self.status!r}, sense={self.sense!r}, z={self.z!r}, iterations={self.iterations})"
+
+
+class _BasisFactor:
+    # Faktorisasi LU basis (pivot parsial) dengan pembaruan bentuk-produk (eta)
+    # setelah setiap pivot; basis difaktorkan ulang setiap refactor_every pembaruan.
+
+    def __init__(self, B, refactor_every=64):
+        self.refactor_every = refactor_every
+        self.factor(B)
+
+    def factor(self, B):
+        m = B.shape[0]
+        LU = np.array(B, dtype=np.float64)
+        perm = np.arange(m)
+        for k in range(m - 1):
+            p = k + int(np.argmax(np.abs(LU[k:, k])))
+            if LU[p, k] == 0:
+                raise np.linalg.LinAlgError("Basis singular")
+            if p != k:
+                LU[[k, p]] = LU[[p, k]]
+                perm[[k, p]] = perm[[p, k]]
+            LU[k+1:, k] /= LU[k, k]
+            LU[k+1:, k+1:] -= np.outer(LU[k+1:, k], LU[k, k+1:])
+        if m and LU[m-1, m-1] == 0:
+            raise np.linalg.LinAlgError("Basis singular")
+        self.LU = LU
+        self.perm = perm
+        self.etas = []
+
+    def ftran(self, v):
+        # Selesaikan B x = v
+        LU = self.LU
+        x = np.array(v, dtype=np.float64)[self.perm]
+        m = LU.shape[0]
+        for k in range(m):
+            x[k+1:] -= LU[k+1:, k]*x[k]
+        for k in range(m - 1, -1, -1):
+            x[k] /= LU[k, k]
+            x[:k] -= LU[:k, k]*x[k]
+        for r, eta in self.etas:
+            xr = x[r]
+            x += eta*xr
+            x[r] = eta[r]*xr
+        return x
+
+    def btran(self, v):
+        # Selesaikan B^T y = v
+        LU = self.LU
+        y = np.array(v, dtype=np.float64)
+        for r, eta in reversed(self.etas):
+            y[r] = eta @ y
+        m = LU.shape[0]
+        for k in range(m):
+            y[k] = (y[k] - LU[:k, k] @ y[:k])/LU[k, k]
+        for k in range(m - 1, -1, -1):
+            y[k] -= LU[k+1:, k] @ y[k+1:]
+        out = np.empty_like(y)
+        out[self.perm] = y
+        return out
+
+    def update(self, r, w):
+        # Kolom basis ke-r diganti kolom dengan B^-1 a = w
+        eta = -w/w[r]
+        eta[r] = 1.0/w[r]
+        self.etas.append((r, eta))
+        return len(self.etas) >= self.refactor_every
+
+
+def solve_lp(c, A=None, senses=None, b=None, lower=None, upper=None, sense='max',
+             pricing='devex', max_iter=None, plot=False, x_max=None, y_max=None):
+    """
+    Selesaikan program linear n variabel dengan metode simplex revisi (NumPy padat)
+
+    Parameter:
+        c       : Koefisien fungsi tujuan, array berbentuk (n,) (Z = c @ x)
+        A       : Matriks koefisien batasan berbentuk (m, n)
+        senses  : Tanda setiap batasan ('<=', '>=', '=', juga '≤', '≥')
+        b       : Ruas kanan batasan berbentuk (m,)
+        lower   : Batas bawah variabel (default 0; -inf untuk variabel bebas)
+        upper   : Batas atas variabel (default +inf)
+        sense   : 'max' atau 'min'
+        pricing : 'devex' (pendekatan steepest-edge) atau 'bland'
+        max_iter: Batas jumlah iterasi (default 50*(m + n))
+        plot    : Jika True dan n == 2, tampilkan grafik isoline model ini dengan Problem.draw()
+        x_max   : Batas sumbu x untuk grafik (default dihitung dari titik potong sumbu)
+        y_max   : Batas sumbu y untuk grafik
+
+    Variabel berbatas ditangani langsung (nonbasis di batas bawah/atas), basis disimpan
+    sebagai faktor LU dengan pembaruan eta, dan fase 1 memakai variabel artifisial.
+    Jika pricing 'devex' mengalami banyak pivot degenerasi berturut-turut, pemilihan
+    beralih ke aturan Bland untuk mencegah siklus. Mengembalikan LPSolution.
+    """
+    if sense not in ('max', 'min'):
+        raise ValueError(f"sense harus 'max' atau 'min', bukan {sense!r}")
+    if pricing not in ('devex', 'bland'):
+        raise ValueError(f"pricing harus 'devex' atau 'bland', bukan {pricing!r}")
+    c = np.asarray(c, dtype=np.float64).ravel()
+    n = c.shape[0]
+    A = np.zeros((0, n)) if A is None else np.asarray(A, dtype=np.float64).reshape(-1, n)
+    m = A.shape[0]
+    b = np.zeros(0) if b is None else np.asarray(b, dtype=np.float64).ravel()
+    senses = [] if senses is None else list(senses)
+    if len(senses) != m or b.shape[0] != m:
+        raise ValueError("A, senses, dan b harus memiliki jumlah baris yang sama")
+    try:
+        signs = np.array([_SENSES[s] for s in senses], dtype=np.int8)
+    except KeyError as exc:
+        raise ValueError(f"Tanda batasan tidak dikenal: {exc.args[0]!r}") from None
+    lower = np.zeros(n) if lower is None else np.broadcast_to(np.asarray(lower, dtype=np.float64), (n,)).copy()
+    upper = np.full(n, np.inf) if upper is None else np.broadcast_to(np.asarray(upper, dtype=np.float64), (n,)).copy()
+    if np.any(lower > upper):
+        return LPSolution('infeasible', sense)
+
+    if plot and n == 2:
+        # Selesaikan dengan simplex, lalu gambar model yang sama lewat solve_2d()/Problem.draw()
+        res = solve_lp(c, A, senses, b, lower, upper, sense, pricing, max_iter)
+        _draw_2d(_as_2d(c, A, signs, b, lower, upper, sense), x_max, y_max, res.x)
+        return res
+
+    # Bentuk standar: A x + s = b, dengan batas slack [0, inf) untuk ≤, (-inf, 0] untuk ≥,
+    # dan [0, 0] untuk =
+    slack_lo = np.where(signs > 0, 0.0, np.where(signs < 0, -np.inf, 0.0))
+    slack_hi = np.where(signs > 0, np.inf, 0.0)
+    x_N = np.where(np.isfinite(lower), lower, np.where(np.isfinite(upper), upper, 0.0))
+    resid = b - A @ x_N
+    s_val = np.clip(resid, slack_lo, slack_hi)
+    gap = resid - s_val
+    art_rows = np.flatnonzero(np.abs(gap) > 1e-9*max(1.0, float(np.max(np.abs(b), initial=0.0))))
+    k = art_rows.shape[0]
+
+    art = np.zeros((m, k))
+    art[art_rows, np.arange(k)] = np.sign(gap[art_rows])
+    M = np.hstack([A, np.eye(m), art])
+    lo = np.concatenate([lower, slack_lo, np.zeros(k)])
+    hi = np.concatenate([upper, slack_hi, np.full(k, np.inf)])
+    x = np.concatenate([x_N, s_val, np.abs(gap[art_rows])])
+    basis = np.arange(n, n + m)
+    basis[art_rows] = n + m + np.arange(k)
+
+    cost = np.concatenate([-c if sense == 'max' else c, np.zeros(m + k)])
+    max_iter = 50*(m + n) if max_iter is None else max_iter
+    iterations = 0
+    status = 'optimal'
+    if k:
+        phase1 = np.concatenate([np.zeros(n + m), np.ones(k)])
+        status, iterations = _simplex(M, b, phase1, lo, hi, x, basis, pricing, max_iter)
+        if status != 'optimal' or phase1 @ x > 1e-7*max(1.0, float(np.max(np.abs(b)))):
+            status = 'iteration_limit' if status == 'iteration_limit' else 'infeasible'
+            return LPSolution(status, sense, iterations=iterations, basis=basis)
+        # Artifisial dikunci di nol untuk fase 2
+        hi[n + m:] = 0.0
+        x[n + m:] = 0.0
+    if status == 'optimal':
+        status, used = _simplex(M, b, cost, lo, hi, x, basis, pricing, max_iter - iterations)
+        iterations += used
+    if status != 'optimal':
+        return LPSolution(status, sense, iterations=iterations, basis=basis)
+    return LPSolution('optimal', sense, x[:n].copy(), float(c @ x[:n]), iterations, basis)
+
+
+def _simplex(M, b, cost, lo, hi, x, basis, pricing, max_iter):
+    # Iterasi simplex revisi variabel berbatas (minimasi), x dan basis diperbarui di tempat
+    m, total = M.shape
+    is_basic = np.zeros(total, dtype=bool)
+    is_basic[basis] = True
+    factor = _BasisFactor(M[:, basis])
+    weights = np.ones(total)
+    scale = max(1.0, float(np.max(np.abs(b), initial=0.0)))
+    ptol, dtol = 1e-9*scale, 1e-9
+    degenerate = 0
+
+    for it in range(max_iter):
+        x[basis] = factor.ftran(b - M[:, ~is_basic] @ x[~is_basic])
+        y = factor.btran(cost[basis])
+        d = cost - y @ M
+        # Variabel nonbasis yang dapat memperbaiki tujuan
+        can_up = (d < -dtol) & (x < hi - ptol)
+        can_down = (d > dtol) & (x > lo + ptol)
+        eligible = np.flatnonzero((can_up | can_down) & ~is_basic)
+        if eligible.size == 0:
+            return 'optimal', it
+        if pricing == 'bland' or degenerate > 50:
+            q = int(eligible[0])
+        else:
+            q = int(eligible[np.argmax(d[eligible]**2/weights[eligible])])
+        direction = 1.0 if d[q] < 0 else -1.0
+
+        # Uji rasio: basis bergerak x_B -= direction*theta*w
+        w = factor.ftran(M[:, q])
+        xb, lb, ub = x[basis], lo[basis], hi[basis]
+        step = direction*w
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ratio = np.where(step > 1e-11, (xb - lb)/step,
+                             np.where(step < -1e-11, (ub - xb)/-step, np.inf))
+        ratio = np.maximum(ratio, 0.0)
+        r = int(np.argmin(ratio)) if m else 0
+        theta = ratio[r] if m else np.inf
+        if m and (pricing == 'bland' or degenerate > 50) and np.isfinite(theta):
+            # Aturan Bland: dari rasio yang sama, keluarkan variabel dengan indeks terkecil
+            ties = np.flatnonzero(ratio <= theta + 1e-12)
+            r = int(ties[np.argmin(basis[ties])])
+        flip = hi[q] - lo[q]
+        if flip <= theta:
+            # Variabel masuk langsung berpindah ke batas lainnya
+            if not np.isfinite(flip):
+                return 'unbounded', it
+            x[q] = hi[q] if direction > 0 else lo[q]
+            degenerate = 0
+            continue
+        if not np.isfinite(theta):
+            return 'unbounded', it
+        degenerate = degenerate + 1 if theta <= ptol else 0
+
+        # Pivot: variabel keluar ke batas yang dicapainya
+        leaving = basis[r]
+        x[q] += direction*theta
+        x[basis] = xb - step*theta
+        x[leaving] = lo[leaving] if step[r] > 0 else hi[leaving]
+        if pricing == 'devex':
+            # Pembaruan bobot devex dari baris pivot
+            alpha = factor.btran(np.eye(m)[r]) @ M
+            ratio_w = (alpha/alpha[q])**2*weights[q]
+            weights = np.where(is_basic, weights, np.maximum(weights, ratio_w))
+            weights[leaving] = max(weights[q]/alpha[q]**2, 1.0)
+        basis[r] = q
+        is_basic[q] = True
+        is_basic[leaving] = False
+        if factor.update(r, w):
+            factor.factor(M[:, basis])
+    return 'iteration_limit', max_iter
+
+
+def _as_2d(c, A, signs, b, lower, upper, sense):
+    # Argumen solve_2d() untuk model 2 variabel; batas variabel selain x, y ≥ 0 menjadi batasan
+    constraints = [(a1, a2, _SIGN_NAMES[sign], r) for (a1, a2), sign, r
+                   in zip(np.asarray(A).tolist(), np.asarray(signs).tolist(), np.asarray(b).tolist())]
+    nonneg = bool(np.all(lower == 0))
+    for k, (a1, a2) in enumerate(((1.0, 0.0), (0.0, 1.0))):
+        if not nonneg and np.isfinite(lower[k]):
+            constraints.append((a1, a2, '>=', float(lower[k])))
+        if np.isfinite(upper[k]):
+            constraints.append((a1, a2, '<=', float(upper[k])))
+    g, h = np.asarray(c).tolist()
+    return {'constraints': constraints, 'g': g, 'h': h, 'sense': sense, 'nonneg': nonneg}
+
+
+def _draw_2d(planar, x_max, y_max, point=None):
+    # Gambar model 2 variabel (argumen solve_2d) dengan Problem.draw(); batas sumbu default
+    # dihitung dari titik potong sumbu dan titik optimal
+    _load_matplotlib()
+    if x_max is None or y_max is None:
+        reach = [abs(c/a) for a, b, _, c in planar['constraints'] if a] + \
+                [abs(c/b) for a, b, _, c in planar['constraints'] if b]
+        if point is not None:
+            reach += [abs(point[0]), abs(point[1])]
+        limit = 1.2*max(reach, default=1.0) or 1.0
+        x_max = limit if x_max is None else x_max
+        y_max = limit if y_max is None else y_max
+    Problem(**planar, x_max=x_max, y_max=y_max).draw()
+    plt.show()
+
+
+_SIGN_NAMES = {1: '<=', -1: '>=', 0: '='}
+_LP_SIGNS = {'<=': 1, '=<': 1, '<': 1, '>=': -1, '=>': -1, '>': -1, '=': 0}
+_MPS_ROW_TYPES = {'L': 1, 'G': -1, 'E': 0}
+_MPS_SECTIONS = ('NAME', 'OBJSENSE', 'ROWS', 'COLUMNS', 'RHS', 'RANGES', 'BOUNDS', 'ENDATA')
+_MODEL_CHUNK = 1 << 16
+_ROW_OBJECTIVE = -1   # baris N pertama di MPS (fungsi tujuan)
+_ROW_FREE = -2        # baris N lain, diabaikan
+
+
+class LPModel:
+    """
+    Model program linear hasil read_mps() atau read_lp(), matriks batasan dalam bentuk CSR
+
+    Atribut:
+        name      : Nama model
+        sense     : 'max' atau 'min'
+        c         : Koefisien fungsi tujuan berbentuk (n,)
+        offset    : Konstanta fungsi tujuan (ditambahkan ke Z)
+        indptr    : Posisi awal setiap baris di indices/data, berbentuk (m + 1,)
+        indices   : Indeks kolom setiap koefisien tak nol (int32)
+        data      : Nilai setiap koefisien tak nol
+        signs     : Tanda batasan: 1 untuk ≤, -1 untuk ≥, 0 untuk = (int8)
+        b         : Ruas kanan batasan berbentuk (m,)
+        lower     : Batas bawah variabel (default 0)
+        upper     : Batas atas variabel (default +inf)
+        integer   : Penanda variabel bulat (bool)
+        var_names : Nama variabel
+        row_names : Nama batasan; batasan berjangkauan menjadi dua baris (≥ lalu ≤) bernama sama
+    """
+    __slots__ = ('name', 'sense', 'c', 'offset', 'indptr', 'indices', 'data', 'signs', 'b',
+                 'lower', 'upper', 'integer', 'var_names', 'row_names')
+
+    def __init__(self, name, sense, c, offset, indptr, indices, data, signs, b, lower, upper,
+                 integer, var_names, row_names):
+        self.name = name
+        self.sense = sense
+        self.c = c
+        self.offset = offset
+        self.indptr = indptr
+        self.indices = indices
+        self.data = data
+        self.signs = signs
+        self.b = b
+        self.lower = lower
+        self.upper = upper
+        self.integer = integer
+        self.var_names = var_names
+        self.row_names = row_names
+
+    @property
+    def shape(self):
+        return len(self.b), len(self.c)
+
+    @property
+    def nnz(self):
+        return len(self.data)
+
+    def __repr__(self):
+        return f"LPModel(name={self.name!r}, sense={self.sense!r}, shape={self.shape}, nnz={self.nnz})"
+
+    def dense(self):
+        """Matriks batasan padat berbentuk (m, n); koefisien ganda pada satu sel dijumlahkan"""
+        m, n = self.shape
+        A = np.zeros((m, n))
+        np.add.at(A, (np.repeat(np.arange(m), np.diff(self.indptr)), self.indices), self.data)
+        return A
+
+    def as_2d(self):
+        """
+        Argumen solve_2d() untuk model 2 variabel, dict berisi constraints, g, h, sense, nonneg
+
+        Batas variabel selain x, y ≥ 0 ditambahkan sebagai batasan biasa.
+        """
+        if len(self.c) != 2:
+            raise ValueError(f"as_2d() hanya untuk model 2 variabel, model ini memiliki {len(self.c)}")
+        return _as_2d(self.c, self.dense(), self.signs, self.b, self.lower, self.upper, self.sense)
+
+    def solve(self, plot=False, x_max=None, y_max=None, **options):
+        """
+        Selesaikan model: 2 variabel dengan solve_2d(), lebih dari itu dengan solve_lp()
+
+        Parameter:
+            plot    : Untuk model 2 variabel, gambar grafik isoline dengan Problem.draw()
+            x_max   : Batas sumbu x untuk grafik (default dihitung dari titik potong sumbu)
+            y_max   : Batas sumbu y untuk grafik
+            options : Diteruskan ke solve_lp() (pricing, max_iter)
+
+        Model 2 variabel yang kedua variabelnya bulat diselesaikan dengan solve_integer();
+        pada model yang lebih besar syarat bulat diabaikan (relaksasi LP). solve_lp() memakai
+        matriks padat, jadi model besar dibaca cepat tetapi penyelesaiannya sebanding dengan
+        m*n. Mengembalikan LPResult (2 variabel) atau LPSolution; Z sudah termasuk offset.
+        """
+        if len(self.c) == 2:
+            planar = self.as_2d()
+            res = (solve_integer if self.integer.all() else solve_2d)(**planar)
+            if self.offset:
+                res.z_values = [z + self.offset for z in res.z_values]
+            if plot:
+                _draw_2d(planar, x_max, y_max, None if res.index is None else (res.x, res.y))
+            return res
+        res = solve_lp(self.c, self.dense(), [_SIGN_NAMES[s] for s in self.signs.tolist()], self.b,
+                       self.lower, self.upper, self.sense, **options)
+        if res.z is not None:
+            res.z += self.offset
+        return res
+
+
+class _Entries:
+    # Koefisien (baris, kolom, nilai) dikumpulkan dalam array bertipe (array.array, tanpa objek
+    # Python per koefisien) per potongan lalu dipadatkan ke array NumPy
+
+    def __init__(self):
+        self.rows, self.cols, self.vals = array('i'), array('i'), array('d')
+        self._blocks = []
+
+    def flush(self):
+        if self.rows:
+            self._blocks.append((np.frombuffer(self.rows, dtype=np.intc).astype(np.int32),
+                                 np.frombuffer(self.cols, dtype=np.intc).astype(np.int32),
+                                 np.frombuffer(self.vals, dtype=np.float64).copy()))
+            # Kosongkan di tempat: pembaca memegang alias ke array ini
+            del self.rows[:], self.cols[:], self.vals[:]
+
+    def arrays(self):
+        self.flush()
+        if not self._blocks:
+            return np.zeros(0, np.int32), np.zeros(0, np.int32), np.zeros(0)
+        return tuple(np.concatenate(part) for part in zip(*self._blocks))
+
+
+def _build_model(name, sense, var_names, c, offset, entries, signs, b, ranges, row_names,
+                 lower, upper, integer):
+    # Rakit LPModel: batasan berjangkauan {baris: (bawah, atas)} menjadi baris ≥ ditambah
+    # salinan ≤, lalu koefisien COO diurutkan per baris menjadi CSR
+    rows, cols, vals = entries.arrays()
+    signs = np.asarray(signs, dtype=np.int8)
+    b = np.asarray(b, dtype=np.float64)
+    if ranges:
+        ranged = np.fromiter(ranges, dtype=np.int64, count=len(ranges))
+        low, high = np.array(list(ranges.values()), dtype=np.float64).reshape(-1, 2).T
+        m = len(b)
+        signs[ranged] = -1
+        b[ranged] = low
+        copy = np.full(m, -1, dtype=np.int64)
+        copy[ranged] = m + np.arange(len(ranged))
+        mask = copy[rows] >= 0
+        rows = np.concatenate([rows, copy[rows[mask]].astype(np.int32)])
+        cols = np.concatenate([cols, cols[mask]])
+        vals = np.concatenate([vals, vals[mask]])
+        signs = np.concatenate([signs, np.ones(len(ranged), dtype=np.int8)])
+        b = np.concatenate([b, high])
+        row_names = row_names + [row_names[r] for r in ranged.tolist()]
+    order = np.argsort(rows, kind='stable')
+    indptr = np.zeros(len(b) + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=len(b)), out=indptr[1:])
+    return LPModel(name, sense, c, offset, indptr, cols[order], vals[order], signs, b,
+                   lower, upper, np.asarray(integer, dtype=bool), var_names, row_names)
+
+
+def _open_model(path):
+    path = os.fspath(path)
+    if path.endswith('.gz'):
+        import gzip
+        return gzip.open(path, 'rt')
+    return open(path)
+
+
+def _mps_sense(token):
+    token = token.upper()
+    if token.startswith('MAX'):
+        return 'max'
+    if token.startswith('MIN'):
+        return 'min'
+    raise ValueError(f"OBJSENSE tidak dikenal: {token!r}")
+
+
+def read_mps(path):
+    """
+    Baca model dari berkas MPS (format bebas, atau format tetap tanpa spasi di dalam nama)
+
+    Parameter:
+        path : Path berkas; akhiran .gz dibaca dengan gzip
+
+    Berkas dibaca baris demi baris. Koefisien COLUMNS diurai saat barisnya dibaca, dikumpulkan
+    dalam array bertipe per potongan, dan dipadatkan ke array NumPy, sehingga memori sebanding
+    dengan jumlah koefisien tak nol.
+    Mendukung NAME, OBJSENSE, ROWS, COLUMNS (termasuk penanda INTORG/INTEND), RHS (RHS
+    pada baris tujuan menjadi -offset), RANGES, dan BOUNDS (UP, LO, FX, FR, MI, PL, BV, LI,
+    UI). Mengembalikan LPModel.
+    """
+    name, sense, section = '', 'min', None
+    row_index, row_names, signs = {}, [], []
+    has_objective = False
+    var_index, var_names, integer = {}, [], []
+    obj_cols, obj_vals = array('i'), array('d')
+    entries = _Entries()
+    rows, cols, vals = entries.rows, entries.cols, entries.vals
+    b, ranges, bounds = None, {}, []
+    offset = 0.0
+    marked = False
+    last, j = None, -1
+    with _open_model(path) as stream:
+        for number, line in enumerate(stream, 1):
+            tokens = line.split()
+            if not tokens or tokens[0][0] == '*':
+                continue
+            if line[0] not in ' \t':
+                section = tokens[0].upper()
+                if section not in _MPS_SECTIONS:
+                    raise ValueError(f"Baris {number}: bagian MPS tidak dikenal {tokens[0]!r}")
+                if section == 'NAME':
+                    name = ' '.join(tokens[1:])
+                elif section == 'OBJSENSE' and len(tokens) > 1:
+                    sense = _mps_sense(tokens[1])
+                elif section == 'ENDATA':
+                    break
+                if b is None and section in ('COLUMNS', 'RHS', 'RANGES', 'BOUNDS'):
+                    b = np.zeros(len(signs))
+                continue
+            try:
+                if section == 'COLUMNS':
+                    if tokens[1] == "'MARKER'":
+                        marked = tokens[2] == "'INTORG'"
+                        continue
+                    if tokens[0] != last:
+                        last = tokens[0]
+                        j = var_index.setdefault(last, len(var_names))
+                        if j == len(var_names):
+                            var_names.append(last)
+                            integer.append(marked)
+                    # Satu atau dua pasang (baris, nilai) per baris, ditulis tanpa loop
+                    r = row_index[tokens[1]]
+                    if r >= 0:
+                        rows.append(r)
+                        cols.append(j)
+                        vals.append(float(tokens[2]))
+                    elif r == _ROW_OBJECTIVE:
+                        obj_cols.append(j)
+                        obj_vals.append(float(tokens[2]))
+                    if len(tokens) > 3:
+                        r = row_index[tokens[3]]
+                        if r >= 0:
+                            rows.append(r)
+                            cols.append(j)
+                            vals.append(float(tokens[4]))
+                        elif r == _ROW_OBJECTIVE:
+                            obj_cols.append(j)
+                            obj_vals.append(float(tokens[4]))
+                    if len(rows) >= _MODEL_CHUNK:
+                        entries.flush()
+                elif section == 'ROWS':
+                    kind, row = tokens[0].upper(), tokens[1]
+                    if kind == 'N':
+                        row_index[row] = _ROW_FREE if has_objective else _ROW_OBJECTIVE
+                        has_objective = True
+                    else:
+                        row_index[row] = len(signs)
+                        signs.append(_MPS_ROW_TYPES[kind])
+                        row_names.append(row)
+                elif section in ('RHS', 'RANGES'):
+                    # Nama set (kolom pertama) boleh tidak ada
+                    pairs = tokens[len(tokens) % 2:]
+                    for k in range(0, len(pairs), 2):
+                        r, value = row_index[pairs[k]], float(pairs[k + 1])
+                        if section == 'RANGES':
+                            if r >= 0:
+                                ranges[r] = value
+                        elif r >= 0:
+                            b[r] = value
+                        elif r == _ROW_OBJECTIVE:
+                            offset = -value
+                elif section == 'BOUNDS':
+                    kind = tokens[0].upper()
+                    if kind in ('FR', 'MI', 'PL', 'BV'):
+                        col = tokens[2] if len(tokens) > 2 and tokens[2] in var_index else tokens[1]
+                        bounds.append((kind, var_index[col], None))
+                    else:
+                        col = tokens[2] if len(tokens) > 3 else tokens[1]
+                        bounds.append((kind, var_index[col], float(tokens[-1])))
+                elif section == 'OBJSENSE':
+                    sense = _mps_sense(tokens[0])
+                else:
+                    raise ValueError(f"data di luar bagian yang dikenal ({section})")
+            except (KeyError, IndexError, ValueError) as exc:
+                reason = f"nama {exc} tidak dikenal" if isinstance(exc, KeyError) else exc
+                raise ValueError(f"Baris {number} tidak valid: {line.strip()!r} ({reason})") from None
+
+    n = len(var_names)
+    b = np.zeros(len(signs)) if b is None else b
+    c = np.zeros(n)
+    np.add.at(c, np.frombuffer(obj_cols, dtype=np.intc), np.frombuffer(obj_vals, dtype=np.float64))
+    lower, upper = np.zeros(n), np.full(n, np.inf)
+    for kind, j, value in bounds:
+        if kind in ('UP', 'UI'):
+            upper[j] = value
+            if value < 0 and lower[j] == 0:
+                # Konvensi MPS: batas atas negatif tanpa batas bawah berarti variabel bebas ke bawah
+                lower[j] = -np.inf
+        elif kind in ('LO', 'LI'):
+            lower[j] = value
+        elif kind == 'FX':
+            lower[j] = upper[j] = value
+        elif kind == 'FR':
+            lower[j], upper[j] = -np.inf, np.inf
+        elif kind == 'MI':
+            lower[j] = -np.inf
+        elif kind == 'PL':
+            upper[j] = np.inf
+        elif kind == 'BV':
+            lower[j], upper[j] = 0.0, 1.0
+        else:
+            raise ValueError(f"Jenis batas MPS belum didukung: {kind!r}")
+        if kind in ('UI', 'LI', 'BV'):
+            integer[j] = True
+
+    # RANGES R: L → [b - |R|, b], G → [b, b + |R|], E → [b, b + R] atau [b + R, b]
+    intervals = {}
+    for r, value in ranges.items():
+        s = signs[r]
+        if s > 0:
+            intervals[r] = (b[r] - abs(value), b[r])
+        elif s < 0:
+            intervals[r] = (b[r], b[r] + abs(value))
+        else:
+            intervals[r] = (b[r], b[r] + value) if value >= 0 else (b[r] + value, b[r])
+    return _build_model(name, sense, var_names, c, offset, entries, signs, b, intervals, row_names,
+                        lower, upper, integer)
+
+
+_LP_TOKEN = re.compile(r"=<|=>|[<>=]=?|[+\-]|(?:\d+\.?\d*|\.\d+)(?:[eE][+\-]?\d+)?|[^\s<>=+\-:]+|:")
+_LP_SECTION = re.compile(
+    r"\s*(maximi[sz]e|maximum|max|minimi[sz]e|minimum|min|subject\s+to|such\s+that|s\.t\.|st\.?"
+    r"|bounds?|generals?|gen|integers?|binar(?:y|ies)|bin|semi-continuous|semis?|sos|end)(?=\s|$)",
+    re.IGNORECASE)
+
+
+def _lp_number(token):
+    # Angka (termasuk inf/infinity) atau None jika token adalah nama
+    if token[0].isdigit() or token[0] == '.':
+        return float(token)
+    if token.lower() in ('inf', 'infinity'):
+        return np.inf
+    return None
+
+
+def read_lp(path):
+    """
+    Baca model dari berkas format LP CPLEX
+
+    Parameter:
+        path : Path berkas; akhiran .gz dibaca dengan gzip
+
+    Mendukung bagian Maximize/Minimize (konstanta di posisi mana pun menjadi offset), Subject
+    To (batasan boleh terbagi beberapa baris, bernama 'nama:' atau tanpa nama, konstanta di
+    ruas kiri dipindah ke ruas kanan, juga bentuk berjangkauan 'bawah <= ekspresi <= atas'), Bounds (termasuk 'free' dan -inf/inf), General, dan Binary.
+    Komentar diawali '\\'. Token dibaca baris demi baris dan koefisien dipadatkan ke array
+    NumPy per potongan. Urutan variabel mengikuti kemunculan pertama. Mengembalikan LPModel.
+    """
+    sense, section = 'min', None
+    var_index, var_names = {}, []
+    objective, offset = {}, 0.0
+    entries = _Entries()
+    rows, cols, vals = entries.rows, entries.cols, entries.vals
+    signs, b, row_names, ranges = [], [], [], {}
+    bounds, integer, binary = [], set(), set()
+    # Keadaan batasan/fungsi tujuan yang sedang dibaca (boleh melewati beberapa baris)
+    state = {'name': None, 'terms': [], 'sign': 1.0, 'coef': None, 'constant': 0.0,
+             'op': None, 'low': None}
+
+    def variable(token):
+        j = var_index.get(token)
+        if j is None:
+            if '[' in token or '^' in token:
+                raise ValueError("suku kuadratik belum didukung")
+            j = var_index[token] = len(var_names)
+            var_names.append(token)
+        return j
+
+    def reset():
+        state.update(name=None, terms=[], sign=1.0, coef=None, constant=0.0, op=None, low=None)
+
+    def finish_objective():
+        nonlocal offset
+        for j, value in state['terms']:
+            objective[j] = objective.get(j, 0.0) + value
+        offset += state['constant'] + (state['coef'] or 0.0)
+        reset()
+
+    def expression(tokens, constraint):
+        # Keadaan dibaca ke variabel lokal untuk satu baris, lalu disimpan kembali
+        name, terms, sign, coef, constant, op, low = (
+            state['name'], state['terms'], state['sign'], state['coef'], state['constant'],
+            state['op'], state['low'])
+        i, count = 0, len(tokens)
+        while i < count:
+            token = tokens[i]
+            head = token[0]
+            if head in '<>=':
+                if not constraint:
+                    raise ValueError("tanda pembanding di fungsi tujuan")
+                if op is None and not terms and coef is not None:
+                    # Bentuk berjangkauan: bawah <= ekspresi <= atas
+                    low, coef = (coef, _LP_SIGNS[token]), None
+                else:
+                    if coef is not None:
+                        constant, coef = constant + coef, None
+                    op = _LP_SIGNS[token]
+            elif head in '+-':
+                if coef is not None:
+                    # Angka yang tidak diikuti nama variabel adalah konstanta
+                    constant, coef = constant + coef, None
+                if head == '-':
+                    sign = -sign
+            elif token == ':':
+                raise ValueError("':' tanpa nama")
+            else:
+                if head.isdigit() or head == '.':
+                    value = float(token)
+                elif head in 'iI' and token.lower() in ('inf', 'infinity'):
+                    value = np.inf
+                else:
+                    value = None
+                if value is None:
+                    if i + 1 < count and tokens[i + 1] == ':':
+                        name = token
+                        i += 1
+                    else:
+                        j = var_index.get(token)
+                        terms.append((variable(token) if j is None else j,
+                                      sign if coef is None else sign*coef))
+                        sign, coef = 1.0, None
+                elif op is not None:
+                    emit(name, terms, op, low, sign*value - constant)
+                    name, terms, sign, coef, constant, op, low = None, [], 1.0, None, 0.0, None, None
+                else:
+                    coef = sign*value if coef is None else coef*sign*value
+                    sign = 1.0
+            i += 1
+        state.update(name=name, terms=terms, sign=sign, coef=coef, constant=constant, op=op, low=low)
+
+    def emit(name, terms, op, low, rhs):
+        r = len(signs)
+        for j, value in terms:
+            rows.append(r)
+            cols.append(j)
+            vals.append(value)
+        if len(rows) >= _MODEL_CHUNK:
+            entries.flush()
+        signs.append(op)
+        b.append(rhs)
+        row_names.append(name or f"R{r + 1}")
+        if low is not None:
+            # bawah op' ekspresi op atas: kedua tanda harus sama arah dan bukan '='
+            limit, low_op = low
+            if low_op == 0 or op == 0 or low_op != op:
+                raise ValueError("batasan berjangkauan harus berbentuk bawah <= ekspresi <= atas")
+            ranges[r] = (limit, rhs) if op > 0 else (rhs, limit)
+
+    def bound(tokens):
+        items = []
+        sign = 1.0
+        for token in tokens:
+            if token in '+-':
+                sign = -sign if token == '-' else sign
+                continue
+            value = _lp_number(token)
+            items.append(token if value is None else sign*value)
+            sign = 1.0
+        if len(items) == 2 and isinstance(items[1], str) and items[1].lower() == 'free':
+            bounds.append((variable(items[0]), -np.inf, np.inf))
+        elif len(items) == 3 and isinstance(items[0], str):
+            op = _LP_SIGNS[items[1]]
+            bounds.append((variable(items[0]), items[2] if op <= 0 else None, items[2] if op >= 0 else None))
+        elif len(items) == 3:
+            op = _LP_SIGNS[items[1]]
+            bounds.append((variable(items[2]), items[0] if op >= 0 else None, items[0] if op <= 0 else None))
+        elif len(items) == 5 and isinstance(items[2], str):
+            low_op, high_op = _LP_SIGNS[items[1]], _LP_SIGNS[items[3]]
+            if low_op != 1 or high_op != 1:
+                raise ValueError("batas berjangkauan harus berbentuk bawah <= x <= atas")
+            bounds.append((variable(items[2]), items[0], items[4]))
+        else:
+            raise ValueError("bentuk batas tidak dikenal")
+
+    with _open_model(path) as stream:
+        for number, line in enumerate(stream, 1):
+            line = line.split('\\', 1)[0]
+            try:
+                match = _LP_SECTION.match(line)
+                if match:
+                    if section == 'objective':
+                        finish_objective()
+                    elif section == 'constraints' and (state['terms'] or state['op'] is not None):
+                        raise ValueError("batasan belum lengkap sebelum bagian baru")
+                    keyword = match.group(1).lower()
+                    line = line[match.end():]
+                    if keyword.startswith('max'):
+                        section, sense = 'objective', 'max'
+                    elif keyword.startswith('min'):
+                        section, sense = 'objective', 'min'
+                    elif keyword.startswith(('s', 'such')) and not keyword.startswith(('semi', 'sos')):
+                        section = 'constraints'
+                    elif keyword.startswith('bound'):
+                        section = 'bounds'
+                    elif keyword.startswith(('gen', 'int')):
+                        section = 'integer'
+                    elif keyword.startswith('bin'):
+                        section = 'binary'
+                    elif keyword == 'end':
+                        break
+                    else:
+                        raise ValueError(f"bagian {match.group(1)!r} belum didukung")
+                tokens = _LP_TOKEN.findall(line)
+                if not tokens:
+                    continue
+                if section in ('objective', 'constraints'):
+                    expression(tokens, section == 'constraints')
+                elif section == 'bounds':
+                    bound(tokens)
+                elif section in ('integer', 'binary'):
+                    marked = [variable(token) for token in tokens]
+                    integer.update(marked)
+                    if section == 'binary':
+                        binary.update(marked)
+                else:
+                    raise ValueError("data sebelum bagian Maximize/Minimize")
+            except (KeyError, ValueError) as exc:
+                reason = f"tanda {exc} tidak dikenal" if isinstance(exc, KeyError) else exc
+                raise ValueError(f"Baris {number} tidak valid: {line.strip()!r} ({reason})") from None
+    if section == 'objective':
+        finish_objective()
+    elif state['terms'] or state['op'] is not None:
+        raise ValueError("Batasan terakhir belum lengkap (ruas kanan tidak ada)")
+
+    n = len(var_names)
+    c = np.zeros(n)
+    if objective:
+        c[list(objective)] = list(objective.values())
+    lower, upper = np.zeros(n), np.full(n, np.inf)
+    for j in binary:
+        lower[j], upper[j] = 0.0, 1.0
+    for j, low, high in bounds:
+        if low is not None:
+            lower[j] = low
+        if high is not None:
+            upper[j] = high
+    flags = np.zeros(n, dtype=bool)
+    flags[list(integer)] = True
+    return _build_model('', sense, var_names, c, offset, entries, signs, b, ranges, row_names,
+                        lower, upper, flags)
+
+
+def read_model(path):
+    """
+    Baca model MPS atau LP; format dari ekstensi (.mps, .lp, boleh diikuti .gz)
+
+    Mengembalikan LPModel; model.solve() meneruskannya ke solve_2d() untuk 2 variabel
+    atau ke solve_lp() untuk lebih banyak variabel.
+    """
+    stem = os.fspath(path).lower().removesuffix('.gz')
+    if stem.endswith(('.mps', '.fmps')):
+        return read_mps(path)
+    if stem.endswith('.lp'):
+        return read_lp(path)
+    raise ValueError(f"Format model tidak dikenal dari ekstensi: {os.fspath(path)!r} (gunakan .mps atau .lp)")
+
+
+class PhaseStats:
+    """
+    Pencatat waktu dan alokasi per fase untuk maximize/minimize/optimize (argumen stats=)
+
+    Parameter:
+        trace_memory : Catat juga puncak memori per fase dengan tracemalloc (lebih lambat)
+        callback     : Fungsi yang dipanggil dengan dict setiap fase yang selesai (opsional)
+
+    Setiap fase mencatat waktu mulai, durasi, dan perubahan jumlah blok memori yang
+    dialokasikan (sys.getallocatedblocks). Selain fase, count() menyimpan jumlah seperti
+    titik sudut, isoline, dan artist. Satu objek bisa dipakai untuk banyak grafik; hasilnya
+    diekspor dengan to_dict() atau to_chrome_trace() (dibuka di chrome://tracing atau Perfetto).
+    """
+
+    def __init__(self, trace_memory=False, callback=None):
+        self.trace_memory = trace_memory
+        self.callback = callback
+        self.phases = []
+        self.counts = {}
+        self._origin = time.perf_counter()
+        self._open = None
+
+    def mark(self, name):
+        """Akhiri fase yang sedang berjalan (jika ada) dan mulai fase name"""
+        self.end()
+        if self.trace_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+        self._open = (name, time.perf_counter(), sys.getallocatedblocks())
+
+    def end(self):
+        """Akhiri fase yang sedang berjalan"""
+        if self._open is None:
+            return
+        name, start, blocks = self._open
+        now = time.perf_counter()
+        self._open = None
+        record = {'name': name, 'start': start - self._origin, 'duration': now - start,
+                  'blocks': sys.getallocatedblocks() - blocks}
+        if self.trace_memory:
+            record['peak_bytes'] = tracemalloc.get_traced_memory()[1]
+        self.phases.append(record)
+        if self.callback is not None:
+            self.callback(record)
+
+    @contextmanager
+    def phase(self, name):
+        """Context manager untuk mencatat satu fase di kode pemanggil (misalnya savefig)"""
+        self.mark(name)
+        try:
+            yield self
+        finally:
+            self.end()
+
+    def count(self, name, value):
+        """Tambahkan value ke hitungan name"""
+        self.counts[name] = self.counts.get(name, 0) + value
+
+    def totals(self):
+        """Total durasi (detik) per nama fase"""
+        totals = {}
+        for record in self.phases:
+            totals[record['name']] = totals.get(record['name'], 0.0) + record['duration']
+        return totals
+
+    def to_dict(self):
+        return {'phases': [dict(record) for record in self.phases], 'totals': self.totals(),
+                'counts': dict(self.counts)}
+
+    def to_chrome_trace(self, path=None):
+        """
+        Ekspor ke format Chrome trace-event (dict dengan 'traceEvents', waktu dalam mikrodetik)
+
+        Jika path diisi, hasilnya juga ditulis sebagai JSON ke berkas tersebut.
+        """
+        pid = os.getpid()
+        events = []
+        for record in self.phases:
+            args = {k: v for k, v in record.items() if k not in ('name', 'start', 'duration')}
+            events.append({'name': record['name'], 'cat': 'isoline', 'ph': 'X', 'pid': pid, 'tid': 0,
+                           'ts': record['start']*1e6, 'dur': record['duration']*1e6, 'args': args})
+        end = max((r['start'] + r['duration'] for r in self.phases), default=0.0)
+        for name, value in self.counts.items():
+            events.append({'name': name, 'cat': 'isoline', 'ph': 'C', 'pid': pid, 'tid': 0,
+                           'ts': end*1e6, 'args': {name: value}})
+        trace = {'traceEvents': events, 'displayTimeUnit': 'ms'}
+        if path is not None:
+            with open(path, 'w') as fh:
+                json.dump(trace, fh)
+        return trace
+
+
+class _NoStats:
+    # Pengganti PhaseStats saat stats=None: semua metode tidak melakukan apa-apa
+
+    def mark(self, name):
+        pass
+
+    def end(self):
+        pass
+
+    def count(self, name, value):
+        pass
+
+
+_NO_STATS = _NoStats()
+
+
+def _load_matplotlib():
+    # Impor matplotlib (dan backend-nya) sekali, hanya oleh fungsi yang menggambar
+    global plt, LineCollection, LinearSegmentedColormap, Polygon, Bbox, Slider
+    if plt is None:
+        import matplotlib.pyplot as plt
+        from matplotlib.collections import LineCollection
+        from matplotlib.colors import LinearSegmentedColormap
+        from matplotlib.patches import Polygon
+        from matplotlib.transforms import Bbox
+        from matplotlib.widgets import Slider
+
+
+# Peta warna isoline dibuat sekali per daftar warna
+_COLORMAPS = {}
+
+
+def _colormap(colors):
+    colors = tuple(colors)
+    if colors not in _COLORMAPS:
+        _COLORMAPS[colors] = LinearSegmentedColormap.from_list('isoline', list(colors))
+    return _COLORMAPS[colors]
+
+
+class FigurePool:
+    """
+    Kumpulan kecil Figure/Axes yang dipakai ulang oleh maximize, minimize, dan optimize
+
+    Parameter:
+        size    : Jumlah figure maksimum di dalam pool
+        figsize : Ukuran figure (default sama seperti fungsi plot)
+
+    Setiap panggilan mengambil figure berikutnya secara bergiliran; figure ke-(size + 1)
+    memakai ulang yang paling lama. Saat dipakai ulang hanya artist data (garis, koleksi,
+    patch, teks, inset, legenda) yang dibuang, sedangkan figure, axes, sumbu, dan tick
+    tetap, sehingga jumlah figure terbuka dan memori tetap konstan. close() (atau keluar dari
+    blok with) menutup semua figure.
+    """
+
+    def __init__(self, size=1, figsize=(12, 8)):
+        if size < 1:
+            raise ValueError("size harus minimal 1")
+        self.size = size
+        self.figsize = figsize
+        self._figures = []
+        self._next = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return len(self._figures)
+
+    def acquire(self):
+        """Axes bersih yang menjadi axes aktif pyplot; mengembalikan (fig, ax)."""
+        _load_matplotlib()
+        if len(self._figures) < self.size:
+            fig = plt.figure(figsize=self.figsize)
+            self._figures.append((fig, fig.gca()))
+            self._next = len(self._figures) % self.size
+            return self._figures[-1]
+        k = self._next
+        self._next = (k + 1) % self.size
+        fig, ax = self._figures[k]
+        if not plt.fignum_exists(fig.number):
+            # Ditutup dari luar (misalnya plt.close('all')): ganti dengan figure baru
+            fig = plt.figure(figsize=self.figsize)
+            self._figures[k] = fig, fig.gca()
+            return self._figures[k]
+        plt.figure(fig.number)
+        for artist in ax.lines + ax.collections + ax.patches + ax.texts + ax.images + ax.child_axes:
+            artist.remove()
+        if ax.get_legend() is not None:
+            ax.get_legend().remove()
+        ax.ignore_existing_data_limits = True
+        return fig, ax
+
+    def close(self):
+        for fig, _ in self._figures:
+            plt.close(fig)
+        self._figures = []
+        self._next = 0
+
+
+def _new_axes(figures):
+    # Axes untuk satu grafik: figure baru, atau axes bersih dari FigurePool
+    if figures is None:
+        plt.figure(figsize=(12, 8))
+        return plt.gca()
+    return figures.acquire()[1]
+
+
+def _region_polygon(constraints, x_max, y_max):
+    # Daerah feasible (x, y ≥ 0) yang dipotong kotak plot [0, x_max] x [0, y_max],
+    # berupa titik sudut berlawanan arah jarum jam (kosong jika tidak ada)
+    box = [(1.0, 0.0, '<=', x_max), (0.0, 1.0, '<=', y_max)]
+    A, c, src, line = _halfplanes(list(constraints) + box)
+    polygon = _feasible_polygon(A, c, src, line)
+    return np.empty((0, 2)) if polygon is None else polygon[0]
+
+
+def _integer_point(constraints, g, h, sense, x_max, y_max):
+    # Titik bulat optimal di dalam kotak plot [0, x_max] x [0, y_max] (LPResult)
+    box = [(1.0, 0.0, '<=', x_max), (0.0, 1.0, '<=', y_max)]
+    return solve_integer(list(constraints) + box, g, h, sense)
+
+
+def _scenario_overlay(ax, scenarios, g, h, x_max, y_max, fmt, english=False):
+    # Lapisan hasil scenario_analysis(): kepadatan titik optimal (hexbin), pita Z pada
+    # isoline nominal, dan histogram Z dalam inset
+    res = scenarios['results']
+    ok = res['status'] == STATUS_OPTIMAL
+    pct = f"{100*scenarios['level']:g}%"
+    if ok.any():
+        ax.hexbin(res['x'][ok], res['y'][ok], gridsize=60, extent=(0, x_max, 0, y_max), mincnt=1,
+                  bins='log', cmap='Purples', alpha=0.8, linewidths=0, zorder=9)
+        ax.scatter([], [], marker='h', s=120, c='#6A3D9A', alpha=0.8,
+                   label=(f"Optimal-point density ({scenarios['n']:,} scenarios)" if english else
+                          f"Kepadatan titik optimal ({scenarios['n']:,} skenario)".replace(",", ".")))
+    lo, hi = scenarios['z_band']
+    if (g or h) and np.isfinite(lo):
+        band = _region_polygon([(g, h, '>=', lo), (g, h, '<=', hi)], x_max, y_max)
+        if len(band):
+            ax.add_patch(Polygon(band, closed=True, alpha=0.15, color='#6A3D9A', zorder=1,
+                                 label=f"{pct} Z band: [{fmt(lo)}, {fmt(hi)}]" if english else
+                                       f"Pita Z {pct}: [{fmt(lo)}, {fmt(hi)}]"))
+    z = res['z'][ok]
+    if len(z):
+        # Inset di sudut yang biasanya kosong: kanan atas (maksimum) atau kiri bawah (minimum)
+        bounds = [0.05, 0.06, 0.3, 0.26] if scenarios['kind'] == 'min' else [0.66, 0.68, 0.3, 0.26]
+        inset = ax.inset_axes(bounds)
+        inset.hist(z, bins=50, color='#6A3D9A', alpha=0.8)
+        for value in (lo, hi):
+            inset.axvline(value, color='black', linestyle='--', linewidth=1)
+        inset.set_title('Z distribution' if english else 'Distribusi Z', fontsize=9)
+        inset.tick_params(labelsize=7)
+        inset.locator_params(axis='x', nbins=4)
+        inset.set_yticks([])
+
+
+def _scenario_report(scenarios, fmt, english=False):
+    # Ringkasan scenario_analysis() untuk tabel hasil
+    pct = f"{100*scenarios['level']:g}%"
+    lo, hi = scenarios['z_band']
+    if english:
+        print(f"★ SCENARIOS: {scenarios['n']:,}, feasible {100*scenarios['feasible']:.1f}%")
+        if np.isfinite(lo):
+            print(f"★ MEAN Z: {fmt(scenarios['z_mean'])}, {pct} band: [{fmt(lo)}, {fmt(hi)}]")
+        for label, share in scenarios['vertex_share'].items():
+            print(f"  {label}: optimal in {100*share:.1f}% of feasible scenarios")
+        return
+    print(f"★ SKENARIO: {scenarios['n']:,}".replace(",", ".") + f", feasible {100*scenarios['feasible']:.1f}%")
+    if np.isfinite(lo):
+        print(f"★ Z RATA-RATA: {fmt(scenarios['z_mean'])}, pita {pct}: [{fmt(lo)}, {fmt(hi)}]")
+    for label, share in scenarios['vertex_share'].items():
+        print(f"  {label}: optimal pada {100*share:.1f}% skenario feasible")
+
+
+def _isoline_levels(start, stop, count):
+    # count level isoline dari start menuju stop (stop sendiri tidak termasuk); rentang nol
+    # atau hampir nol (daerah feasible satu titik, atau g = h = 0) menjadi satu isoline
+    if abs(stop - start) <= 1e-12*max(abs(start), abs(stop), 1.0):
+        return np.array([float(start)])
+    return np.linspace(start, stop, count, endpoint=False)
+
+
+def _line_points(g, h, Z, polygon):
+    # Ujung-ujung garis g*x + h*y = Z di dalam poligon (array kosong jika tidak memotong)
+    segments, _ = _clip_lines(g, h, [Z], polygon)
+    return segments[0] if len(segments) else np.empty((0, 2))
+
+
+def _clip_lines(g, h, levels, polygon):
+    """
+    Potong garis g*x + h*y = Z untuk setiap level terhadap poligon konveks secara analitis
+
+    Mengembalikan (segments, shown): array ujung segmen berbentuk (k, 2, 2) dan indeks
+    level yang garisnya memotong poligon.
+    """
+    levels = np.asarray(levels, dtype=np.float64).ravel()
+    norm2 = g*g + h*h
+    if norm2 == 0 or len(polygon) < 3:
+        return np.empty((0, 2, 2)), np.empty(0, dtype=np.intp)
+    # Setiap garis: p(t) = p0 + t*d dengan p0 titik terdekat ke origin
+    p0 = levels[:, None]*np.array([g, h])/norm2
+    d = np.array([-h, g])/np.sqrt(norm2)
+    # Sisi poligon (berlawanan arah jarum jam) sebagai bidang-setengah n·p ≤ o
+    edge = np.roll(polygon, -1, axis=0) - polygon
+    normal = np.column_stack([edge[:, 1], -edge[:, 0]])
+    offset = np.einsum('ij,ij->i', normal, polygon)
+    slope = normal @ d
+    room = offset[None, :] - p0 @ normal.T
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t = room/slope
+    t_hi = np.where(slope > 0, t, np.inf).min(axis=1)
+    t_lo = np.where(slope < 0, t, -np.inf).max(axis=1)
+    parallel_out = ((slope == 0) & (room < 0)).any(axis=1)
+    shown = np.flatnonzero((t_lo < t_hi) & ~parallel_out)
+    segments = p0[shown, None, :] + np.stack([t_lo[shown], t_hi[shown]], axis=1)[:, :, None]*d
+    return segments, shown
+
+
+def maximize(a1, b1, c1, a2, b2, c2, g, h, x_max, y_max, show=True, verbose=True, cache=None, stats=None,
+             integer=False, figures=None, scenarios=None):
     """
     Visualisasikan pemrograman linear dengan 2 batasan (semua ≤) dan temukan nilai maksimum dari fungsi tujuan
 
@@ -12,7 +2895,28 @@ def maximize(a1, b1, c1, a2, b2, c2, g, h, x_max, y_max):
         g, h       : Koefisien untuk fungsi tujuan (Z = g*x + h*y)
         x_max      : Batas maksimum sumbu x
         y_max      : Batas maksimum sumbu y
+        show       : Tampilkan jendela plot (False: figure dibiarkan terbuka untuk disimpan)
+        verbose    : Cetak tabel hasil analisis
+        cache      : SolveCache untuk langkah solve (opsional)
+        stats      : PhaseStats untuk mencatat waktu per fase (opsional)
+        integer    : Tandai juga titik optimal dengan x dan y bilangan bulat (solve_integer)
+        figures    : FigurePool untuk memakai ulang figure (default: figure baru setiap panggilan)
+        scenarios  : Hasil scenario_analysis() yang ditumpangkan: kepadatan titik optimal,
+                     pita Z, dan histogram Z (opsional)
     """
+    stats = _NO_STATS if stats is None else stats
+    stats.mark('solve')
+    # Presolve (dengan cache hanya saat miss): masalah yang terbukti tidak feasible berhenti
+    # sebelum titik sudut dan plot. Selesaikan dulu tanpa plot; hentikan lebih awal jika tidak ada solusi
+    args = (a1, b1, c1, a2, b2, c2, g, h, x_max, y_max)
+    res, pre_status = (_presolve_solve('max', *args) if cache is None
+                       else cache.solve_presolved('max', *args))
+    if res.status != 'optimal':
+        if verbose:
+            print("Tidak ada titik yang memenuhi semua batasan")
+        stats.end()
+        return None
+
     # Fungsi untuk format ribuan
     def format_ribuan(x):
         return f"{int(x):,}".replace(",", ".")
@@ -26,23 +2930,10 @@ def maximize(a1, b1, c1, a2, b2, c2, g, h, x_max, y_max):
         else:
             return f"{coef}{var}"
 
-    # Fungsi tujuan
-    def objective_function(x, Z):
-        return (Z - g*x)/h if h != 0 else np.zeros_like(x)
-
-    # Fungsi batasan
-    def constraint1(x):
-        return (c1 - a1*x)/b1 if b1 != 0 else np.zeros_like(x)
-
-    def constraint2(x):
-        return (c2 - a2*x)/b2 if b2 != 0 else np.zeros_like(x)
-
-    # Hasilkan nilai x
-    x = np.linspace(0, x_max, 1000)
-
+    stats.mark('setup')
+    _load_matplotlib()
     # Pengaturan plot
-    plt.figure(figsize=(12, 8))
-    ax = plt.gca()
+    ax = _new_axes(figures)
 
     # Warna background putih dan sumbu yang jelas
     ax.set_facecolor('white')
@@ -55,97 +2946,75 @@ def maximize(a1, b1, c1, a2, b2, c2, g, h, x_max, y_max):
     plt.axvline(0, color='black', linewidth=1)
 
     # Peta warna kustom untuk isoline
-    cmap = LinearSegmentedColormap.from_list('isoline', ['#AFEEEE', '#40E0D0', '#008080'])
+    cmap = _colormap(['#AFEEEE', '#40E0D0', '#008080'])
 
     # Membuat label untuk batasan dengan penyederhanaan
     label1 = f"${simplify_label(a1, 'x')} + {simplify_label(b1, 'y')} \leq {format_ribuan(c1)}$"
     label2 = f"${simplify_label(a2, 'x')} + {simplify_label(b2, 'y')} \leq {format_ribuan(c2)}$"
 
-    # Plot batasan
-    plt.plot(x, constraint1(x), label=label1, color='#1E90FF', linewidth=2.5)
-    plt.plot(x, constraint2(x), label=label2, color='#FF6347', linewidth=2.5)
-
-    # Arsir area yang feasible dengan warna abu-abu
-    y_feasible = np.minimum(constraint1(x), constraint2(x))
-    plt.fill_between(x, 0, y_feasible, where=(y_feasible >= 0),
-                    alpha=0.3, color='#808080', label='Area Feasible')
-
-    # Temukan semua titik sudut yang feasible
-    corner_points = []
-    point_labels = []
-    analysis_labels = []
-
-    # 1. Perpotongan dengan sumbu x (y=0)
-    x_val1 = c1/a1
-    x_val2 = c2/a2
-    x_val = np.min([x_val1, x_val2, x_max])
-
-    if x_val >= 0 and x_val <= x_max:
-        corner_points.append((x_val, 0.0))
-        point_labels.append(f"({format_ribuan(x_val)}, 0)")
-        analysis_labels.append("Perpotongan sumbu-X")
-
-    # 2. Perpotongan dengan sumbu y (x=0)
-    y_val1 = c1/b1
-    y_val2 = c2/b2
-    y_val = np.min([y_val1, y_val2, y_max])
-
-    if y_val >= 0 and y_val <= y_max:
-        corner_points.append((0.0, y_val))
-        point_labels.append(f"(0, {format_ribuan(y_val)})")
-        analysis_labels.append("Perpotongan sumbu-Y")
-
-    # 3. Perpotongan antara dua batasan
-    try:
-        A = np.array([[a1, b1], [a2, b2]])
-        b_const = np.array([c1, c2])
-        intersection = np.linalg.solve(A, b_const)
-        x_intersect, y_intersect = intersection
-        if (0 <= x_intersect <= x_max and
-            0 <= y_intersect <= y_max):
-            corner_points.append((x_intersect, y_intersect))
-            point_labels.append(f"({format_ribuan(x_intersect)}, {format_ribuan(y_intersect)})")
-            analysis_labels.append("Perpotongan batasan")
-    except np.linalg.LinAlgError:
-        pass
-
-    # Hitung Z di semua titik sudut
-    if len(corner_points) > 0:
-        Z_values = [g*x + h*y for (x, y) in corner_points]
-        max_index = np.argmax(Z_values)
-        max_x, max_y = corner_points[max_index]
-        max_Z = Z_values[max_index]
-
-        # Gambar 20 isoline sebelum optimal
-        Z_min = max_Z * 0.1
-        Z_step = (max_Z - Z_min)/30
-        Z_values_isol = np.arange(Z_min, max_Z, Z_step)
-
-        # Buat plot dummy khusus untuk legenda isoline
-        plt.plot([], [], '-', color='#40E0D0', alpha=0.7, linewidth=1.8,
-                 label='Isoline (Tingkat Nilai Z)')
-
-        # Gambar semua isoline
-        for i, Z in enumerate(Z_values_isol):
-            y_isol = objective_function(x, Z)
-            plt.plot(x, y_isol, '-', color=cmap(i/20), alpha=0.7, linewidth=1.8)
-
-        # Garis optimal
-        y_optimal = objective_function(x, max_Z)
-        plt.plot(x, y_optimal, '--', color='#008000', alpha=1, linewidth=3.5,
-                 label=f'Maksimum Z = {format_ribuan(max_Z)}')
-
-        # Titik optimal (maksimum) - DIUBAH agar konsisten dengan legend
-        plt.scatter(max_x, max_y, s=180, c='#FFD700', edgecolors='black', linewidths=1.5, zorder=10,
-                   label=f'Titik maksimum: ({format_ribuan(max_x)}, {format_ribuan(max_y)})')
-
-        # Tandai dan beri label semua titik sudut (format (x,y) tanpa bbox)
-        for i, ((x_val, y_val), label) in enumerate(zip(corner_points, point_labels)):
-            # Tetap tampilkan semua titik termasuk titik maksimum
-            plt.plot(x_val, y_val, 's', markersize=10, color='#32CD32', alpha=0.9)
-            plt.text(x_val + 0.01*x_max, y_val + 0.01*y_max, label,
-                    fontsize=10, color='black')
-
+    stats.mark('constraints')
+    # Plot batasan (ujung garis dipotong ke kotak plot)
+    plot_box = _region_polygon([], x_max, y_max)
+    plt.plot(*_line_points(a1, b1, c1, plot_box).T, label=label1, color='#1E90FF', linewidth=2.5)
+    plt.plot(*_line_points(a2, b2, c2, plot_box).T, label=label2, color='#FF6347', linewidth=2.5)
+
+    stats.mark('region')
+    # Arsir area yang feasible dengan warna abu-abu (poligon tepat dari titik sudutnya)
+    region = _region_polygon([(a1, b1, '<=', c1), (a2, b2, '<=', c2)], x_max, y_max)
+    if len(region):
+        ax.add_patch(Polygon(region, closed=True, alpha=0.3, color='#808080', label='Area Feasible'))
+
+    # Titik sudut feasible dan nilai Z dari hasil solve
+    corner_points = res.vertices
+    analysis_labels = res.labels
+    point_labels = [f"({format_ribuan(px)}, {format_ribuan(py)})" for (px, py) in corner_points]
+    Z_values = res.z_values
+    max_x, max_y, max_Z = res.x, res.y, res.z
+
+    stats.mark('isolines')
+    # Gambar 20 isoline sebelum optimal
+    Z_values_isol = _isoline_levels(max_Z * 0.1, max_Z, 30)
+
+    # Buat plot dummy khusus untuk legenda isoline
+    plt.plot([], [], '-', color='#40E0D0', alpha=0.7, linewidth=1.8,
+             label='Isoline (Tingkat Nilai Z)')
+
+    # Gambar semua isoline sebagai satu LineCollection; hanya bagian di dalam
+    # daerah feasible (dipotong analitis terhadap poligonnya)
+    segments, shown = _clip_lines(g, h, Z_values_isol, region)
+    ax.add_collection(LineCollection(segments, colors=cmap(shown/20), alpha=0.7, linewidths=1.8))
+
+    stats.mark('points')
+    # Garis optimal
+    plt.plot(*_line_points(g, h, max_Z, plot_box).T, '--', color='#008000', alpha=1, linewidth=3.5,
+             label=f'Maksimum Z = {format_ribuan(max_Z)}')
+
+    # Titik optimal (maksimum) - DIUBAH agar konsisten dengan legend
+    plt.scatter(max_x, max_y, s=180, c='#FFD700', edgecolors='black', linewidths=1.5, zorder=10,
+               label=f'Titik maksimum: ({format_ribuan(max_x)}, {format_ribuan(max_y)})')
+
+    # Titik optimal bulat (opsional)
+    int_res = _integer_point([(a1, b1, '<=', c1), (a2, b2, '<=', c2)], g, h, 'max', x_max, y_max) \
+        if integer else None
+    if int_res is not None and int_res.status == 'optimal':
+        plt.scatter(int_res.x, int_res.y, s=260, marker='*', c='#FF1493', edgecolors='black',
+                    linewidths=1.2, zorder=11,
+                    label=f'Titik bulat maksimum: ({format_ribuan(int_res.x)}, {format_ribuan(int_res.y)})'
+                          f', Z = {format_ribuan(int_res.z)}')
+
+    # Lapisan skenario Monte Carlo (opsional)
+    if scenarios is not None:
+        _scenario_overlay(ax, scenarios, g, h, x_max, y_max, format_ribuan)
+
+    # Tandai dan beri label semua titik sudut (format (x,y) tanpa bbox)
+    for i, ((x_val, y_val), label) in enumerate(zip(corner_points, point_labels)):
+        # Tetap tampilkan semua titik termasuk titik maksimum
+        plt.plot(x_val, y_val, 's', markersize=10, color='#32CD32', alpha=0.9)
+        plt.text(x_val + 0.01*x_max, y_val + 0.01*y_max, label,
+                fontsize=10, color='black')
+
+    stats.mark('report')
+    if verbose:
         print("\n=== HASIL ANALISIS ===")
         print(f"{'Titik':<15} {'Koordinat':>25} {'Nilai Z':<15}")
         print("-"*55)
@@ -156,11 +3025,19 @@ def maximize(a1, b1, c1, a2, b2, c2, g, h, x_max, y_max):
         print("\n" + "="*60)
         print(f"★ SOLUSI MAKSIMUM OPTIMAL: ({format_ribuan(max_x)}, {format_ribuan(max_y)})")
         print(f"★ NILAI Z MAKSIMUM: {format_ribuan(max_Z)}")
+        if pre_status == 'unbounded':
+            print("★ Catatan: Z tak terbatas; titik di atas hanya optimal di dalam kotak plot")
+        if int_res is not None:
+            if int_res.status == 'optimal':
+                print(f"★ SOLUSI BULAT: ({format_ribuan(int_res.x)}, {format_ribuan(int_res.y)}), "
+                      f"Z = {format_ribuan(int_res.z)}")
+            else:
+                print("★ Tidak ada titik bulat yang memenuhi semua batasan")
+        if scenarios is not None:
+            _scenario_report(scenarios, format_ribuan)
         print("="*60)
-    else:
-        print("Tidak ada titik yang memenuhi semua batasan")
-        return None
 
+    stats.mark('legend')
     # Gaya plot
     plt.xlabel('x', fontsize=12, fontweight='bold')
     plt.ylabel('y', fontsize=12, fontweight='bold')
@@ -174,9 +3051,16 @@ def maximize(a1, b1, c1, a2, b2, c2, g, h, x_max, y_max):
     plt.grid(True, linestyle='--', alpha=0.5)
     plt.xlim(0, x_max)
     plt.ylim(0, y_max)
+    stats.mark('layout')
     plt.tight_layout()
-    plt.show()
-
+    stats.mark('show')
+    if show:
+        plt.show()
+
+    stats.end()
+    stats.count('vertices', len(corner_points))
+    stats.count('isolines', len(segments))
+    stats.count('artists', len(ax.get_children()))
     return max_x, max_y, max_Z
 
 # Contoh penggunaan:
@@ -189,17 +3073,39 @@ maximize(
 )
 """
 
-def minimize(a, b, c, d, e, f, g, h, x_max, y_max):
+def minimize(a, b, c, d, e, f, g, h, x_max, y_max, show=True, verbose=True, cache=None, stats=None,
+             integer=False, figures=None, scenarios=None):
     """
     Visualisasikan pemrograman linear dengan 2 batasan (semua ≥) dan temukan nilai minimum dari fungsi tujuan
 
     Parameter:
-        a, b, c : Koefisien untuk batasan 1 (a*x + b*y ≥ c)
-        d, e, f : Koefisien untuk batasan 2 (d*x + e*y ≥ f)
-        g, h    : Koefisien untuk fungsi tujuan (Z = g*x + h*y)
-        x_max   : Batas maksimum sumbu x
-        y_max   : Batas maksimum sumbu y
+        a, b, c   : Koefisien untuk batasan 1 (a*x + b*y ≥ c)
+        d, e, f   : Koefisien untuk batasan 2 (d*x + e*y ≥ f)
+        g, h      : Koefisien untuk fungsi tujuan (Z = g*x + h*y)
+        x_max     : Batas maksimum sumbu x
+        y_max     : Batas maksimum sumbu y
+        show      : Tampilkan jendela plot (False: figure dibiarkan terbuka untuk disimpan)
+        verbose   : Cetak tabel hasil analisis
+        cache     : SolveCache untuk langkah solve (opsional)
+        stats     : PhaseStats untuk mencatat waktu per fase (opsional)
+        integer   : Tandai juga titik optimal dengan x dan y bilangan bulat (solve_integer)
+        figures   : FigurePool untuk memakai ulang figure (default: figure baru setiap panggilan)
+        scenarios : Hasil scenario_analysis() yang ditumpangkan: kepadatan titik optimal,
+                    pita Z, dan histogram Z (opsional)
     """
+    stats = _NO_STATS if stats is None else stats
+    stats.mark('solve')
+    # Presolve (dengan cache hanya saat miss): masalah yang terbukti tidak feasible berhenti
+    # sebelum titik sudut dan plot. Selesaikan dulu tanpa plot; hentikan lebih awal jika tidak ada solusi
+    args = (a, b, c, d, e, f, g, h, x_max, y_max)
+    res, pre_status = (_presolve_solve('min', *args) if cache is None
+                       else cache.solve_presolved('min', *args))
+    if res.status != 'optimal':
+        if verbose:
+            print("Tidak ada titik yang memenuhi semua batasan")
+        stats.end()
+        return None
+
     # Fungsi untuk format ribuan
     def format_ribuan(x):
         return f"{int(x):,}".replace(",", ".")
@@ -213,23 +3119,10 @@ def minimize(a, b, c, d, e, f, g, h, x_max, y_max):
         else:
             return f"{coef}{var}"
 
-    # Fungsi tujuan
-    def calculate_y_z(x, Z):
-        return (Z - g*x)/h if h != 0 else np.zeros_like(x)
-
-    # Fungsi batasan
-    def constraint1(x):
-        return (c - a*x)/b if b != 0 else np.zeros_like(x)
-
-    def constraint2(x):
-        return (f - d*x)/e if e != 0 else np.zeros_like(x)
-
-    # Hasilkan nilai x
-    x = np.linspace(0, x_max, 1000)
-
+    stats.mark('setup')
+    _load_matplotlib()
     # Pengaturan plot
-    plt.figure(figsize=(12, 8))
-    ax = plt.gca()
+    ax = _new_axes(figures)
 
     # Warna background putih dan semua spines yang jelas
     ax.set_facecolor('white')
@@ -242,141 +3135,79 @@ def minimize(a, b, c, d, e, f, g, h, x_max, y_max):
     ax.yaxis.set_ticks_position('left')
 
     # Peta warna kustom untuk isoline
-    cmap = LinearSegmentedColormap.from_list('isoline', ['#AFEEEE', '#40E0D0', '#008080'])
+    cmap = _colormap(['#AFEEEE', '#40E0D0', '#008080'])
 
     # Membuat label untuk batasan dengan penyederhanaan
     label1 = f"${simplify_label(a, 'x')} + {simplify_label(b, 'y')} \geq {format_ribuan(c)}$"
     label2 = f"${simplify_label(d, 'x')} + {simplify_label(e, 'y')} \geq {format_ribuan(f)}$"
 
-    # Plot batasan
-    plt.plot(x, constraint1(x), label=label1, color='#1E90FF', linewidth=2.5)
-    plt.plot(x, constraint2(x), label=label2, color='#FF6347', linewidth=2.5)
-
-    # Arsir area yang feasible dengan warna abu-abu (#808080)
-    y1 = constraint1(x)
-    y2 = constraint2(x)
-
-    # Batasi nilai y maksimum untuk plot
-    y1 = np.where(y1 > y_max, y_max, y1)
-    y2 = np.where(y2 > y_max, y_max, y2)
-
-    # Area feasible adalah area di atas kedua garis batasan
-    y_upper = np.maximum(y1, y2)
-    plt.fill_between(x, y_upper, y_max, where=(x >= 0) & (y_upper <= y_max),
-                    alpha=0.3, color='#808080', label='Area Feasible')
-
-    # Temukan semua titik sudut yang feasible
-    corner_points = []
-    point_labels = []
-    analysis_labels = []
-
-    # 1. Perpotongan batasan 1 dengan sumbu x (y=0)
-    if a != 0:
-        x_val = c / a
-        y_val = 0.0
-        if x_val >= 0 and x_val <= x_max and (d*x_val) >= f:
-            corner_points.append((x_val, y_val))
-            point_labels.append(f"({format_ribuan(x_val)}, 0)")
-            analysis_labels.append("Titik potong Batasan 1 dengan sumbu-X")
-
-    # 2. Perpotongan batasan 1 dengan sumbu y (x=0)
-    if b != 0:
-        y_val = c / b
-        x_val = 0.0
-        if y_val >= 0 and y_val <= y_max and (e*y_val) >= f:
-            corner_points.append((x_val, y_val))
-            point_labels.append(f"(0, {format_ribuan(y_val)})")
-            analysis_labels.append("Titik potong Batasan 1 dengan sumbu-Y")
-
-    # 3. Perpotongan batasan 2 dengan sumbu x (y=0)
-    if d != 0:
-        x_val = f / d
-        y_val = 0.0
-        if x_val >= 0 and x_val <= x_max and (a*x_val) >= c:
-            corner_points.append((x_val, y_val))
-            point_labels.append(f"({format_ribuan(x_val)}, 0)")
-            analysis_labels.append("Perpotongan Batasan 2 dengan sumbu-X")
-
-    # 4. Perpotongan batasan 2 dengan sumbu y (x=0)
-    if e != 0:
-        y_val = f / e
-        x_val = 0.0
-        if y_val >= 0 and y_val <= y_max and (b*y_val) >= c:
-            corner_points.append((x_val, y_val))
-            point_labels.append(f"(0, {format_ribuan(y_val)})")
-            analysis_labels.append("Perpotongan Batasan 2 dengan sumbu-Y")
-
-    # 5. Perpotongan antara dua batasan
-    try:
-        A = np.array([[a, b], [d, e]])
-        b_const = np.array([c, f])
-        intersection = np.linalg.solve(A, b_const)
-        x_intersect, y_intersect = intersection
-        if (0 <= x_intersect <= x_max and
-            0 <= y_intersect <= y_max and
-            (a*x_intersect + b*y_intersect) >= c - 1e-6 and
-            (d*x_intersect + e*y_intersect) >= f - 1e-6):
-            corner_points.append((x_intersect, y_intersect))
-            point_labels.append(f"({format_ribuan(x_intersect)}, {format_ribuan(y_intersect)})")
-            analysis_labels.append("Perpotongan Kedua Batasan")
-    except np.linalg.LinAlgError:
-        pass
-
-    # Hapus titik duplikat dan urutkan
-    unique_points = []
-    seen = set()
-    for point, label, a_label in zip(corner_points, point_labels, analysis_labels):
-        rounded_point = (round(point[0], 2), round(point[1], 2))
-        if rounded_point not in seen:
-            seen.add(rounded_point)
-            unique_points.append((point, label, a_label))
-
-    corner_points = [p[0] for p in unique_points]
-    point_labels = [p[1] for p in unique_points]
-    analysis_labels = [p[2] for p in unique_points]
-
-    # Hitung Z di semua titik sudut
-    if len(corner_points) > 0:
-        Z_values = [g*x + h*y for (x, y) in corner_points]
-        min_index = np.argmin(Z_values)
-        min_x, min_y = corner_points[min_index]
-        min_Z = Z_values[min_index]
-
-        # Cari Z maksimum di area feasible
-        max_Z = max(g*x_max, h*y_max, g*x_max + h*y_max)
-
-        # Buat rentang isoline dari min_Z ke max_Z
-        Z_step = (max_Z - min_Z)/40
-        Z_values_isol = np.arange(min_Z, max_Z, Z_step)
-
-        # Buat plot dummy khusus untuk legenda isoline
-        plt.plot([], [], '-', color='#40E0D0', alpha=0.7, linewidth=1.8,
-                 label='Isoline (Tingkat Nilai Z)')
-
-        # Gambar semua isoline yang memenuhi daerah feasible
-        for i, Z in enumerate(Z_values_isol):
-            y_isol = calculate_y_z(x, Z)
-            # Hanya plot bagian isoline yang berada di area feasible
-            feasible_mask = (y_isol >= y_upper) & (y_isol <= y_max) & (x >= 0)
-            plt.plot(x[feasible_mask], y_isol[feasible_mask], '-',
-                     color=cmap(i/20), alpha=0.7, linewidth=1.8)
-
-        # Garis optimal (putus-putus)
-        y_optimal = calculate_y_z(x, min_Z)
-        plt.plot(x, y_optimal, '--', color='#008000', alpha=1, linewidth=3.5,
-                 label=f'Minimum Z = {format_ribuan(min_Z)}')
-
-        # Titik optimal (minimum) - WARNA EMAS DENGAN BORDER HITAM
-        plt.scatter(min_x, min_y, s=200, color='#FFD700', edgecolors='black',
-                   linewidths=2, zorder=10,
-                   label=f'Titik minimum: ({format_ribuan(min_x)}, {format_ribuan(min_y)})')
-
-        # Tandai dan beri label semua titik sudut
-        for i, ((x_val, y_val), label) in enumerate(zip(corner_points, point_labels)):
-            plt.plot(x_val, y_val, 's', markersize=10, color='#32CD32', alpha=0.9)
-            plt.text(x_val + 0.01*x_max, y_val + 0.01*y_max, label,
-                    fontsize=10, color='black')
-
+    stats.mark('constraints')
+    # Plot batasan (ujung garis dipotong ke kotak plot)
+    plot_box = _region_polygon([], x_max, y_max)
+    plt.plot(*_line_points(a, b, c, plot_box).T, label=label1, color='#1E90FF', linewidth=2.5)
+    plt.plot(*_line_points(d, e, f, plot_box).T, label=label2, color='#FF6347', linewidth=2.5)
+
+    stats.mark('region')
+    # Arsir area yang feasible dengan warna abu-abu (#808080): area di atas kedua
+    # garis batasan, dipotong ke kotak plot sebagai satu poligon tepat
+    region = _region_polygon([(a, b, '>=', c), (d, e, '>=', f)], x_max, y_max)
+    if len(region):
+        ax.add_patch(Polygon(region, closed=True, alpha=0.3, color='#808080', label='Area Feasible'))
+
+    # Titik sudut feasible dan nilai Z dari hasil solve
+    corner_points = res.vertices
+    analysis_labels = res.labels
+    point_labels = [f"({format_ribuan(px)}, {format_ribuan(py)})" for (px, py) in corner_points]
+    Z_values = res.z_values
+    min_x, min_y, min_Z = res.x, res.y, res.z
+
+    stats.mark('isolines')
+    # Z maksimum di area feasible (titik sudut poligon yang dipotong kotak plot)
+    max_Z = float(np.max(region @ (g, h))) if len(region) else min_Z
+
+    # Buat rentang isoline dari min_Z ke max_Z
+    Z_values_isol = _isoline_levels(min_Z, max_Z, 40)
+
+    # Buat plot dummy khusus untuk legenda isoline
+    plt.plot([], [], '-', color='#40E0D0', alpha=0.7, linewidth=1.8,
+             label='Isoline (Tingkat Nilai Z)')
+
+    # Gambar semua isoline sebagai satu LineCollection; hanya bagian di dalam
+    # daerah feasible (dipotong analitis terhadap poligonnya)
+    segments, shown = _clip_lines(g, h, Z_values_isol, region)
+    ax.add_collection(LineCollection(segments, colors=cmap(shown/20), alpha=0.7, linewidths=1.8))
+
+    stats.mark('points')
+    # Garis optimal (putus-putus)
+    plt.plot(*_line_points(g, h, min_Z, plot_box).T, '--', color='#008000', alpha=1, linewidth=3.5,
+             label=f'Minimum Z = {format_ribuan(min_Z)}')
+
+    # Titik optimal (minimum) - WARNA EMAS DENGAN BORDER HITAM
+    plt.scatter(min_x, min_y, s=200, color='#FFD700', edgecolors='black',
+               linewidths=2, zorder=10,
+               label=f'Titik minimum: ({format_ribuan(min_x)}, {format_ribuan(min_y)})')
+
+    # Titik optimal bulat (opsional)
+    int_res = _integer_point([(a, b, '>=', c), (d, e, '>=', f)], g, h, 'min', x_max, y_max) \
+        if integer else None
+    if int_res is not None and int_res.status == 'optimal':
+        plt.scatter(int_res.x, int_res.y, s=260, marker='*', c='#FF1493', edgecolors='black',
+                    linewidths=1.2, zorder=11,
+                    label=f'Titik bulat minimum: ({format_ribuan(int_res.x)}, {format_ribuan(int_res.y)})'
+                          f', Z = {format_ribuan(int_res.z)}')
+
+    # Lapisan skenario Monte Carlo (opsional)
+    if scenarios is not None:
+        _scenario_overlay(ax, scenarios, g, h, x_max, y_max, format_ribuan)
+
+    # Tandai dan beri label semua titik sudut
+    for i, ((x_val, y_val), label) in enumerate(zip(corner_points, point_labels)):
+        plt.plot(x_val, y_val, 's', markersize=10, color='#32CD32', alpha=0.9)
+        plt.text(x_val + 0.01*x_max, y_val + 0.01*y_max, label,
+                fontsize=10, color='black')
+
+    stats.mark('report')
+    if verbose:
         print("\n=== HASIL ANALISIS ===")
         print(f"{'Titik':<30} {'Koordinat':<25} {'Nilai Z':<15}")
         print("-"*70)
@@ -387,11 +3218,19 @@ def minimize(a, b, c, d, e, f, g, h, x_max, y_max):
         print("\n" + "="*70)
         print(f"★ SOLUSI MINIMUM OPTIMAL: ({format_ribuan(min_x)}, {format_ribuan(min_y)})")
         print(f"★ NILAI Z MINIMUM: {format_ribuan(min_Z)}")
+        if pre_status == 'unbounded':
+            print("★ Catatan: Z tak terbatas; titik di atas hanya optimal di dalam kotak plot")
+        if int_res is not None:
+            if int_res.status == 'optimal':
+                print(f"★ SOLUSI BULAT: ({format_ribuan(int_res.x)}, {format_ribuan(int_res.y)}), "
+                      f"Z = {format_ribuan(int_res.z)}")
+            else:
+                print("★ Tidak ada titik bulat yang memenuhi semua batasan")
+        if scenarios is not None:
+            _scenario_report(scenarios, format_ribuan)
         print("="*70)
-    else:
-        print("Tidak ada titik yang memenuhi semua batasan")
-        return None
 
+    stats.mark('legend')
     # Gaya plot
     plt.xlabel('x', fontsize=12, fontweight='bold')
     plt.ylabel('y', fontsize=12, fontweight='bold')
@@ -405,9 +3244,16 @@ def minimize(a, b, c, d, e, f, g, h, x_max, y_max):
     plt.grid(True, linestyle='--', alpha=0.5)
     plt.xlim(0, x_max)
     plt.ylim(0, y_max)
+    stats.mark('layout')
     plt.tight_layout()
-    plt.show()
-
+    stats.mark('show')
+    if show:
+        plt.show()
+
+    stats.end()
+    stats.count('vertices', len(corner_points))
+    stats.count('isolines', len(segments))
+    stats.count('artists', len(ax.get_children()))
     return min_x, min_y, min_Z
 
 # Contoh penggunaan:
@@ -420,148 +3266,124 @@ minimize(
 )
 """
 
-def optimize(a, b, c, d, e, f, g, h, x_max, y_max):
+def optimize(a, b, c, d, e, f, g, h, x_max, y_max, show=True, verbose=True, cache=None, stats=None,
+             integer=False, figures=None, scenarios=None):
     """
     Visualization of linear programming with 2 constraints and objective function
 
     Parameters:
-        a, b, c : Coefficients for constraint 1 (a*x + b*y ≤ c)
-        d, e, f : Coefficients for constraint 2 (d*x + e*y ≥ f)
-        g, h    : Coefficients for objective function (Z = g*x + h*y)
-        x_max   : Maximum x-axis limit
-        y_max   : Maximum y-axis limit
+        a, b, c   : Coefficients for constraint 1 (a*x + b*y ≤ c)
+        d, e, f   : Coefficients for constraint 2 (d*x + e*y ≥ f)
+        g, h      : Coefficients for objective function (Z = g*x + h*y)
+        x_max     : Maximum x-axis limit
+        y_max     : Maximum y-axis limit
+        show      : Show the plot window (False: leave the figure open for saving)
+        verbose   : Print the analysis table
+        cache     : SolveCache for the solve step (optional)
+        stats     : PhaseStats to record per-phase timing (optional)
+        integer   : Also mark the optimum with integer x and y (solve_integer)
+        figures   : FigurePool to reuse figures (default: a new figure per call)
+        scenarios : scenario_analysis() result to overlay: optimal-point density, Z band,
+                    and Z histogram (optional)
     """
-    # Objective function
-    def calculate_y_z(x, Z):
-        return (Z - g*x)/h if h != 0 else np.zeros_like(x)
-
-    # Constraint functions
-    def constraint1(x):
-        return (c - a*x)/b if b != 0 else np.zeros_like(x)
-
-    def constraint2(x):
-        return (f - d*x)/e if e != 0 else np.zeros_like(x)
-
-    # Generate x values
-    x = np.linspace(0, x_max, 1000)
+    stats = _NO_STATS if stats is None else stats
+    stats.mark('solve')
+    # Presolve (with a cache, only on a miss): provably infeasible problems stop before any
+    # vertex work or plotting. Solve first without plotting; stop early if there is no solution
+    args = (a, b, c, d, e, f, g, h, x_max, y_max)
+    res, pre_status = (_presolve_solve('mixed', *args) if cache is None
+                       else cache.solve_presolved('mixed', *args))
+    if res.status != 'optimal':
+        if verbose:
+            print("No points satisfy all constraints")
+        stats.end()
+        return None
 
+    stats.mark('setup')
+    _load_matplotlib()
     # Plot setup
-    plt.figure(figsize=(12, 8))
-    ax = plt.gca()
+    ax = _new_axes(figures)
 
     # Custom colormap for isolines
-    cmap = LinearSegmentedColormap.from_list('isoline', ['#FFA07A', '#FF6347', '#FF4500'])
-
-    # Plot constraints
-    plt.plot(x, constraint1(x), label=f'${a}x + {b}y \leq {c}$', color='#1E90FF', linewidth=2.5)
-    plt.plot(x, constraint2(x), label=f'${d}x + {e}y \geq {f}$', color='#FF6347', linewidth=2.5)
-
-    # Shade feasible region
-    y_upper = constraint1(x)
-    y_lower = constraint2(x)
-    feasible_mask = (y_upper >= y_lower) & (y_lower >= 0) & (x >= 0)  # Stricter check
-    plt.fill_between(x, y_lower, y_upper, where=feasible_mask,
-                    alpha=0.15, color='#90EE90', label='Feasible Region')
-
-    # Find all feasible corner points
-    corner_points = []
-
-    # 1. Intersection with x-axis (y=0)
-    if a != 0:
-        x_val = c / a
-        if x_val >= 0 and x_val <= x_max and (d*x_val) >= f:  # Satisfies constraint 2
-            corner_points.append((x_val, 0.0))
-
-    # 2. Intersection with y-axis (x=0)
-    if b != 0:
-        y_val = c / b
-        if y_val >= 0 and y_val <= y_max and (e*y_val) >= f:  # Satisfies constraint 2
-            corner_points.append((0.0, y_val))
-
-    # 3. Intersection of constraint 2 with x-axis (y=0)
-    if d != 0:
-        x_val = f / d
-        if x_val >= 0 and x_val <= x_max and (a*x_val) <= c:  # Satisfies constraint 1
-            corner_points.append((x_val, 0.0))
-
-    # 4. Intersection of constraint 2 with y-axis (x=0)
-    if e != 0:
-        y_val = f / e
-        if y_val >= 0 and y_val <= y_max and (b*y_val) <= c:  # Satisfies constraint 1
-            corner_points.append((0.0, y_val))
-
-    # 5. Intersection between two constraints
-    try:
-        A = np.array([[a, b], [d, e]])
-        b_const = np.array([c, f])
-        intersection = np.linalg.solve(A, b_const)
-        x_intersect, y_intersect = intersection
-        if (0 <= x_intersect <= x_max and
-            0 <= y_intersect <= y_max and
-            (a*x_intersect + b*y_intersect) <= c + 1e-6 and  # Tolerance for floating point
-            (d*x_intersect + e*y_intersect) >= f - 1e-6):
-            corner_points.append((x_intersect, y_intersect))
-    except np.linalg.LinAlgError:
-        pass
-
-    # Remove duplicate points and sort
-    corner_points = list(set([(round(x, 2), round(y, 2)) for (x, y) in corner_points]))
-    corner_points.sort()
-
-    # Calculate Z at all corner points
-    if len(corner_points) > 0:
-        Z_values = [g*x + h*y for (x, y) in corner_points]
-        max_index = np.argmax(Z_values)
-        min_index = np.argmin(Z_values)
-        optimal_x, optimal_y = corner_points[max_index]
-        optimal_Z = Z_values[max_index]
-        min_Z = Z_values[min_index]
-
-        # Draw 20 isolines before optimal (MAINTAIN THICKNESS 1.8)
-        Z_min = 0
-        Z_step = (optimal_Z - Z_min)/20
-        Z_values_isol = np.arange(Z_min, optimal_Z, Z_step)
-
-        #########################################################
-        # ADDED SECTION - FOR ISOLINE LEGEND
-        #########################################################
-        # Create dummy plot specifically for isoline legend
-        plt.plot([], [], '-', color='#FF6347', alpha=0.7, linewidth=1.8,
-                 label='Isoline (Z Value Level)')
-        #########################################################
-
-        # Draw all isolines
-        for i, Z in enumerate(Z_values_isol):
-            y_isol = calculate_y_z(x, Z)
-            plt.plot(x, y_isol, '-', color=cmap(i/20), alpha=0.7, linewidth=1.8)
-
-        # Optimal line (MAINTAIN THICKNESS 3.5)
-        y_optimal = calculate_y_z(x, optimal_Z)
-        plt.plot(x, y_optimal, '--', color='#FF0000', alpha=1, linewidth=3.5,
-                 label=f'Maximum Z = {optimal_Z:.1f}')
-
-        # Optimal point (maximum)
-        plt.plot(optimal_x, optimal_y, 'o', markersize=14,
-                 markeredgecolor='black', markerfacecolor='#FFD700',
-                 label=f'Maximum Optimal ({optimal_x:.1f}, {optimal_y:.1f})')
-
-        # Minimum point
-        min_x, min_y = corner_points[min_index]
-        plt.plot(min_x, min_y, 'o', markersize=14,
-                 markeredgecolor='black', markerfacecolor='#00BFFF',
-                 label=f'Minimum Optimal ({min_x:.1f}, {min_y:.1f})')
-
-        # Mark all feasible corner points
-        for i, (x_val, y_val) in enumerate(corner_points):
-            if i == max_index:
-                continue  # Skip as already plotted as optimal point
-            if i == min_index:
-                continue  # Skip as already plotted as minimum point
-            plt.plot(x_val, y_val, 's', markersize=10, color='#32CD32', alpha=0.9,
-                    label='Feasible Point' if i == 0 else "")
-            plt.text(x_val + 0.2, y_val + 0.2, f'({x_val:.1f}, {y_val:.1f})',
-                    fontsize=10, color='black')
-
+    cmap = _colormap(['#FFA07A', '#FF6347', '#FF4500'])
+
+    stats.mark('constraints')
+    # Plot constraints (line endpoints clipped to the plot box)
+    plot_box = _region_polygon([], x_max, y_max)
+    plt.plot(*_line_points(a, b, c, plot_box).T, label=f'${a}x + {b}y \leq {c}$', color='#1E90FF', linewidth=2.5)
+    plt.plot(*_line_points(d, e, f, plot_box).T, label=f'${d}x + {e}y \geq {f}$', color='#FF6347', linewidth=2.5)
+
+    stats.mark('region')
+    # Shade feasible region as one exact polygon clipped to the plot box
+    region = _region_polygon([(a, b, '<=', c), (d, e, '>=', f)], x_max, y_max)
+    if len(region):
+        ax.add_patch(Polygon(region, closed=True, alpha=0.15, color='#90EE90', label='Feasible Region'))
+
+    # Feasible corner points and Z values from the solve result
+    corner_points = res.vertices
+    Z_values = res.z_values
+    max_index, min_index = res.index, res.min_index
+    optimal_x, optimal_y, optimal_Z = res.x, res.y, res.z
+    min_Z = Z_values[min_index]
+
+    stats.mark('isolines')
+    # Draw 20 isolines before optimal (MAINTAIN THICKNESS 1.8)
+    Z_values_isol = _isoline_levels(0, optimal_Z, 20)
+
+    #########################################################
+    # ADDED SECTION - FOR ISOLINE LEGEND
+    #########################################################
+    # Create dummy plot specifically for isoline legend
+    plt.plot([], [], '-', color='#FF6347', alpha=0.7, linewidth=1.8,
+             label='Isoline (Z Value Level)')
+    #########################################################
+
+    # Draw all isolines as one LineCollection, clipped analytically to the
+    # feasible polygon
+    segments, shown = _clip_lines(g, h, Z_values_isol, region)
+    ax.add_collection(LineCollection(segments, colors=cmap(shown/20), alpha=0.7, linewidths=1.8))
+
+    stats.mark('points')
+    # Optimal line (MAINTAIN THICKNESS 3.5)
+    plt.plot(*_line_points(g, h, optimal_Z, plot_box).T, '--', color='#FF0000', alpha=1, linewidth=3.5,
+             label=f'Maximum Z = {optimal_Z:.1f}')
+
+    # Optimal point (maximum)
+    plt.plot(optimal_x, optimal_y, 'o', markersize=14,
+             markeredgecolor='black', markerfacecolor='#FFD700',
+             label=f'Maximum Optimal ({optimal_x:.1f}, {optimal_y:.1f})')
+
+    # Minimum point
+    min_x, min_y = corner_points[min_index]
+    plt.plot(min_x, min_y, 'o', markersize=14,
+             markeredgecolor='black', markerfacecolor='#00BFFF',
+             label=f'Minimum Optimal ({min_x:.1f}, {min_y:.1f})')
+
+    # Integer optimum (optional)
+    int_res = _integer_point([(a, b, '<=', c), (d, e, '>=', f)], g, h, 'max', x_max, y_max) \
+        if integer else None
+    if int_res is not None and int_res.status == 'optimal':
+        plt.plot(int_res.x, int_res.y, '*', markersize=18, markeredgecolor='black',
+                 markerfacecolor='#FF1493', zorder=11,
+                 label=f'Integer Maximum ({int_res.x:.0f}, {int_res.y:.0f}), Z = {int_res.z:.1f}')
+
+    # Monte Carlo scenario overlay (optional)
+    if scenarios is not None:
+        _scenario_overlay(ax, scenarios, g, h, x_max, y_max, lambda v: f"{v:.1f}", english=True)
+
+    # Mark all feasible corner points
+    for i, (x_val, y_val) in enumerate(corner_points):
+        if i == max_index:
+            continue  # Skip as already plotted as optimal point
+        if i == min_index:
+            continue  # Skip as already plotted as minimum point
+        plt.plot(x_val, y_val, 's', markersize=10, color='#32CD32', alpha=0.9,
+                label='Feasible Point' if i == 0 else "")
+        plt.text(x_val + 0.2, y_val + 0.2, f'({x_val:.1f}, {y_val:.1f})',
+                fontsize=10, color='black')
+
+    stats.mark('report')
+    if verbose:
         print("\n=== ANALYSIS RESULTS ===")
         print(f"{'Point':<10} {'Coordinates':<20} {'Z Value':<10}")
         print("-"*40)
@@ -571,13 +3393,20 @@ def optimize(a, b, c, d, e, f, g, h, x_max, y_max):
         print("\n" + "="*50)
         print(f"★ MAXIMUM OPTIMAL SOLUTION: ({optimal_x:.1f}, {optimal_y:.1f})")
         print(f"★ MAXIMUM Z VALUE: {optimal_Z:.1f}")
+        if pre_status == 'unbounded':
+            print("★ Note: Z is unbounded; this maximum holds only inside the plot box")
         print(f"★ MINIMUM OPTIMAL SOLUTION: ({min_x:.1f}, {min_y:.1f})")
         print(f"★ MINIMUM Z VALUE: {min_Z:.1f}")
+        if int_res is not None:
+            if int_res.status == 'optimal':
+                print(f"★ INTEGER MAXIMUM: ({int_res.x:.0f}, {int_res.y:.0f}), Z = {int_res.z:.1f}")
+            else:
+                print("★ No integer point satisfies all constraints")
+        if scenarios is not None:
+            _scenario_report(scenarios, lambda v: f"{v:.1f}", english=True)
         print("="*50)
-    else:
-        print("No points satisfy all constraints")
-        return None
 
+    stats.mark('legend')
     # Plot styling
     plt.xlabel('x', fontsize=12, fontweight='bold')
     plt.ylabel('y', fontsize=12, fontweight='bold')
@@ -591,9 +3420,16 @@ def optimize(a, b, c, d, e, f, g, h, x_max, y_max):
     plt.grid(True, linestyle='--', alpha=0.5)
     plt.xlim(0, x_max)
     plt.ylim(0, y_max)
+    stats.mark('layout')
     plt.tight_layout()
-    plt.show()
-
+    stats.mark('show')
+    if show:
+        plt.show()
+
+    stats.end()
+    stats.count('vertices', len(corner_points))
+    stats.count('isolines', len(segments))
+    stats.count('artists', len(ax.get_children()))
     return optimal_x, optimal_y, optimal_Z
 
 # Example usage:
@@ -604,4 +3440,622 @@ optimize(
         g=7, h=5,         # Objective function: Z = 6x + 4y
         x_max=10, y_max=8
 )
-"""
\ No newline at end of file
+"""
+
+
+# Warna garis batasan pada grafik Problem, bergiliran menurut urutan batasan
+_CONSTRAINT_COLORS = ['#1E90FF', '#FF6347', '#9370DB', '#FF8C00', '#2E8B57', '#C71585']
+
+
+class Problem:
+    """
+    Program linear 2 variabel yang bisa diubah batasan demi batasan (untuk UI interaktif)
+
+    Parameter:
+        constraints : Daftar batasan (a, b, tanda, c) seperti pada solve_2d()
+        g, h        : Koefisien untuk fungsi tujuan (Z = g*x + h*y)
+        sense       : 'max' atau 'min'
+        nonneg      : Tambahkan x ≥ 0 dan y ≥ 0 (default True)
+        x_max       : Batas maksimum sumbu x (wajib untuk draw())
+        y_max       : Batas maksimum sumbu y (wajib untuk draw())
+
+    Poligon feasible dan kerucut resesinya disimpan. Batasan yang ditambahkan atau
+    diperketat hanya memotong poligon yang ada (O(m)); pelonggaran, penghapusan, atau
+    batasan '=' membangun ulang poligon. draw() hanya memperbarui artist yang berubah.
+    """
+
+    def __init__(self, constraints, g, h, sense='max', nonneg=True, x_max=None, y_max=None):
+        if sense not in ('max', 'min'):
+            raise ValueError(f"sense harus 'max' atau 'min', bukan {sense!r}")
+        self.g, self.h, self.sense, self.nonneg = g, h, sense, nonneg
+        self.x_max, self.y_max = x_max, y_max
+        self._constraints = []
+        for con in constraints:
+            self._constraints.append(self._check(*con))
+        self._rebuild()
+        self._artists = None
+        self._dirty = set()
+
+    @staticmethod
+    def _check(a, b, sense, c):
+        if sense not in _SENSES:
+            raise ValueError(f"Tanda batasan tidak dikenal: {sense!r}")
+        return (a, b, sense, c)
+
+    @property
+    def constraints(self):
+        return list(self._constraints)
+
+    @property
+    def result(self):
+        """LPResult untuk keadaan sekarang (dihitung ulang hanya setelah ada perubahan)"""
+        if self._result is None:
+            self._result = _optimum(self._polygon, self._cone, self.g, self.h, self.sense)
+        return self._result
+
+    def _rebuild(self):
+        A, c, src, line = _halfplanes(self._constraints, self.nonneg)
+        self._polygon = _feasible_polygon(A, c, src, line)
+        self._cone = (None if self._polygon is None
+                      else _feasible_polygon(A, np.zeros_like(c), src, line, bound=1.0))
+        self._result = None
+
+    def _clip(self, k):
+        # Potong poligon dan kerucut resesi dengan batasan k saja; bangun ulang jika perlu
+        a, b, sense, c = self._constraints[k]
+        s = _SENSES[sense]
+        if s == 0 or self._polygon is None:
+            return self._rebuild() if s == 0 else None
+        if s < 0:
+            a, b, c = -a, -b, -c
+        polygon = _clip_polygon(self._polygon, a, b, c, k, self._constraints)
+        lines = [(ca, cb, cs, 0.0) for ca, cb, cs, _ in self._constraints]
+        cone = self._cone and _clip_polygon(self._cone, a, b, 0.0, k, lines)
+        if polygon is False or cone is False:
+            return self._rebuild()
+        self._polygon = polygon
+        self._cone = cone if polygon is not None else None
+        self._result = None
+
+    def add_constraint(self, a, b, sense, c):
+        """Tambahkan batasan a*x + b*y [tanda] c; mengembalikan indeksnya"""
+        self._constraints.append(self._check(a, b, sense, c))
+        k = len(self._constraints) - 1
+        if any(_SENSES[con[2]] == 0 for con in self._constraints):
+            self._rebuild()
+        else:
+            self._clip(k)
+        self._dirty.add(k)
+        return k
+
+    def update_constraint(self, k, a=None, b=None, sense=None, c=None):
+        """Ubah sebagian koefisien batasan k (argumen None tidak diubah)"""
+        old = self._constraints[k]
+        new = self._check(*(old_v if new_v is None else new_v
+                            for old_v, new_v in zip(old, (a, b, sense, c))))
+        if new == old:
+            return
+        self._constraints[k] = new
+        self._dirty.add(k)
+        s = _SENSES[new[2]]
+        # Hanya c yang berubah dan batasannya makin ketat: daerah baru = daerah lama ∩ batasan baru
+        tighter = new[:3] == old[:3] and s != 0 and s*(new[3] - old[3]) < 0
+        if tighter and not any(_SENSES[con[2]] == 0 for con in self._constraints):
+            self._clip(k)
+        else:
+            self._rebuild()
+
+    def remove_constraint(self, k):
+        """Hapus batasan k (indeks batasan sesudahnya bergeser satu)"""
+        del self._constraints[k]
+        self._dirty.update(range(k, len(self._constraints) + 1))
+        self._rebuild()
+
+    def set_objective(self, g=None, h=None):
+        """Ubah koefisien fungsi tujuan; poligon feasible tidak perlu dihitung ulang"""
+        self.g = self.g if g is None else g
+        self.h = self.h if h is None else h
+        self._result = None
+
+    def draw(self, ax=None):
+        """
+        Gambar (panggilan pertama) atau perbarui grafik isoline pada ax
+
+        Panggilan berikutnya hanya memperbarui data artist yang berubah (garis batasan
+        yang diedit, daerah feasible, isoline, dan titik optimal) lalu meminta canvas
+        digambar ulang saat idle. Mengembalikan ax.
+        """
+        ax, legend = self._update_artists(ax)
+        if legend:
+            ax.legend(loc='upper right', fontsize=10, framealpha=1)
+        ax.figure.canvas.draw_idle()
+        return ax
+
+    def _update_artists(self, ax=None):
+        # Buat artist sekali, lalu hanya ganti datanya; mengembalikan (ax, label_berubah)
+        if self.x_max is None or self.y_max is None:
+            raise ValueError("draw() membutuhkan x_max dan y_max")
+        res = self.result
+        x_max, y_max = self.x_max, self.y_max
+        plot_box = _region_polygon([], x_max, y_max)
+        if self._artists is None:
+            _load_matplotlib()
+            if ax is None:
+                plt.figure(figsize=(12, 8))
+                ax = plt.gca()
+            ax.set_facecolor('white')
+            ax.axhline(0, color='black', linewidth=1)
+            ax.axvline(0, color='black', linewidth=1)
+            ax.set_xlim(0, x_max)
+            ax.set_ylim(0, y_max)
+            ax.set_xlabel('x', fontsize=12, fontweight='bold')
+            ax.set_ylabel('y', fontsize=12, fontweight='bold')
+            title = 'Maksimum' if self.sense == 'max' else 'Minimum'
+            ax.set_title(f'Optimasi Pemrograman Linear ({title})', fontsize=14, fontweight='bold')
+            ax.grid(True, linestyle='--', alpha=0.7)
+            region = Polygon(np.zeros((0, 2)), closed=True, alpha=0.3, color='#808080', label='Area Feasible')
+            isolines = LineCollection([], alpha=0.7, linewidths=1.8)
+            optimal, = ax.plot([], [], '--', color='#008000', linewidth=3.5)
+            point = ax.scatter([], [], s=180, c='#FFD700', edgecolors='black', linewidths=1.5, zorder=10)
+            ax.add_patch(region)
+            ax.add_collection(isolines)
+            cmap = _colormap(['#AFEEEE', '#40E0D0', '#008080'])
+            self._artists = {'ax': ax, 'lines': [], 'region': region, 'isolines': isolines,
+                             'optimal': optimal, 'point': point, 'cmap': cmap,
+                             'polygon': None, 'clipped': np.zeros((0, 2)), 'objective': None}
+            self._dirty = set(range(len(self._constraints)))
+        art = self._artists
+        ax = art['ax']
+
+        # Garis batasan: hanya yang diedit, ditambah, atau bergeser indeks
+        lines = art['lines']
+        while len(lines) > len(self._constraints):
+            lines.pop().remove()
+        for k in sorted(self._dirty):
+            if k >= len(self._constraints):
+                continue
+            a, b, sense, c = self._constraints[k]
+            if k >= len(lines):
+                lines.append(ax.plot([], [], color=_CONSTRAINT_COLORS[k % len(_CONSTRAINT_COLORS)],
+                                     linewidth=2.5)[0])
+            sign = {1: r'\leq', -1: r'\geq', 0: '='}[_SENSES[sense]]
+            lines[k].set_data(*_line_points(a, b, c, plot_box).T)
+            lines[k].set_label(f"${a:g}x + {b:g}y {sign} {c:g}$")
+        legend = bool(self._dirty)
+        self._dirty = set()
+
+        # Daerah feasible di dalam kotak plot
+        if art['polygon'] is not self._polygon:
+            art['polygon'] = self._polygon
+            region = self._polygon
+            for a, b, c in ((1.0, 0.0, x_max), (0.0, 1.0, y_max), (-1.0, 0.0, 0.0), (0.0, -1.0, 0.0)):
+                if region is None or region is False:
+                    break
+                region = _clip_polygon(region, a, b, c, _SRC_BOX)
+            art['clipped'] = region[0] if region else np.zeros((0, 2))
+            art['region'].set_xy(art['clipped'])
+            # Isoline dipotong terhadap daerah ini, jadi harus digambar ulang
+            art['objective'] = None
+
+        # Isoline, garis optimal, dan titik optimal (hanya jika hasilnya berubah)
+        key = (res.status, res.x, res.y, self.g, self.h)
+        if art['objective'] != key:
+            art['objective'] = key
+            if res.status == 'optimal':
+                # Rentang isoline seperti maximize()/minimize(), hanya di dalam daerah feasible
+                clipped = art['clipped']
+                if self.sense == 'max':
+                    levels = _isoline_levels(0.1*res.z, res.z, 30)
+                else:
+                    top = float(np.max(clipped @ (self.g, self.h))) if len(clipped) else res.z
+                    levels = _isoline_levels(res.z, top, 40)
+                segments, shown = _clip_lines(self.g, self.h, levels, clipped)
+                art['isolines'].set_segments(segments)
+                art['isolines'].set_color(art['cmap'](shown/20))
+                art['optimal'].set_data(*_line_points(self.g, self.h, res.z, plot_box).T)
+                art['optimal'].set_label(f"{'Maksimum' if self.sense == 'max' else 'Minimum'} Z = {res.z:,.2f}")
+                art['point'].set_offsets([[res.x, res.y]])
+            else:
+                art['isolines'].set_segments([])
+                art['optimal'].set_data([], [])
+                art['optimal'].set_label(f"Status: {res.status}")
+                art['point'].set_offsets(np.zeros((0, 2)))
+            legend = True
+        return ax, legend
+
+
+# Contoh penggunaan:
+"""
+p = Problem([(2, 1, '<=', 300), (1, 2, '<=', 300)], g=150, h=100, x_max=300, y_max=300)
+p.draw()
+p.update_constraint(0, c=250)       # hanya poligon yang dipotong ulang
+p.add_constraint(1, 1, '<=', 180)
+p.draw()
+plt.show()
+"""
+
+
+class Explorer:
+    """
+    Penjelajah interaktif: slider untuk g, h, dan ruas kanan c setiap batasan
+
+    Parameter:
+        constraints : Daftar batasan (a, b, tanda, c) seperti pada solve_2d()
+        g, h        : Koefisien awal fungsi tujuan (Z = g*x + h*y)
+        sense       : 'max' atau 'min'
+        x_max       : Batas maksimum sumbu x
+        y_max       : Batas maksimum sumbu y
+        ranges      : Rentang slider (opsional), dict dengan kunci 'g', 'h', atau indeks
+                      batasan -> (min, max); default 0 sampai dua kali nilai awal
+        nonneg      : Tambahkan x ≥ 0 dan y ≥ 0 (default True)
+
+    Figure dan semua artist dibuat sekali. Saat slider digeser, hanya data garis batasan,
+    daerah feasible, isoline, dan titik optimal yang diganti, lalu digambar di atas latar
+    yang disimpan (blitting). Backend tanpa blitting kembali ke draw_idle().
+    """
+
+    def __init__(self, constraints, g, h, sense='max', x_max=None, y_max=None, ranges=None, nonneg=True):
+        _load_matplotlib()
+        self.problem = Problem(constraints, g, h, sense, nonneg, x_max, y_max)
+        ranges = dict(ranges or {})
+        fig = plt.figure(figsize=(12, 9))
+        n = len(constraints) + 2
+        bottom = 0.06 + 0.04*n
+        ax = fig.add_axes([0.08, bottom + 0.05, 0.88, 0.88 - bottom])
+        self.problem._update_artists(ax)
+        art = self.problem._artists
+        # Legenda tetap (tanpa angka), nilai yang berubah ditulis di teks status
+        for k, line in enumerate(art['lines']):
+            line.set_label(f'Batasan {k + 1}')
+        art['optimal'].set_label('Garis Z optimal')
+        ax.legend(loc='upper right', fontsize=10, framealpha=1)
+        self.status = ax.text(0.02, 0.97, '', transform=ax.transAxes, va='top', fontsize=11,
+                              bbox=dict(facecolor='white', alpha=0.9, edgecolor='#808080'))
+
+        def default(value):
+            return (min(0.0, 2*value), max(2*value, 0.0)) if value else (-1.0, 1.0)
+
+        self.sliders = {}
+        self._values = {'g': g, 'h': h}
+        names = ['g', 'h'] + list(range(len(constraints)))
+        values = [g, h] + [con[3] for con in constraints]
+        for row, (name, value) in enumerate(zip(names, values)):
+            lo, hi = ranges.get(name, default(value))
+            slider_ax = fig.add_axes([0.15, 0.04*(n - row), 0.7, 0.025])
+            label = name if isinstance(name, str) else f'c{name + 1}'
+            slider = Slider(slider_ax, label, lo, hi, valinit=value, valfmt='%g')
+            slider.drawon = False
+            slider.on_changed(self._on_changed)
+            self.sliders[name] = slider
+
+        self.fig, self.ax = fig, ax
+        # Artist animasi per daerah blit: sumbu grafik dan satu baris per slider
+        self._plot_artists = [*art['lines'], art['region'], art['isolines'], art['optimal'],
+                              art['point'], self.status]
+        # Axes slider berisi bar, pegangan, label, dan teks nilainya (API publik Slider.ax)
+        self._slider_artists = {name: [s.ax] for name, s in self.sliders.items()}
+        for artist in self._plot_artists + sum(self._slider_artists.values(), []):
+            artist.set_animated(True)
+        self._background = None
+        fig.canvas.mpl_connect('draw_event', self._on_draw)
+        self._update_status()
+
+    def _update_status(self):
+        res = self.problem.result
+        if res.status == 'optimal':
+            word = 'Maksimum' if self.problem.sense == 'max' else 'Minimum'
+            self.status.set_text(f'{word} Z = {res.z:,.2f} di ({res.x:,.2f}, {res.y:,.2f})')
+        else:
+            self.status.set_text(f'Status: {res.status}')
+
+    def _slider_bbox(self, name):
+        # Satu baris selebar figure agar label dan teks nilai slider ikut terbarui
+        box = self.sliders[name].ax.bbox
+        return Bbox([[self.fig.bbox.x0, box.y0 - 4], [self.fig.bbox.x1, box.y1 + 4]])
+
+    def _on_draw(self, event):
+        # Simpan latar (semua kecuali artist animasi) setiap kali figure digambar penuh
+        canvas = self.fig.canvas
+        if canvas.supports_blit:
+            self._background = canvas.copy_from_bbox(self.fig.bbox)
+        self._draw_animated()
+
+    def _draw_animated(self):
+        for artist in self._plot_artists + sum(self._slider_artists.values(), []):
+            self.fig.draw_artist(artist)
+
+    def _on_changed(self, _):
+        problem = self.problem
+        problem.set_objective(self.sliders['g'].val, self.sliders['h'].val)
+        changed = [name for name in ('g', 'h') if self.sliders[name].val != self._values.get(name)]
+        for k, con in enumerate(problem.constraints):
+            if self.sliders[k].val != con[3]:
+                problem.update_constraint(k, c=self.sliders[k].val)
+                changed.append(k)
+        self._values = {name: slider.val for name, slider in self.sliders.items()}
+        problem._update_artists()
+        self._update_status()
+        canvas = self.fig.canvas
+        if self._background is None:
+            canvas.draw_idle()
+            return
+        # Pulihkan latar (salinan buffer) dan gambar ulang artist animasi, lalu kirim ke layar
+        # hanya sumbu grafik dan baris slider yang berubah
+        canvas.restore_region(self._background)
+        self._draw_animated()
+        canvas.blit(self.ax.bbox)
+        for name in changed:
+            canvas.blit(self._slider_bbox(name))
+
+
+# Contoh penggunaan:
+"""
+ex = Explorer([(2, 1, '<=', 300), (1, 2, '<=', 300)], g=150, h=100, x_max=300, y_max=300)
+plt.show()
+"""
+
+
+# Fungsi plot untuk setiap bentuk masalah (sama seperti kind pada solve_batch)
+_PLOTTERS = {'max': maximize, 'min': minimize, 'mixed': optimize}
+
+
+def cpu_count():
+    """Jumlah core yang benar-benar boleh dipakai proses ini (afinitas CPU jika tersedia)"""
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+# FigurePool milik proses pekerja (dibuat oleh init_render_worker)
+_WORKER_FIGURES = None
+
+
+def init_render_worker():
+    """
+    Inisialisasi proses pekerja untuk menggambar tanpa jendela
+
+    Dipakai sebagai initializer ProcessPoolExecutor: backend Agg, impor pyplot sekali per
+    proses, dan satu figure yang dipakai ulang oleh render_figure() untuk semua gambar.
+    """
+    global _WORKER_FIGURES
+    import matplotlib
+    matplotlib.use('Agg', force=True)
+    _load_matplotlib()
+    _WORKER_FIGURES = FigurePool(1)
+
+
+def _plot_problem(problem):
+    # Gambar satu dict masalah (kind + argumen fungsi plot) tanpa jendela dan tanpa tabel
+    params = dict(problem)
+    kind = params.pop('kind', 'max')
+    if kind not in _PLOTTERS:
+        raise ValueError(f"kind harus 'max', 'min', atau 'mixed', bukan {kind!r}")
+    return _PLOTTERS[kind](**params, show=False, verbose=False, figures=_WORKER_FIGURES)
+
+
+def render_figure(problem, fmt='png', dpi=100):
+    """
+    Gambar satu masalah ke byte gambar di memori
+
+    Parameter:
+        problem : Dict berisi 'kind' ('max', 'min', atau 'mixed', default 'max') dan argumen
+                  untuk maximize(), minimize(), atau optimize()
+        fmt     : Format gambar ('png', 'svg', atau 'pdf')
+        dpi     : Resolusi gambar raster
+
+    Di proses yang diinisialisasi dengan init_render_worker() figure pekerja dipakai ulang;
+    di luar itu figure baru ditutup setelah disimpan. Mengembalikan byte gambar, atau None
+    jika masalahnya tidak feasible.
+    """
+    import io
+
+    point = _plot_problem(problem)
+    if point is None:
+        return None
+    figure = plt.gcf()
+    buffer = io.BytesIO()
+    figure.savefig(buffer, format=fmt, dpi=dpi)
+    if _WORKER_FIGURES is None:
+        plt.close(figure)
+    return buffer.getvalue()
+
+
+def _export_one(task):
+    # Gambar satu masalah lalu simpan ke berkas; format mengikuti ekstensi path
+    problem, path, dpi = task
+    point = _plot_problem(problem)
+    if point is None:
+        return None
+    plt.gcf().savefig(path, dpi=dpi)
+    return point
+
+
+def export_figures(problems, paths, workers=None, dpi=100, chunksize=None):
+    """
+    Simpan grafik banyak masalah ke berkas PNG/SVG/PDF secara paralel tanpa jendela
+
+    Parameter:
+        problems  : Daftar dict berisi 'kind' ('max', 'min', atau 'mixed') dan argumen
+                    untuk maximize(), minimize(), atau optimize()
+        paths     : Daftar path berkas tujuan (sepanjang problems); format dari ekstensi
+        workers   : Jumlah proses pekerja (default: jumlah core)
+        dpi       : Resolusi gambar raster
+        chunksize : Jumlah masalah per kiriman ke pekerja (default dihitung otomatis)
+
+    Setiap pekerja memakai backend Agg dan mengimpor matplotlib sekali saja.
+    Mengembalikan daftar (x, y, Z) per masalah, atau None jika tidak feasible
+    (berkasnya tidak dibuat).
+    """
+    problems, paths = list(problems), list(paths)
+    if len(problems) != len(paths):
+        raise ValueError("problems dan paths harus sama panjang")
+    tasks = []
+    for problem, path in zip(problems, paths):
+        kind = problem['kind']
+        if kind not in _PLOTTERS:
+            raise ValueError(f"kind harus 'max', 'min', atau 'mixed', bukan {kind!r}")
+        tasks.append((problem, os.fspath(path), dpi))
+    if not tasks:
+        return []
+    workers = workers or cpu_count()
+    if chunksize is None:
+        chunksize = max(1, len(tasks)//(4*workers))
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_render_worker) as pool:
+        return list(pool.map(_export_one, tasks, chunksize=chunksize))
+
+
+def _read_records(stream, fmt):
+    # Baca rekaman satu per satu (generator), tepat satu rekaman per baris data; baris kosong
+    # menjadi rekaman error. fmt 'auto' ditebak dari baris tidak kosong pertama
+    import csv
+    import itertools
+
+    lines = iter(stream)
+    head = []
+    for line in lines:
+        head.append(line)
+        if line.strip():
+            break
+    if not head:
+        return
+    if fmt == 'auto':
+        fmt = 'jsonl' if head[-1].lstrip().startswith('{') else 'csv'
+    lines = itertools.chain(head, lines)
+    if fmt == 'jsonl':
+        for line in lines:
+            if not line.strip():
+                yield {'_error': "baris kosong"}
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError as exc:
+                yield {'_error': f"JSON tidak valid: {exc}"}
+    else:
+        header = None
+        for row in csv.reader(lines):
+            if not row:
+                yield {'_error': "baris kosong"}
+            elif header is None:
+                header = row
+            else:
+                yield dict(zip(header, row))
+
+
+def _chunked(iterable, size):
+    import itertools
+
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def solve_records(records, kind='max'):
+    """
+    Selesaikan satu potongan rekaman; mengembalikan satu dict hasil per rekaman (urutan sama)
+
+    Rekaman dengan 'constraints' diselesaikan dengan solve_2d(); rekaman berbentuk tetap
+    ('kind' dan koefisien seperti solve_max/solve_min/solve_mixed) dikelompokkan per kind
+    lalu diselesaikan sekaligus dengan solve_batch(). Rekaman yang gagal (termasuk baris
+    kosong atau bukan objek) menghasilkan {'status': 'error', 'error': ...}.
+    """
+    results = [None]*len(records)
+    groups = {}
+    for i, record in enumerate(records):
+        try:
+            if not isinstance(record, dict):
+                raise TypeError(f"rekaman harus objek, bukan {type(record).__name__}")
+            if '_error' in record:
+                raise ValueError(record['_error'])
+            if 'constraints' in record:
+                res = solve_2d([tuple(con) for con in record['constraints']], float(record['g']),
+                               float(record['h']), record.get('sense', 'max'),
+                               bool(record.get('nonneg', True)))
+                results[i] = {'status': res.status, 'x': res.x, 'y': res.y, 'z': res.z}
+                continue
+            k = record.get('kind') or kind
+            if k not in _SHAPE_FIELDS:
+                raise ValueError(f"kind harus 'max', 'min', atau 'mixed', bukan {k!r}")
+            fields = _SHAPE_FIELDS['max'] if 'a1' in record else _SHAPE_FIELDS['min']
+            row = [float(record[name]) for name in fields]
+            index, rows = groups.setdefault(k, ([], []))
+            index.append(i)
+            rows.append(row)
+        except Exception as exc:
+            # Setiap rekaman yang gagal menjadi rekaman error; potongan lainnya tetap diselesaikan
+            if isinstance(exc, KeyError):
+                message = f"kolom {exc} tidak ada"
+            elif isinstance(exc, (TypeError, ValueError)):
+                message = str(exc)
+            else:
+                message = f"{type(exc).__name__}: {exc}"
+            results[i] = {'status': 'error', 'error': message}
+
+    for k, (index, rows) in groups.items():
+        out = solve_batch(*np.array(rows, dtype=np.float64).T, kind=k)
+        for i, (x, y, z, status, _) in zip(index, out.tolist()):
+            if status == STATUS_OPTIMAL:
+                results[i] = {'status': STATUS_NAMES[status], 'x': x, 'y': y, 'z': z}
+            else:
+                results[i] = {'status': STATUS_NAMES[status], 'x': None, 'y': None, 'z': None}
+
+    for record, result in zip(records, results):
+        if isinstance(record, dict) and 'id' in record:
+            result['id'] = record['id']
+    return results
+
+
+def main(argv=None):
+    """
+    Titik masuk `python -m isoline`: selesaikan rekaman JSONL/CSV secara streaming
+
+    Setiap baris masukan menghasilkan tepat satu baris keluaran (status, x, y, z, dan id
+    jika ada) di stdout. Masukan dibaca per potongan sehingga memori tetap konstan.
+    """
+    import argparse
+    import csv
+
+    parser = argparse.ArgumentParser(
+        prog='python -m isoline',
+        description="Selesaikan program linear 2 variabel dari JSONL/CSV (satu masalah per baris).")
+    parser.add_argument('input', nargs='?', default='-', help="berkas masukan (default '-' = stdin)")
+    parser.add_argument('--format', choices=['auto', 'jsonl', 'csv'], default='auto',
+                        help="format masukan (default: ditebak dari baris pertama)")
+    parser.add_argument('--output-format', choices=['jsonl', 'csv'], default='jsonl')
+    parser.add_argument('--kind', choices=['max', 'min', 'mixed'], default='max',
+                        help="kind untuk rekaman berbentuk tetap tanpa kolom 'kind'")
+    parser.add_argument('--chunk-size', type=int, default=16384,
+                        help="jumlah rekaman per potongan solve_batch")
+    args = parser.parse_args(argv)
+
+    stream = sys.stdin if args.input == '-' else open(args.input, newline='')
+    out = sys.stdout
+    try:
+        writer = None
+        for chunk in _chunked(_read_records(stream, args.format), args.chunk_size):
+            results = solve_records(chunk, args.kind)
+            if args.output_format == 'jsonl':
+                out.write(''.join(json.dumps(result) + '\n' for result in results))
+            else:
+                if writer is None:
+                    writer = csv.DictWriter(out, ['id', 'status', 'x', 'y', 'z', 'error'],
+                                            extrasaction='ignore', lineterminator='\n')
+                    writer.writeheader()
+                writer.writerows(results)
+            out.flush()
+    except BrokenPipeError:
+        # Pembaca hilir (misalnya head) sudah selesai; alihkan stdout agar flush akhir tidak gagal
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
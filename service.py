@@ -0,0 +1,261 @@
+"""
+Layanan HTTP lokal untuk isoline (asyncio, hanya pustaka standar)
+
+Jalankan:
+    python service.py                       # http://127.0.0.1:8000
+    python service.py --port 9000 --workers 4 --window 0.002
+
+Endpoint:
+    POST /solve   Body JSON satu rekaman atau daftar rekaman dengan format yang sama seperti
+                  `python -m isoline` (kind + koefisien, atau constraints/g/h/sense).
+                  Balasan: hasil JSON (status, x, y, z, id) dengan bentuk yang sama.
+    POST /render  Body JSON satu rekaman berbentuk tetap (kind + argumen maximize/minimize/
+                  optimize), opsional "format" ('png' atau 'svg') dan "dpi" (0 < dpi ≤ 600).
+                  Balasan: byte gambar; 422 jika masalahnya tidak feasible.
+    GET  /health  {"status": "ok", ...} beserta jumlah permintaan yang sedang diproses.
+
+Permintaan /solve yang datang bersamaan dalam jendela waktu singkat digabung menjadi satu
+panggilan solve_batch di kumpulan proses. Antrean dibatasi; jika penuh, layanan membalas
+503 agar latensi ekor tetap terkendali.
+"""
+
+import argparse
+import asyncio
+import json
+from concurrent.futures import ProcessPoolExecutor
+
+import isoline
+
+_REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+            413: 'Payload Too Large', 422: 'Unprocessable Entity', 500: 'Internal Server Error',
+            503: 'Service Unavailable'}
+
+# Resolusi render maksimum; gambar 12x8 inci pada dpi ini sudah sekitar 7200x4800 piksel
+_MAX_DPI = 600
+
+
+class Coalescer:
+    """
+    Gabungkan rekaman /solve yang datang bersamaan menjadi satu batch
+
+    Rekaman pertama membuka jendela selama window detik; batch dikirim ke pool saat
+    jendela habis atau saat jumlahnya mencapai max_batch. Setiap pemanggil menunggu
+    future miliknya sendiri.
+    """
+
+    def __init__(self, pool, window=0.002, max_batch=4096, max_pending=65536):
+        self.pool = pool
+        self.window = window
+        self.max_batch = max_batch
+        self.max_pending = max_pending
+        self.pending = 0
+        self._records = []
+        self._futures = []
+        self._timer = None
+        # Loop hanya memegang task secara lemah; simpan sampai selesai agar tidak dibuang GC
+        self._tasks = set()
+
+    async def solve(self, records):
+        if self.pending + len(records) > self.max_pending:
+            raise OverflowError("Antrean solve penuh")
+        loop = asyncio.get_running_loop()
+        futures = [loop.create_future() for _ in records]
+        self.pending += len(records)
+        self._records += records
+        self._futures += futures
+        if len(self._records) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._flush)
+        try:
+            return await asyncio.gather(*futures)
+        finally:
+            self.pending -= len(records)
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        records, futures = self._records, self._futures
+        self._records, self._futures = [], []
+        if records:
+            task = asyncio.ensure_future(self._run(records, futures))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, records, futures):
+        loop = asyncio.get_running_loop()
+        try:
+            results = await loop.run_in_executor(self.pool, isoline.solve_records, records)
+        except Exception as exc:
+            for future in futures:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        for future, result in zip(futures, results):
+            if not future.done():
+                future.set_result(result)
+
+
+class Service:
+    """
+    Server HTTP/1.1 minimal dengan keep-alive di atas asyncio.start_server
+
+    Parameter:
+        workers     : Jumlah proses pekerja untuk solve dan render (default: jumlah core)
+        window      : Jendela penggabungan /solve dalam detik
+        max_batch   : Ukuran batch maksimum satu panggilan solve
+        max_pending : Batas rekaman /solve yang menunggu sebelum membalas 503
+        max_renders : Batas render yang menunggu sebelum membalas 503
+        max_body    : Ukuran body maksimum (byte)
+    """
+
+    def __init__(self, workers=None, window=0.002, max_batch=4096, max_pending=65536,
+                 max_renders=64, max_body=8 << 20):
+        self.workers = workers or isoline.cpu_count()
+        self.pool = ProcessPoolExecutor(max_workers=self.workers, initializer=isoline.init_render_worker)
+        self.coalescer = Coalescer(self.pool, window, max_batch, max_pending)
+        self.max_renders = max_renders
+        self.max_body = max_body
+        self.renders = 0
+
+    async def serve(self, host='127.0.0.1', port=8000):
+        # Hangatkan semua pekerja lebih dulu agar permintaan pertama tidak membayar waktu start proses
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*[loop.run_in_executor(self.pool, int) for _ in range(self.workers)])
+        server = await asyncio.start_server(self._connection, host, port)
+        async with server:
+            await server.serve_forever()
+
+    def close(self):
+        self.pool.shutdown(cancel_futures=True)
+
+    async def _connection(self, reader, writer):
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b'\r\n\r\n')
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    return
+                lines = head.decode('latin-1').split('\r\n')
+                try:
+                    method, target, version = lines[0].split(' ', 2)
+                except ValueError:
+                    await self._send(writer, 400, {'error': 'request line tidak valid'}, False)
+                    return
+                headers = {}
+                for line in lines[1:]:
+                    if ':' in line:
+                        name, value = line.split(':', 1)
+                        headers[name.strip().lower()] = value.strip()
+                keep_alive = (headers.get('connection', '').lower() != 'close'
+                              and version.upper() == 'HTTP/1.1')
+                try:
+                    length = int(headers.get('content-length') or 0)
+                except ValueError:
+                    length = -1
+                if length < 0:
+                    await self._send(writer, 400, {'error': 'Content-Length tidak valid'}, False)
+                    return
+                if length > self.max_body:
+                    await self._send(writer, 413, {'error': 'body terlalu besar'}, False)
+                    return
+                body = await reader.readexactly(length) if length else b''
+                try:
+                    status, payload, content_type = await self._dispatch(method, target.split('?')[0], body)
+                except Exception as exc:
+                    status, payload, content_type = 500, {'error': f'{type(exc).__name__}: {exc}'}, None
+                await self._send(writer, status, payload, keep_alive, content_type)
+                if not keep_alive:
+                    return
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def _dispatch(self, method, path, body):
+        if path == '/health':
+            return 200, {'status': 'ok', 'pending_solves': self.coalescer.pending,
+                         'pending_renders': self.renders}, None
+        if path not in ('/solve', '/render'):
+            return 404, {'error': f'tidak ada endpoint {path}'}, None
+        if method != 'POST':
+            return 405, {'error': 'gunakan POST'}, None
+        try:
+            request = json.loads(body)
+        except ValueError as exc:
+            return 400, {'error': f'JSON tidak valid: {exc}'}, None
+        if path == '/solve':
+            return await self._solve(request)
+        return await self._render_request(request)
+
+    async def _solve(self, request):
+        single = isinstance(request, dict)
+        records = [request] if single else request
+        if not isinstance(records, list) or not all(isinstance(r, dict) for r in records):
+            return 400, {'error': 'body harus objek JSON atau daftar objek'}, None
+        try:
+            results = await self.coalescer.solve(records)
+        except OverflowError as exc:
+            return 503, {'error': str(exc)}, None
+        return 200, results[0] if single else results, None
+
+    async def _render_request(self, request):
+        if not isinstance(request, dict):
+            return 400, {'error': 'body harus objek JSON'}, None
+        problem = dict(request)
+        fmt = problem.pop('format', 'png')
+        dpi = problem.pop('dpi', 100)
+        problem.pop('id', None)
+        if problem.get('kind', 'max') not in ('max', 'min', 'mixed') or fmt not in ('png', 'svg'):
+            return 400, {'error': "kind harus 'max', 'min', atau 'mixed'; format 'png' atau 'svg'"}, None
+        if isinstance(dpi, bool) or not isinstance(dpi, (int, float)) or not 0 < dpi <= _MAX_DPI:
+            return 400, {'error': f'dpi harus angka positif paling besar {_MAX_DPI}'}, None
+        if self.renders >= self.max_renders:
+            return 503, {'error': 'antrean render penuh'}, None
+        self.renders += 1
+        try:
+            loop = asyncio.get_running_loop()
+            image = await loop.run_in_executor(self.pool, isoline.render_figure, problem, fmt, dpi)
+        except (TypeError, ValueError) as exc:
+            return 400, {'error': str(exc)}, None
+        finally:
+            self.renders -= 1
+        if image is None:
+            return 422, {'status': 'infeasible'}, None
+        return 200, image, 'image/png' if fmt == 'png' else 'image/svg+xml'
+
+    @staticmethod
+    async def _send(writer, status, payload, keep_alive, content_type=None):
+        if content_type is None:
+            payload = json.dumps(payload).encode()
+            content_type = 'application/json'
+        head = (f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+                f"Content-Type: {content_type}\r\n"
+                f"Content-Length: {len(payload)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        writer.write(head.encode('latin-1') + payload)
+        await writer.drain()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Layanan HTTP lokal untuk isoline")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--workers', type=int, help='jumlah proses pekerja (default: jumlah core)')
+    parser.add_argument('--window', type=float, default=0.002, help='jendela penggabungan /solve (detik)')
+    parser.add_argument('--max-batch', type=int, default=4096)
+    args = parser.parse_args(argv)
+
+    service = Service(args.workers, args.window, args.max_batch)
+    print(f"isoline service di http://{args.host}:{args.port}")
+    try:
+        asyncio.run(service.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service.close()
+
+
+if __name__ == '__main__':
+    main()
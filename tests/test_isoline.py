@@ -0,0 +1,757 @@
+import math
+
+import numpy as np
+import pytest
+
+import isoline
+from isoline import solve_2d
+
+_SIGNS = {'<=': 1, '>=': -1, '=': 0}
+
+
+def _satisfies(constraints, x, y, nonneg=True, tol=1e-7):
+    # Periksa bahwa (x, y) memenuhi semua batasan (toleransi relatif terhadap ruas kanan)
+    if nonneg and (x < -tol or y < -tol):
+        return False
+    for a, b, s, c in constraints:
+        lhs, slack = a*x + b*y, tol*max(1.0, abs(c))
+        if (_SIGNS[s] > 0 and lhs > c + slack) or (_SIGNS[s] < 0 and lhs < c - slack) \
+                or (_SIGNS[s] == 0 and abs(lhs - c) > slack):
+            return False
+    return True
+
+
+# solve_2d: optimum yang diketahui
+
+@pytest.mark.parametrize('constraints, g, h, sense, point, z', [
+    ([(1, 1, '<=', 4), (1, 3, '<=', 6), (1, 0, '<=', 3)], 3, 2, 'max', (3, 1), 11),
+    ([(1, 2, '>=', 4), (3, 1, '>=', 6)], 1, 1, 'min', (1.6, 1.2), 2.8),
+    ([(2, 1, '<=', 300), (1, 2, '<=', 300)], 150, 100, 'max', (100, 100), 25000),
+    ([(1, 1, '=', 5), (1, -1, '<=', 1)], 2, 1, 'min', (0, 5), 5),
+    ([(1, 1, '>=', 2), (1, 0, '<=', 4), (0, 1, '<=', 3)], -1, 1, 'max', (0, 3), 3),
+])
+def test_solve_2d_known_optimum(constraints, g, h, sense, point, z):
+    res = solve_2d(constraints, g, h, sense)
+    assert res.status == 'optimal'
+    assert res.x == pytest.approx(point[0], abs=1e-9)
+    assert res.y == pytest.approx(point[1], abs=1e-9)
+    assert res.z == pytest.approx(z)
+
+
+def test_solve_2d_many_constraints_uses_presolve_path():
+    # Poligon beraturan 16 sisi di sekitar origin (juga 16 batasan dominan yang dibuang
+    # presolve); maksimum x + y ada di sisi berarah 45 derajat
+    angles = np.arange(16)*2*np.pi/16
+    constraints = [(math.cos(t), math.sin(t), '<=', 1.0) for t in angles]
+    constraints += [(math.cos(t), math.sin(t), '<=', 2.0) for t in angles]
+    res = solve_2d(constraints, 1, 1, 'max', nonneg=False)
+    assert res.status == 'optimal'
+    assert res.z == pytest.approx(math.sqrt(2))
+    assert _satisfies(constraints, res.x, res.y, nonneg=False)
+    res = solve_2d(constraints, 1, 0, 'min', nonneg=False)
+    assert res.z == pytest.approx(-1.0)
+
+
+@pytest.mark.parametrize('constraints, nonneg', [
+    ([(1, 1, '<=', 1), (1, 1, '>=', 2)], True),
+    ([(1, 0, '<=', -1)], True),
+    ([(1, 1, '=', 4), (1, 0, '>=', 5), (0, 1, '>=', 0)], True),
+    ([(1, 0, '>=', 1), (1, 0, '<=', 0)], False),
+])
+def test_solve_2d_infeasible(constraints, nonneg):
+    res = solve_2d(constraints, 1, 1, 'max', nonneg)
+    assert res.status == 'infeasible'
+    assert res.x is None and res.z is None
+
+
+@pytest.mark.parametrize('constraints, g, h, sense, nonneg', [
+    ([(1, -1, '<=', 1)], 1, 1, 'max', True),
+    ([(1, 1, '>=', 2)], 1, 1, 'max', True),
+    ([(1, 1, '<=', 4)], 1, 0, 'min', False),
+    ([(1, -1, '=', 0)], 1, 1, 'max', True),
+])
+def test_solve_2d_unbounded(constraints, g, h, sense, nonneg):
+    assert solve_2d(constraints, g, h, sense, nonneg).status == 'unbounded'
+
+
+def test_solve_2d_bounded_direction_on_unbounded_region():
+    # Daerah tak terbatas, tetapi minimum x + y tetap ada
+    res = solve_2d([(1, 1, '>=', 2), (1, -1, '<=', 1)], 1, 1, 'min')
+    assert res.status == 'optimal'
+    assert res.z == pytest.approx(2.0)
+
+
+def test_solve_2d_matches_vertex_enumeration():
+    # Bandingkan dengan pencarian semua perpotongan pasangan garis batasan
+    rng = np.random.default_rng(3)
+    for _ in range(200):
+        m = int(rng.integers(2, 12))
+        constraints = [(float(rng.uniform(-1, 3)), float(rng.uniform(-1, 3)), '<=',
+                        float(rng.uniform(1, 10))) for _ in range(m)]
+        constraints += [(1.0, 0.0, '<=', 20.0), (0.0, 1.0, '<=', 20.0)]
+        g, h = rng.uniform(-5, 5, 2)
+        sense = 'max' if rng.random() < 0.5 else 'min'
+        lines = [(a, b, c) for a, b, _, c in constraints] + [(1.0, 0.0, 0.0), (0.0, 1.0, 0.0)]
+        best = None
+        for i in range(len(lines)):
+            for j in range(i + 1, len(lines)):
+                (a1, b1, c1), (a2, b2, c2) = lines[i], lines[j]
+                det = a1*b2 - a2*b1
+                if abs(det) < 1e-12:
+                    continue
+                x, y = (c1*b2 - c2*b1)/det, (a1*c2 - a2*c1)/det
+                if _satisfies(constraints, x, y):
+                    z = g*x + h*y
+                    if best is None or (z > best if sense == 'max' else z < best):
+                        best = z
+        res = solve_2d(constraints, g, h, sense)
+        if best is None:
+            assert res.status == 'infeasible'
+        else:
+            assert res.status == 'optimal'
+            assert res.z == pytest.approx(best, rel=1e-9, abs=1e-9)
+            assert _satisfies(constraints, res.x, res.y)
+
+
+def test_solve_2d_rejects_unknown_sign_and_sense():
+    with pytest.raises(ValueError):
+        solve_2d([(1, 1, '<>', 4)], 1, 1)
+    with pytest.raises(ValueError):
+        solve_2d([(1, 1, '<=', 4)], 1, 1, 'maximum')
+
+
+# solve_lp: simplex revisi n variabel
+
+@pytest.mark.parametrize('kwargs, x, z', [
+    (dict(c=[3, 2, 4], A=[[1, 1, 2], [2, 0, 3], [2, 1, 3]], senses=['<=']*3, b=[4, 5, 7],
+          upper=[np.inf, np.inf, 1.5]), [2.5, 1.5, 0], 10.5),
+    (dict(c=[2, 3, 1], A=[[1, 1, 1], [1, -2, 0], [1, 0, -1]], senses=['>=', '>=', '='],
+          b=[10, 4, 2], sense='min'), [6, 0, 4], 16),
+    (dict(c=[1, 1], A=[[1, 0]], senses=['>='], b=[-3], lower=[-5, -2], upper=[np.inf, 4],
+          sense='min'), [-3, -2], -5),
+])
+def test_solve_lp_known_optimum(kwargs, x, z):
+    res = isoline.solve_lp(**kwargs)
+    assert res.status == 'optimal'
+    assert res.x == pytest.approx(x, abs=1e-9)
+    assert res.z == pytest.approx(z)
+
+
+@pytest.mark.parametrize('pricing', ['devex', 'bland'])
+def test_solve_lp_degenerate_cycling_example(pricing):
+    # Contoh Beale: aturan Dantzig murni berputar tanpa henti pada masalah ini
+    res = isoline.solve_lp([-0.75, 20, -0.5, 6],
+                           [[0.25, -8, -1, 9], [0.5, -12, -0.5, 3], [0, 0, 1, 0]],
+                           ['<=']*3, [0, 0, 1], sense='min', pricing=pricing)
+    assert res.status == 'optimal'
+    assert res.z == pytest.approx(-1.25)
+    assert res.x == pytest.approx([1, 0, 1, 0], abs=1e-9)
+
+
+@pytest.mark.parametrize('kwargs, status', [
+    (dict(c=[1, 1], A=[[1, 1], [1, 1]], senses=['<=', '>='], b=[1, 3]), 'infeasible'),
+    (dict(c=[1, 1, 1], A=[[1, -1, 0], [0, 0, 1]], senses=['<=', '<='], b=[1, 2]), 'unbounded'),
+    (dict(c=[1, -1], A=[[1, 1]], senses=['='], b=[2], sense='min', lower=[-np.inf, 0]), 'unbounded'),
+    (dict(c=[1, 1], lower=[2, 0], upper=[1, 5]), 'infeasible'),
+])
+def test_solve_lp_status(kwargs, status):
+    res = isoline.solve_lp(**kwargs)
+    assert res.status == status
+    assert res.x is None and res.z is None
+
+
+def test_solve_lp_matches_solve_2d():
+    rng = np.random.default_rng(4)
+    for _ in range(200):
+        m = int(rng.integers(1, 6))
+        constraints = [(float(rng.integers(-3, 6)), float(rng.integers(-3, 6)),
+                        str(rng.choice(['<=', '>=', '='], p=[0.6, 0.3, 0.1])),
+                        float(rng.integers(-2, 20))) for _ in range(m)]
+        g, h = (float(v) for v in rng.integers(-5, 6, 2))
+        sense = 'max' if rng.random() < 0.5 else 'min'
+        planar = solve_2d(constraints, g, h, sense)
+        res = isoline.solve_lp([g, h], [con[:2] for con in constraints], [con[2] for con in constraints],
+                               [con[3] for con in constraints], sense=sense)
+        assert res.status == planar.status, (constraints, g, h, sense)
+        if res.status == 'optimal':
+            assert res.z == pytest.approx(planar.z, rel=1e-9, abs=1e-9)
+            assert _satisfies(constraints, *res.x)
+
+
+def test_solve_lp_rejects_bad_input():
+    with pytest.raises(ValueError):
+        isoline.solve_lp([1, 1], [[1, 1]], ['<=', '<='], [1])
+    with pytest.raises(ValueError):
+        isoline.solve_lp([1, 1], [[1, 1]], ['<>'], [1])
+    with pytest.raises(ValueError):
+        isoline.solve_lp([1, 1], sense='maximum')
+    with pytest.raises(ValueError):
+        isoline.solve_lp([1, 1], pricing='dantzig')
+
+
+def test_solve_lp_plot_returns_simplex_solution():
+    matplotlib = pytest.importorskip('matplotlib')
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    kwargs = dict(c=[3, 2], A=[[1, 1], [1, 3], [2, 1]], senses=['<=', '<=', '<='], b=[4, 6, 7],
+                  upper=[3, np.inf])
+    res = isoline.solve_lp(**kwargs, plot=True)
+    assert len(plt.get_fignums()) == 1
+    plt.close('all')
+    assert res.status == 'optimal'
+    assert res.x == pytest.approx(isoline.solve_lp(**kwargs).x)
+    assert res.z == pytest.approx(11)
+
+
+# solve_integer: bandingkan dengan enumerasi semua titik bulat
+
+def _brute_integer(constraints, g, h, sense, lo, hi):
+    xs, ys = np.meshgrid(np.arange(lo, hi + 1), np.arange(lo, hi + 1))
+    xs, ys = xs.ravel().astype(float), ys.ravel().astype(float)
+    ok = np.ones(len(xs), dtype=bool)
+    for a, b, s, c in constraints:
+        lhs = a*xs + b*ys
+        ok &= lhs <= c + 1e-9 if _SIGNS[s] > 0 else lhs >= c - 1e-9 if _SIGNS[s] < 0 else np.abs(lhs - c) <= 1e-9
+    if not ok.any():
+        return None
+    z = g*xs[ok] + h*ys[ok]
+    return z.max() if sense == 'max' else z.min()
+
+
+@pytest.mark.parametrize('nonneg', [True, False])
+def test_solve_integer_matches_brute_force(nonneg):
+    rng = np.random.default_rng(18 + nonneg)
+    lo = 0 if nonneg else -15
+    for _ in range(300):
+        m = int(rng.integers(1, 5))
+        constraints = [(int(rng.integers(-7, 8)), int(rng.integers(-7, 8)),
+                        str(rng.choice(['<=', '>=', '='], p=[0.6, 0.3, 0.1])),
+                        int(rng.integers(-20, 60))) for _ in range(m)]
+        # Kotak batas agar enumerasi berhingga
+        constraints += [(1, 0, '<=', 15), (0, 1, '<=', 15), (1, 0, '>=', lo), (0, 1, '>=', lo)]
+        g, h = (float(v) for v in rng.uniform(-5, 5, 2))
+        sense = 'max' if rng.random() < 0.5 else 'min'
+        best = _brute_integer(constraints, g, h, sense, lo, 15)
+        res = isoline.solve_integer(constraints, g, h, sense, nonneg)
+        if best is None:
+            assert res.status == 'infeasible', (constraints, g, h, sense)
+        else:
+            assert res.status == 'optimal', (constraints, g, h, sense)
+            assert res.z == pytest.approx(best, rel=1e-9, abs=1e-9)
+            assert res.x == round(res.x) and res.y == round(res.y)
+            assert _satisfies(constraints, res.x, res.y, nonneg)
+
+
+def test_solve_integer_known_cases():
+    # Optimum kontinu (3.75, 1.25) bukan titik bulat; optimum bulat (4, 0) dengan Z = 20
+    res = isoline.solve_integer([(6, 4, '<=', 24.5), (1, 2, '<=', 6.2)], 5, 4, 'max')
+    assert (res.status, res.x, res.y) == ('optimal', 4, 0)
+    assert res.z == pytest.approx(20)
+    # Daerah feasible tipis tanpa titik bulat
+    assert isoline.solve_integer([(1, 0, '>=', 0.2), (1, 0, '<=', 0.8)], 1, 1, 'min').status == 'infeasible'
+    assert isoline.solve_integer([(1, -1, '<=', 1)], 1, 1, 'max').status == 'unbounded'
+    assert isoline.solve_integer([(1, 1, '<=', 1), (1, 1, '>=', 2)], 1, 1).status == 'infeasible'
+
+
+# presolve: sertifikat harus benar-benar membuktikan statusnya
+
+def _check_infeasible_certificate(constraints, certificate):
+    rows = {-1: (-1.0, 0.0, 0.0), -2: (0.0, -1.0, 0.0)}
+    for i, (a, b, s, c) in enumerate(constraints):
+        rows[i] = (_SIGNS[s]*a, _SIGNS[s]*b, _SIGNS[s]*c)
+    total = np.zeros(3)
+    for r, lam in zip(certificate['rows'], certificate['multipliers']):
+        assert lam >= 0
+        total += lam*np.array(rows[r])
+    scale = max(1.0, max(abs(c) for *_, c in constraints))
+    assert abs(total[0]) <= 1e-9 and abs(total[1]) <= 1e-9
+    assert total[2] < -1e-9*scale
+
+
+def _check_unbounded_certificate(constraints, g, h, sense, certificate, nonneg=True):
+    x, y = certificate['point']
+    dx, dy = certificate['ray']
+    assert _satisfies(constraints, x, y, nonneg)
+    # Arah resesi: setiap titik di sepanjang sinar tetap feasible
+    for a, b, s, _ in constraints:
+        assert _SIGNS[s]*(a*dx + b*dy) <= 1e-9 if _SIGNS[s] else abs(a*dx + b*dy) <= 1e-9
+    if nonneg:
+        assert dx >= -1e-12 and dy >= -1e-12
+    assert (1 if sense == 'max' else -1)*(g*dx + h*dy) > 0
+
+
+def test_presolve_certificates_known_cases():
+    cons = [(1, 1, '<=', 1), (1, 1, '>=', 2)]
+    pre = isoline.presolve(cons)
+    assert pre['status'] == 'infeasible'
+    _check_infeasible_certificate(cons, pre['certificate'])
+    # Kotak x ≥ 0, y ≥ 0 ikut dalam bukti
+    cons = [(1, 1, '<=', -1)]
+    pre = isoline.presolve(cons)
+    assert pre['status'] == 'infeasible'
+    assert set(pre['certificate']['rows']) <= {0, -1, -2}
+    _check_infeasible_certificate(cons, pre['certificate'])
+    cons = [(1, -1, '<=', 1), (1, 2, '>=', 2)]
+    pre = isoline.presolve(cons, 1, 1, 'max')
+    assert pre['status'] == 'unbounded'
+    _check_unbounded_certificate(cons, 1, 1, 'max', pre['certificate'])
+    pre = isoline.presolve(cons, 1, 1, 'min')
+    assert pre['status'] == 'reduced' and pre['certificate'] is None
+
+
+@pytest.mark.parametrize('nonneg', [True, False])
+def test_presolve_certificates_random(nonneg):
+    rng = np.random.default_rng(21 + nonneg)
+    seen = set()
+    for _ in range(1000):
+        m = int(rng.integers(1, 12))
+        constraints = [(float(rng.integers(-5, 6)), float(rng.integers(-5, 6)),
+                        str(rng.choice(['<=', '>='])), float(rng.integers(-10, 11))) for _ in range(m)]
+        g, h = (float(v) for v in rng.integers(-3, 4, 2))
+        sense = 'max' if rng.random() < 0.5 else 'min'
+        pre = isoline.presolve(constraints, g, h, sense, nonneg)
+        seen.add(pre['status'])
+        if pre['status'] == 'infeasible':
+            _check_infeasible_certificate(constraints, pre['certificate'])
+            assert solve_2d(constraints, g, h, sense, nonneg).status == 'infeasible'
+        elif pre['status'] == 'unbounded':
+            _check_unbounded_certificate(constraints, g, h, sense, pre['certificate'], nonneg)
+            assert solve_2d(constraints, g, h, sense, nonneg).status == 'unbounded'
+        else:
+            assert pre['certificate'] is None
+            # Batasan yang dibuang tidak mengubah hasil
+            full = solve_2d(constraints, g, h, sense, nonneg)
+            if pre['constraints'] and full.status == 'optimal':
+                reduced = solve_2d(pre['constraints'], g, h, sense, nonneg)
+                assert reduced.status == 'optimal'
+                assert reduced.z == pytest.approx(full.z, rel=1e-9, abs=1e-9)
+    assert seen == {'infeasible', 'unbounded', 'reduced'}
+
+
+# read_lp / read_mps: model yang sama dari kedua format
+
+_LP_TEXT = """\\ Model uji
+Maximize
+ obj: 3 x + 2 y - z + 10
+Subject To
+ c1: x + y + z <= 4
+ c2: x + 3 y
+     - z >= -2
+ c3: x - y + 2 z = 1
+ c4: -3 <= x - z <= 5
+Bounds
+ x <= 3
+ -1 <= z <= 2
+Generals
+ y
+End
+"""
+
+_MPS_TEXT = """NAME          UJI
+OBJSENSE
+    MAX
+ROWS
+ N  obj
+ L  c1
+ G  c2
+ E  c3
+ G  c4
+COLUMNS
+    x         obj       3            c1        1
+    x         c2        1            c3        1
+    x         c4        1
+    MARKER    'MARKER'  'INTORG'
+    y         obj       2            c1        1
+    y         c2        3            c3        -1
+    MARKER    'MARKER'  'INTEND'
+    z         obj       -1           c1        1
+    z         c2        -1           c3        2
+    z         c4        -1
+RHS
+    RHS       obj       -10          c1        4
+    RHS       c2        -2           c3        1
+    RHS       c4        -3
+RANGES
+    RNG       c4        8
+BOUNDS
+ UP BND       x         3
+ LO BND       z         -1
+ UP BND       z         2
+ENDATA
+"""
+
+
+def _model_fields(m):
+    return (m.sense, m.c.tolist(), m.offset, m.dense().tolist(), m.signs.tolist(), m.b.tolist(),
+            m.lower.tolist(), m.upper.tolist(), m.integer.tolist(), m.var_names, m.row_names)
+
+
+def test_read_lp_and_read_mps_agree(tmp_path):
+    (tmp_path / 'uji.lp').write_text(_LP_TEXT)
+    (tmp_path / 'uji.mps').write_text(_MPS_TEXT)
+    lp = isoline.read_model(tmp_path / 'uji.lp')
+    mps = isoline.read_model(tmp_path / 'uji.mps')
+    assert _model_fields(lp) == _model_fields(mps)
+    assert lp.c.tolist() == [3, 2, -1] and lp.offset == 10
+    # Ruas kanan negatif tetap negatif; batasan berjangkauan menjadi ≥ lalu ≤
+    assert lp.signs.tolist() == [1, -1, 0, -1, 1]
+    assert lp.b.tolist() == [4, -2, 1, -3, 5]
+    assert lp.row_names == ['c1', 'c2', 'c3', 'c4', 'c4']
+    assert lp.lower.tolist() == [0, 0, -1] and lp.upper.tolist() == [3, np.inf, 2]
+    assert lp.solve().z == pytest.approx(mps.solve().z)
+
+
+def test_read_mps_gzip_round_trip(tmp_path):
+    import gzip
+    with gzip.open(tmp_path / 'uji.mps.gz', 'wt') as fh:
+        fh.write(_MPS_TEXT)
+    (tmp_path / 'uji.mps').write_text(_MPS_TEXT)
+    assert _model_fields(isoline.read_model(tmp_path / 'uji.mps.gz')) == \
+        _model_fields(isoline.read_model(tmp_path / 'uji.mps'))
+
+
+@pytest.mark.parametrize('objective', ['10 + 3 x + 2 y', '3 x + 10 + 2 y', '3 x + 2 y + 10',
+                                       '3 x + 2 y\n + 10', '12 + 3 x - 2 + 2 y'])
+def test_read_lp_objective_constant_position(tmp_path, objective):
+    path = tmp_path / 'konstanta.lp'
+    path.write_text(f"Maximize\n obj: {objective}\nSubject To\n"
+                    " c1: x + y <= 4\n c2: x + 3 y <= 6\n c3: x <= 3\nEnd\n")
+    m = isoline.read_lp(path)
+    assert m.c.tolist() == [3, 2] and m.offset == 10
+    res = m.solve()
+    assert (res.x, res.y) == pytest.approx((3, 1))
+    assert res.z == pytest.approx(21)
+
+
+@pytest.mark.parametrize('row, rhs', [('2 + 3 x + y <= 4', 2), ('3 x - 2 + y <= 4', 6),
+                                      ('3 x + y + 1 <= 4', 3), ('3 x + y - 1 >= -4', -3),
+                                      ('- 2 + 3 x + y = 4', 6)])
+def test_read_lp_constraint_constant_moves_to_rhs(tmp_path, row, rhs):
+    path = tmp_path / 'batasan.lp'
+    path.write_text(f"Minimize\n obj: x + y\nSubject To\n c1: {row}\nEnd\n")
+    m = isoline.read_lp(path)
+    assert m.dense().tolist() == [[3, 1]]
+    assert m.b.tolist() == [rhs]
+
+
+def test_read_lp_rejects_bad_input(tmp_path):
+    path = tmp_path / 'salah.lp'
+    path.write_text("Minimize\n obj: x + y\nSubject To\n c1: x + y <=\nEnd\n")
+    with pytest.raises(ValueError):
+        isoline.read_lp(path)
+    path.write_text("Minimize\n obj: x <= 2\nEnd\n")
+    with pytest.raises(ValueError):
+        isoline.read_lp(path)
+
+
+# Problem: isoline hanya di dalam daerah feasible
+
+@pytest.mark.parametrize('sense', ['max', 'min'])
+def test_problem_isolines_inside_feasible_region(sense):
+    matplotlib = pytest.importorskip('matplotlib')
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    constraints = [(1, 1, '>=', 2), (1, 2, '<=', 8), (3, 1, '<=', 12)]
+    p = isoline.Problem(constraints, 2, 3, sense, x_max=10, y_max=10)
+    try:
+        for step in range(2):
+            p.draw()
+            res = p.result
+            segments = p._artists['isolines'].get_segments()
+            assert len(segments) > 1
+            for segment in segments:
+                for x, y in segment:
+                    assert _satisfies(p.constraints, x, y)
+                    z = 2*x + 3*y
+                    assert (z <= res.z + 1e-9) if sense == 'max' else (z >= res.z - 1e-9)
+            # Batasan tambahan yang tidak aktif hanya mengecilkan daerah feasible
+            p.add_constraint(0, 1, '<=' if sense == 'max' else '>=', 0.5 if sense == 'min' else 3.9)
+    finally:
+        plt.close('all')
+
+
+# SolveCache: kunci ternormalisasi dan LRU
+
+def test_solve_cache_hits_row_scaled_duplicates():
+    cache = isoline.SolveCache()
+    base = isoline.solve_max(2, 1, 300, 1, 2, 300, 150, 100, 300, 300, cache=cache)
+    scaled = isoline.solve_max(4, 2, 600, 0.5, 1, 150, 300, 200, 300, 300, cache=cache)
+    assert cache.info()['hits'] == 1 and cache.info()['misses'] == 1 and len(cache) == 1
+    assert (scaled.x, scaled.y) == (base.x, base.y)
+    # Z dikalikan kembali dengan skala fungsi tujuan
+    assert scaled.z == pytest.approx(2*base.z)
+    assert scaled.z == pytest.approx(isoline.solve_max(4, 2, 600, 0.5, 1, 150, 300, 200, 300, 300).z)
+    # Derau floating point di bawah 10**-digits tidak memecah kunci
+    isoline.solve_max(2*(1 + 1e-13), 1, 300, 1, 2, 300, 150, 100, 300, 300, cache=cache)
+    assert cache.hits == 2
+
+
+@pytest.mark.parametrize('kind', ['max', 'min', 'mixed'])
+def test_solve_cache_misses_distinct_problems(kind):
+    cache = isoline.SolveCache(digits=6)
+    solver = {'max': isoline.solve_max, 'min': isoline.solve_min, 'mixed': isoline.solve_mixed}[kind]
+    args = [2, 1, 300, 1, 2, 300, 150, 100, 300, 300]
+    solver(*args, cache=cache)
+    for k in range(len(args)):
+        changed = list(args)
+        # Kunci dinormalkan per baris (koefisien terbesar 300), jadi selisih relatif 1e-3
+        # pada koefisien terkecil masih sekitar 3e-6 > 10**-6
+        changed[k] = args[k]*(1 + 1e-3)
+        res = solver(*changed, cache=cache)
+        assert res.z == pytest.approx(solver(*changed).z)
+    assert cache.hits == 0 and cache.misses == len(args) + 1
+    # Bentuk berbeda dengan koefisien sama tidak berbagi entri
+    other = {'max': isoline.solve_min, 'min': isoline.solve_max, 'mixed': isoline.solve_max}[kind]
+    other(*args, cache=cache)
+    assert cache.hits == 0
+
+
+def test_solve_cache_evicts_least_recently_used():
+    cache = isoline.SolveCache(maxsize=3)
+    problems = [(2, 1, 300 + k, 1, 2, 300, 150, 100, 300, 300) for k in range(4)]
+    for args in problems[:3]:
+        isoline.solve_max(*args, cache=cache)
+    isoline.solve_max(*problems[0], cache=cache)
+    isoline.solve_max(*problems[3], cache=cache)
+    assert len(cache) == 3 and cache.info()['maxsize'] == 3
+    # problems[1] paling lama tidak dipakai, jadi dibuang; problems[0] tetap ada
+    isoline.solve_max(*problems[0], cache=cache)
+    assert cache.hits == 2
+    isoline.solve_max(*problems[1], cache=cache)
+    assert cache.misses == 5 and len(cache) == 3
+    cache.clear()
+    assert len(cache) == 0 and cache.info()['hit_rate'] == 0.0
+
+
+# BatchPool: hasil shard sama dengan solve_batch
+
+def _random_batch(n, seed):
+    # Koefisien bulat kecil agar ada batasan sejajar, koefisien nol, dan masalah tidak feasible
+    rng = np.random.default_rng(seed)
+    cols = [rng.integers(0, 6, n).astype(float) for _ in range(2)] + [rng.integers(-5, 40, n).astype(float)]
+    cols += [rng.integers(0, 6, n).astype(float) for _ in range(2)] + [rng.integers(-5, 40, n).astype(float)]
+    cols += [rng.integers(-3, 6, n).astype(float) for _ in range(2)]
+    return cols + [np.full(n, 50.0), rng.integers(5, 60, n).astype(float)]
+
+
+def _assert_results_equal(got, expected):
+    for field in isoline.RESULT_DTYPE.names:
+        np.testing.assert_array_equal(got[field], expected[field], err_msg=field)
+
+
+@pytest.mark.parametrize('kind', ['max', 'min', 'mixed'])
+def test_batch_pool_matches_solve_batch(kind):
+    cols = _random_batch(5000, 20)
+    expected = isoline.solve_batch(*cols, kind=kind)
+    assert set(np.unique(expected['status'])) == {isoline.STATUS_OPTIMAL, isoline.STATUS_INFEASIBLE}
+    with isoline.BatchPool(workers=2, chunk_size=700) as pool:
+        _assert_results_equal(pool.solve(*cols, kind=kind), expected)
+        assert len(pool.last_shards) == 8
+        out = np.empty(5000, dtype=isoline.RESULT_DTYPE)
+        assert pool.solve(*cols, kind=kind, out=out) is out
+        _assert_results_equal(out, expected)
+
+
+def test_batch_pool_rejects_bad_out():
+    cols = _random_batch(10, 21)
+    with isoline.BatchPool(workers=1) as pool:
+        for out in (np.empty(9, dtype=isoline.RESULT_DTYPE), np.empty((10, 1), dtype=isoline.RESULT_DTYPE),
+                    np.empty(10), np.empty(10, dtype=isoline.RESULT_DTYPE.descr[:4]), [None]*10):
+            with pytest.raises(ValueError):
+                pool.solve(*cols, out=out)
+        with pytest.raises(ValueError):
+            pool.solve(*cols, kind='maks')
+
+
+# solve_batch: sama dengan solve_max/solve_min/solve_mixed baris demi baris
+
+@pytest.mark.parametrize('kind', ['max', 'min', 'mixed'])
+def test_solve_batch_matches_scalar_solvers(kind):
+    solver = {'max': isoline.solve_max, 'min': isoline.solve_min, 'mixed': isoline.solve_mixed}[kind]
+    cols = _random_batch(2000, 2)
+    out = isoline.solve_batch(*cols, kind=kind)
+    assert set(np.unique(out['status'])) == {isoline.STATUS_OPTIMAL, isoline.STATUS_INFEASIBLE}
+    for i, row in enumerate(np.column_stack(cols)):
+        res = solver(*row)
+        assert isoline.STATUS_NAMES[out['status'][i]] == res.status, row
+        if res.status == 'optimal':
+            assert (out['x'][i], out['y'][i], out['z'][i]) == pytest.approx((res.x, res.y, res.z), abs=1e-9), row
+        else:
+            assert out['vertex'][i] == -1 and np.isnan(out['z'][i])
+
+
+def test_solve_batch_out():
+    cols = _random_batch(50, 3)
+    out = np.empty(50, dtype=isoline.RESULT_DTYPE)
+    assert isoline.solve_batch(*cols, out=out) is out
+    _assert_results_equal(out, isoline.solve_batch(*cols))
+    # Semua koefisien skalar: hasil yang sama diisikan ke seluruh out
+    full = isoline.solve_batch(*[c[0] for c in cols], out=np.empty(4, dtype=isoline.RESULT_DTYPE))
+    _assert_results_equal(full, np.repeat(isoline.solve_batch(*[c[:1] for c in cols]), 4))
+    for bad in (np.empty(49, dtype=isoline.RESULT_DTYPE), np.empty((50, 1), dtype=isoline.RESULT_DTYPE),
+                np.empty(50), np.empty(50, dtype=isoline.RESULT_DTYPE.descr[:4]), [None]*50):
+        with pytest.raises(ValueError):
+            isoline.solve_batch(*cols, out=bad)
+    with pytest.raises(ValueError):
+        isoline.solve_batch(*cols, kind='maks')
+
+
+# main: satu rekaman keluaran untuk setiap baris masukan, urutan tetap
+
+_RECORD = {'a1': 2, 'b1': 1, 'c1': 300, 'a2': 1, 'b2': 2, 'c2': 300, 'g': 150, 'h': 100,
+           'x_max': 300, 'y_max': 300}
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 100])
+def test_main_jsonl_one_record_per_line(tmp_path, capsys, chunk_size):
+    import json
+
+    lines = ['', json.dumps(dict(_RECORD, id=1)), '{rusak', '', '[1, 2]', json.dumps({'id': 5, 'a1': 2}),
+             json.dumps({'id': 6, 'constraints': [[1, 1, '<=', 4]], 'g': 1, 'h': 1}),
+             json.dumps(dict(_RECORD, id=7, kind='maks')),
+             json.dumps(dict(_RECORD, id=8, kind='min', c1=-1)), json.dumps(dict(_RECORD, id=9))]
+    path = tmp_path / 'masukan.jsonl'
+    path.write_text('\n'.join(lines) + '\n')
+    assert isoline.main([str(path), '--chunk-size', str(chunk_size)]) == 0
+    results = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert len(results) == len(lines)
+    assert [r['status'] for r in results] == ['error', 'optimal', 'error', 'error', 'error', 'error',
+                                              'optimal', 'error', 'optimal', 'optimal']
+    assert [r.get('id') for r in results] == [None, 1, None, None, None, 5, 6, 7, 8, 9]
+    assert results[1]['z'] == results[9]['z'] == pytest.approx(25000)
+    assert all('error' in r for r in results if r['status'] == 'error')
+
+
+def test_main_csv_one_record_per_row(tmp_path, capsys):
+    import csv
+    import io
+
+    rows = ['1,min,1,2,4,3,1,6,1,1,10,10', '2,min,x,2,4,3,1,6,1,1,10,10', '',
+            '3,min,1,2', '4,mixed,1,1,1,1,1,5,1,1,10,10', '5,,1,2,4,3,1,6,1,1,10,10']
+    path = tmp_path / 'masukan.csv'
+    path.write_text('id,kind,a,b,c,d,e,f,g,h,x_max,y_max\n' + '\n'.join(rows) + '\n')
+    assert isoline.main([str(path), '--kind', 'min', '--chunk-size', '4', '--output-format', 'csv']) == 0
+    results = list(csv.DictReader(io.StringIO(capsys.readouterr().out)))
+    assert len(results) == len(rows)
+    assert [r['id'] for r in results] == ['1', '2', '', '3', '4', '5']
+    assert [r['status'] for r in results] == ['optimal', 'error', 'error', 'error', 'infeasible', 'optimal']
+    assert float(results[0]['z']) == float(results[5]['z']) == pytest.approx(2.8)
+
+
+# solve_columns: sumber berkas per blok sama dengan solve_batch sekaligus
+
+def _columns(kind, n, seed):
+    fields = (('a1', 'b1', 'c1', 'a2', 'b2', 'c2') if kind == 'max' else ('a', 'b', 'c', 'd', 'e', 'f')) \
+        + ('g', 'h', 'x_max', 'y_max')
+    return dict(zip(fields, _random_batch(n, seed)))
+
+
+@pytest.mark.parametrize('kind', ['max', 'min', 'mixed'])
+def test_solve_columns_npz_matches_solve_batch(tmp_path, kind):
+    columns = _columns(kind, 1000, 16)
+    expected = isoline.solve_batch(*columns.values(), kind=kind)
+    np.savez(tmp_path / 'koef.npz', **columns)
+    _assert_results_equal(isoline.solve_columns(tmp_path / 'koef.npz', kind=kind, block_size=300), expected)
+
+    # Hasil ke berkas .npy (memmap) lalu dibaca ulang
+    isoline.solve_columns(str(tmp_path / 'koef.npz'), tmp_path / 'hasil.npy', kind=kind, block_size=128)
+    _assert_results_equal(np.load(tmp_path / 'hasil.npy'), expected)
+
+    # Direktori .npy dengan x_max/y_max skalar sebagai pengganti kolom
+    (tmp_path / 'kolom').mkdir()
+    for name, col in columns.items():
+        if name not in ('x_max', 'y_max'):
+            np.save(tmp_path / 'kolom' / f'{name}.npy', col)
+    out = np.empty(1000, dtype=isoline.RESULT_DTYPE)
+    got = isoline.solve_columns(tmp_path / 'kolom', out, kind=kind, x_max=50, y_max=30, block_size=999)
+    assert got is out
+    _assert_results_equal(out, isoline.solve_batch(*list(columns.values())[:8], 50, 30, kind=kind))
+
+
+def test_solve_columns_parquet_matches_solve_batch(tmp_path):
+    pa = pytest.importorskip('pyarrow')
+    pq = pytest.importorskip('pyarrow.parquet')
+    columns = _columns('max', 1000, 17)
+    pq.write_table(pa.table(columns), tmp_path / 'koef.parquet', row_group_size=256)
+    _assert_results_equal(isoline.solve_columns(str(tmp_path / 'koef.parquet'), block_size=100),
+                          isoline.solve_batch(*columns.values()))
+
+
+def test_solve_columns_rejects_bad_input(tmp_path):
+    columns = _columns('max', 10, 18)
+    np.savez_compressed(tmp_path / 'padat.npz', **columns)
+    with pytest.raises(ValueError, match='dikompresi'):
+        isoline.solve_columns(tmp_path / 'padat.npz')
+    with pytest.raises(ValueError, match='x_max'):
+        isoline.solve_columns({k: v for k, v in columns.items() if k != 'x_max'})
+    with pytest.raises(ValueError):
+        isoline.solve_columns(dict(columns, a1=columns['a1'][:5]))
+    with pytest.raises(ValueError):
+        isoline.solve_columns(columns, np.empty(9, dtype=isoline.RESULT_DTYPE))
+    with pytest.raises(ValueError):
+        isoline.solve_columns(str(tmp_path / 'koef.csv'))
+    with pytest.raises(ValueError):
+        isoline.solve_columns(columns, kind='maks')
+
+
+# scenario_analysis: Monte Carlo dengan seed tetap
+
+def test_scenario_analysis_without_uncertainty_equals_deterministic_solve():
+    res = isoline.solve_max(**_RECORD)
+    scenarios = isoline.scenario_analysis('max', samples=500, seed=1, **_RECORD)
+    assert scenarios['n'] == 500 and scenarios['feasible'] == 1.0
+    assert scenarios['samples'] == {}
+    assert scenarios['nominal'] == {name: float(value) for name, value in _RECORD.items()}
+    assert scenarios['z_mean'] == pytest.approx(res.z) and scenarios['z_std'] == pytest.approx(0, abs=1e-9)
+    assert scenarios['z_band'] == pytest.approx((res.z, res.z))
+    assert scenarios['z_mean_ci'] == pytest.approx((res.z, res.z))
+    assert scenarios['x_band'] == pytest.approx((res.x, res.x))
+    assert scenarios['y_band'] == pytest.approx((res.y, res.y))
+    assert scenarios['vertex_share'] == {'Perpotongan batasan': 1.0}
+
+    infeasible = isoline.scenario_analysis('mixed', samples=100, seed=1, a=1, b=1, c=1, d=1, e=1, f=5,
+                                           g=1, h=1, x_max=10, y_max=10)
+    assert infeasible['feasible'] == 0.0 and math.isnan(infeasible['z_mean'])
+    assert infeasible['vertex_share'] == {}
+
+
+def test_scenario_analysis_small_perturbation():
+    # 2x + y ≤ c1 dengan c1 ~ N(300, 3): optimum tetap di perpotongan batasan dan
+    # Z = (200*c1 + 15000)/3, jadi rata-rata 25000 dan simpangan baku 200
+    spec = dict(_RECORD, c1=lambda rng, size: rng.normal(300, 3, size))
+    scenarios = isoline.scenario_analysis('max', samples=20_000, level=0.9, seed=7, **spec)
+    assert scenarios['feasible'] == 1.0
+    assert list(scenarios['samples']) == ['c1'] and len(scenarios['samples']['c1']) == 20_000
+    assert scenarios['nominal']['c1'] == pytest.approx(300, abs=0.2)
+    assert scenarios['z_mean'] == pytest.approx(25000, abs=15)
+    assert scenarios['z_std'] == pytest.approx(200, rel=0.05)
+    lo, hi = scenarios['z_mean_ci']
+    assert lo < scenarios['z_mean'] < hi and hi - lo == pytest.approx(2*1.645*200/20_000**0.5, rel=0.1)
+    lo, hi = scenarios['z_band']
+    assert lo == pytest.approx(25000 - 1.645*200, rel=0.005) and hi == pytest.approx(25000 + 1.645*200, rel=0.005)
+    assert scenarios['z_quantiles'][0.5] == pytest.approx(25000, abs=15)
+    assert scenarios['vertex_share'] == {'Perpotongan batasan': 1.0}
+    # Z setiap skenario sama dengan solve_batch pada sampel yang sama
+    z = (200*scenarios['samples']['c1'] + 15000)/3
+    np.testing.assert_allclose(scenarios['results']['z'], z, rtol=1e-12)
+
+    again = isoline.scenario_analysis('max', samples=20_000, level=0.9, seed=7, **spec)
+    _assert_results_equal(again['results'], scenarios['results'])
+
+
+def test_scenario_analysis_vertex_share_and_bad_input():
+    # Setengah skenario membuat batasan 2 tidak aktif: optimum pindah ke sumbu-X
+    g = np.repeat([150.0, 1000.0], 500)
+    scenarios = isoline.scenario_analysis('max', seed=3, **dict(_RECORD, g=g))
+    assert scenarios['n'] == 1000
+    assert scenarios['vertex_share'] == {'Perpotongan sumbu-X': 0.5, 'Perpotongan batasan': 0.5}
+    with pytest.raises(ValueError):
+        isoline.scenario_analysis('maks', **_RECORD)
+    with pytest.raises(ValueError):
+        isoline.scenario_analysis('max', level=1, **_RECORD)
+    with pytest.raises(TypeError):
+        isoline.scenario_analysis('min', **_RECORD)
+    with pytest.raises(ValueError):
+        isoline.scenario_analysis('max', **dict(_RECORD, g=np.ones(3), h=np.ones(4)))
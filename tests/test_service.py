@@ -0,0 +1,77 @@
+import asyncio
+import json
+
+import pytest
+
+import service
+
+_PROBLEM = {'kind': 'max', 'a1': 2, 'b1': 1, 'c1': 300, 'a2': 1, 'b2': 2, 'c2': 300,
+            'g': 150, 'h': 100, 'x_max': 300, 'y_max': 300}
+
+
+@pytest.fixture
+def svc():
+    s = service.Service(workers=1, window=0.001)
+    yield s
+    s.close()
+
+
+def _dispatch(svc, method, path, body):
+    if not isinstance(body, bytes):
+        body = json.dumps(body).encode()
+    return asyncio.run(svc._dispatch(method, path, body))
+
+
+def test_dispatch_solve_single_and_list(svc):
+    status, payload, content_type = _dispatch(svc, 'POST', '/solve', _PROBLEM)
+    assert (status, content_type) == (200, None)
+    assert payload['status'] == 'optimal'
+    assert (payload['x'], payload['y'], payload['z']) == pytest.approx((100, 100, 25000))
+    status, payload, _ = _dispatch(svc, 'POST', '/solve', [_PROBLEM, {'kind': 'max'}])
+    assert status == 200
+    assert [r['status'] for r in payload] == ['optimal', 'error']
+
+
+@pytest.mark.parametrize('method, path, body, status', [
+    ('POST', '/nope', {}, 404),
+    ('GET', '/solve', {}, 405),
+    ('GET', '/render', {}, 405),
+    ('POST', '/solve', b'{bukan json', 400),
+    ('POST', '/solve', 42, 400),
+    ('POST', '/render', [], 400),
+    ('POST', '/render', dict(_PROBLEM, kind='maks'), 400),
+    ('POST', '/render', dict(_PROBLEM, format='gif'), 400),
+    ('POST', '/render', dict(_PROBLEM, dpi=-1), 400),
+    ('POST', '/render', dict(_PROBLEM, dpi=0), 400),
+    ('POST', '/render', dict(_PROBLEM, dpi=10**6), 400),
+    ('POST', '/render', dict(_PROBLEM, dpi='100'), 400),
+    ('POST', '/render', dict(_PROBLEM, dpi=True), 400),
+])
+def test_dispatch_rejects_bad_requests(svc, method, path, body, status):
+    got, payload, content_type = _dispatch(svc, method, path, body)
+    assert got == status
+    assert content_type is None and 'error' in payload
+
+
+def test_dispatch_render(svc):
+    pytest.importorskip('matplotlib')
+    status, image, content_type = _dispatch(svc, 'POST', '/render', dict(_PROBLEM, dpi=20))
+    assert (status, content_type) == (200, 'image/png')
+    assert image.startswith(b'\x89PNG')
+    # Argumen yang tidak dikenal fungsi plot adalah kesalahan klien, bukan 500
+    status, payload, _ = _dispatch(svc, 'POST', '/render', dict(_PROBLEM, warna='merah'))
+    assert status == 400 and 'error' in payload
+    infeasible = {'kind': 'mixed', 'a': 1, 'b': 1, 'c': 1, 'd': 1, 'e': 1, 'f': 5,
+                  'g': 1, 'h': 1, 'x_max': 10, 'y_max': 10}
+    assert _dispatch(svc, 'POST', '/render', infeasible)[:2] == (422, {'status': 'infeasible'})
+
+
+def test_dispatch_full_queues_return_503(svc):
+    svc.coalescer.max_pending = 1
+    status, payload, _ = _dispatch(svc, 'POST', '/solve', [_PROBLEM, _PROBLEM])
+    assert status == 503 and 'error' in payload
+    svc.renders = svc.max_renders
+    status, payload, _ = _dispatch(svc, 'POST', '/render', _PROBLEM)
+    assert status == 503 and 'error' in payload
+    status, payload, _ = _dispatch(svc, 'GET', '/health', b'')
+    assert status == 200 and payload['pending_renders'] == svc.max_renders